@@ -2,58 +2,48 @@
 
 # pylint: disable=E1101,W0621
 
-import os, logging, threading
-from importlib import resources
+import logging, threading, weakref
 
-from random import shuffle
-from itertools import zip_longest
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from math import inf
 
-from time import time, sleep
+from array import array
+
+from time import time, sleep, perf_counter
 
 
 from ctypes import (
     POINTER, 
     py_object,
     
-    pointer, string_at, c_char_p,
-    c_ubyte, c_uint16,
+    pointer, string_at, c_char_p, c_wchar_p, c_void_p, cast, CFUNCTYPE,
+    c_ubyte, c_uint16, c_uint32, sizeof, addressof,
 
-    _CFuncPtr,
+    _CFuncPtr, _SimpleCData,
 )
 
-from .toxcore import tox, to_ct, to_py
-
-
-BOOTSTRAP_NODES = [  # https://nodes.tox.chat/
-                     # (IPv4:Port, Public Key),
-]
-
+from .toxcore import tox, to_ct, to_py, py_converter, events_decode, addressed, EVENT_FIELDS, PUBLIC_KEY_SIZE
+from .reactor import Reactor, ReactorPool
+from .stats import IterStats, TimedLock
+from .guard import CloseGuard
+from .ring import EventRing
+from .errors import ToxError, error_table, err_type
+from .ordered import OrderedExecutor
+from .bootstrap import BootstrapRegistry, BootstrapNode
 
-BOOTSTRAP_FILE = 'bootstrap.txt'; BOOTSTRAP_FIELDS = 5
 
+BOOTSTRAP_REGISTRY = BootstrapRegistry();  # Ноды bootstrap.txt на весь процесс (читается при первом connect())
 
-if not os.path.exists(BOOTSTRAP_FILE):  # Или в текущей директории (после python -m toxdoor bootstrap) или в пакете
-    BOOTSTRAP_FILE = os.path.join(str(resources.files(__package__)), BOOTSTRAP_FILE)
 
-if os.path.exists(BOOTSTRAP_FILE):
-    with open(BOOTSTRAP_FILE, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = (line or '').strip()
-            if line and not line.startswith('#'):
-                parts = line.split('\t')
-                if len(parts) < BOOTSTRAP_FIELDS: parts = parts + [''] * (BOOTSTRAP_FIELDS - len(parts))
+_AUTO = object();  # Ячейка ошибки Tox_Err_* не передана - проверяет обертка (см. Tox._native())
 
-                (ipv4,
-                 ipv6,
-                 port,
-                 pubkey,
-                 maintainer) = parts[0: BOOTSTRAP_FIELDS]                
 
-                if ipv4 and port and pubkey:
-                    if not ipv4.startswith('NONE'):
-                        bootstrap = (ipv4 + ":" + port, pubkey)
-                        if bootstrap not in BOOTSTRAP_NODES:
-                            BOOTSTRAP_NODES.append(bootstrap)        
+def _fail(name, errors, value):
+    cls, text, err_name = errors.get(value, (ToxError, str(value), None))
+    raise cls(f"{name}: {text}", value, err_name)
 
 
 class MetaTox(type):
@@ -70,9 +60,61 @@ class Tox(metaclass=MetaTox):
     """
 
     BOOTSTRAP_TIMEOUT = 12.0;  # бутстрапинг длится до 10s (https://github.com/irungentoo/Tox_Client_Guidelines/blob/master/Required/Bootstrapping.md)
+    BOOTSTRAP_COUNT = 4;       # Нод на один connect()
+
+    # Слова в именах нативных функций, которые ставят исходящую работу в очередь ядра
+    # (в режиме iter_deadline после таких вызовов поток итераций будится досрочно)
+    WAKEUP_WORDS = frozenset(('send', 'add', 'bootstrap', 'relay', 'control', 'seek', 'invite', 'join', 'leave', 'reconnect', 'set', 'delete'))
+
+    # Колбэки потоковых данных (передача файлов, пакеты): пока они идут, режим iter_adaptive итерирует без пауз
+    BUSY_CALLBACKS = frozenset(('file_chunk_request', 'file_recv_chunk', 'friend_lossless_packet', 'friend_lossy_packet',
+                                'group_custom_packet', 'group_custom_private_packet'))
+
+    # Слова в именах нативных функций только читающих состояние или отправляющих данные. При experimental_thread_safety=True
+    # такие вызовы идут мимо tlock (ядро само сериализует их своим мьютексом, а ctypes на время вызова отпускает GIL),
+    # но через tguard: close() ждет их выхода перед tox_kill()
+    UNLOCKED_WORDS = frozenset(('get', 'send', 'by', 'exists', 'is'))
+
+    ADAPTIVE_IDLE = 5.0;  # s без событий после которых режим iter_adaptive начинает удваивать паузу между итерациями
+    ORDER_FIELDS = ('friend_number', 'conference_number', 'group_number');  # Ключи очередности событий в режиме iter_executor
+
+    # Буфер потока для fetch(): по самому длинному из лимитов tox_max_*/tox_group_max_* (имена, статусы, топики, сообщения)
+    FETCH_SIZE = max(getattr(tox, n)() for n in dir(tox) if n.startswith(('tox_max_', 'tox_group_max_')) and n.endswith(('_length', '_size')))
+
+    _callbacks = {};                       # Колбэки класса: name -> имя метода (см. __init_subclass__)
+    _thunks = {};                          # name -> нативный колбэк общий для всех инстансов
+    _natives = {};                         # name -> сгенерированная обертка нативной функции (см. _native())
+    _fetchers = {};                        # name -> составной геттер (см. fetch())
+    _fetch_local = threading.local();      # Буферы и ячейка ошибки fetch() на поток
+    _toxes = weakref.WeakValueDictionary();  # Адрес struct Tox -> инстанс (маршрутизация в общих колбэках)
+
+
+    def __init_subclass__(cls, **kwargs):
+        """
+            Колбэки в наследниках ищутся один раз на класс.
+            Либо должны оканчиваться на `_cb` как в toxcore либо начинаться на `on_` но не одновременно
+            Остальная часть имени также как в toxcore (можно без префикса tox_)
+        """
+        super().__init_subclass__(**kwargs)
+
+        cls._callbacks = {}
+
+        for attr in dir(cls):  # XXX cls.__dict__ дает методы только самого класса, без предков
+            if attr.startswith('__') or not callable(getattr(cls, attr, None)):
+                continue
+
+            name = attr[4:] if attr.startswith('tox_') else attr
+
+            if name.endswith('_cb'):
+                cls._callbacks[name[:-3]] = attr
+            elif name.startswith('on_'):
+                cls._callbacks[name[3:]] = attr
 
     
-    def __init__(self, iter_priority: "sleep time, s" = 0.005, **opts):
+    def __init__(self, iter_priority: "sleep time, s" = 0.005, iter_deadline: "wake on demand" = False, reactor: "Reactor | ReactorPool" = None,
+                 iter_queue: "calls -> futures" = False, iter_adaptive: "max idle delay, s" = None,
+                 iter_stats: "histograms" = False, iter_batch: "ring size" = 0,
+                 iter_events: "batches kept" = False, iter_executor: "concurrent.futures.Executor" = None, **opts):
         """
             struct Tox_Options {
                 bool ipv6_enabled;
@@ -91,7 +133,7 @@ class Tox(metaclass=MetaTox):
                 size_t savedata_length;
                 tox_log_cb *log_callback;
                 void *log_user_data;
-                bool experimental_thread_safety;
+                bool experimental_thread_safety;  // Вызовы из UNLOCKED_WORDS без tlock
                 bool experimental_groups_persistence;
             };
 
@@ -101,9 +143,43 @@ class Tox(metaclass=MetaTox):
 
 
             iter_priority чтобы не загружать процессор. Должно быть существенно меньше 0.05s
+
+            iter_deadline - планировщик по дедлайнам tox_iteration_interval(): поток итераций спит на условной переменной
+                (не удерживая tlock) до следующего дедлайна или до self.wakeup(). Обертки функций отправки будят его сами.
+                iter_priority в этом режиме не используется
+
+            reactor - общий Reactor/ReactorPool вместо собственного потока итераций (итерации также по дедлайнам)
+
+            iter_queue - нативные вызовы из сторонних потоков не ждут tlock, а встают в очередь и возвращают concurrent.futures.Future.
+                Очередь выполняется пачкой в потоке итераций перед tox_iterate(). Вызовы из колбэков (поток итераций) - как обычно.
+                Поток итераций в этом режиме работает по дедлайнам как в iter_deadline
+
+            iter_adaptive - адаптивная частота итераций (по дедлайнам как в iter_deadline): пока идут BUSY_CALLBACKS, очередь вызовов
+                или отправки - итерации подряд без пауз, после ADAPTIVE_IDLE без событий пауза удваивается от iteration_interval()
+                до iter_adaptive, s. Текущая частота: self.iter_rate() и перекрываемый хук self.iter_rate_hook(rate)
+
+            iter_stats - гистограммы цикла итераций (длительность tox_iterate(), опоздание относительно дедлайна, ожидание tlock
+                нативными вызовами, время обработчиков колбэков по именам). Снимок без остановки итераций: self.stats()
+
+            iter_batch - пакетная раздача событий: нативные колбэки во время tox_iterate() только складывают события в EventRing
+                (начальной емкостью iter_batch), обработчики вызываются пачкой после итерации вне tlock и не тормозят ядро.
+                Данные по указателям копируются в bytes, возвращаемое обработчиком значение в ядро не передается
+
+            iter_events - итерации через tox_events_iterate(): все события итерации приходят одной структурой и разбираются
+                без нативных колбэков (и без переходов C -> python на каждое событие). События с обработчиками раздаются
+                как в iter_batch, остальные копятся пачками по итерациям для self.events() (True - все, число - последние N пачек).
+                Нативные колбэки tox_callback_<name> в этом режиме назначать нельзя - их занимает tox_events_init()
+
+            iter_executor - обработчики вызываются в пуле потоков (ThreadPoolExecutor), а не в потоке итераций. ProcessPoolExecutor
+                не подходит (TypeError): обработчики - методы инстанса Tox, а он через pickle в другой процесс не передается.
+                Поток итераций только разбирает события (как в iter_batch) и ставит их в пул. Порядок держится по ключу
+                Tox.order_key(): события одного друга (конференции, группы) - строго по очереди, разных - параллельно.
+                Пулом владеет вызывающий (close() его не останавливает). Время обработчиков в iter_stats в этом режиме не пишется
             
         """
 
+        if isinstance(iter_executor, ProcessPoolExecutor):
+            raise TypeError(f"{type(self).__name__}: iter_executor: ProcessPoolExecutor can't run handlers (bound methods of Tox are not picklable)")
     
         self._toxptr: "struct Tox *" = None
 
@@ -177,82 +253,316 @@ class Tox(metaclass=MetaTox):
         # Tox *tox_new(const Tox_Options *options, Tox_Err_New *error);
         self._toxptr = Tox.new(pointer(self.opts), pointer(error := Tox.Err_New()))
         if error.value != Tox.ERR_NEW_OK:
-            raise RuntimeError(f"{type(self).__name__}: {string_at(Tox.err_new_to_string(error)).decode(errors='backslashreplace')}")
+            cls, text, err_name = error_table('Tox_Err_New')[error.value]
+            raise cls(f"{type(self).__name__}: {text}", error.value, err_name)
 
 
         self.tlock = threading.RLock()
+        self.tguard = CloseGuard(type(self).__name__);  # Вызовы мимо tlock (experimental_thread_safety) - close() ждет их выхода
+        self.tcond = threading.Condition(threading.Lock());  # Ожидание дедлайна итерации (не на tlock, чтобы будить не дожидаясь итерации)
 
-        # Инициализируем колбэки если они определены в наследниках
-        # Либо должны оканчиваться на `_cb` как в toxcore либо начинаться на `on_` но не одновременно
-        # Остальная часть имени также как в toxcore (можно без префикса tox_)
-        
-        # for name, method in type(self).__dict__.items():  # XXX на инстанце наследника type(self).__dict__ дает методы только в наследнике
-        for name in dir(type(self)):
-            if name.startswith('__'): continue
-            method = getattr(self, name)
-            if callable(method):
-                if name.startswith('tox_'):
-                    name = name[4:]
-                    
-                if name.endswith('_cb'):
-                    
-                    tox_cb_t = getattr(tox, name);  # ctypes.CFUNCTYPE(...)
-                    tox_set_cb = getattr(tox, 'callback_' + name[:-3])
-                    
-                elif name.startswith('on_'):
+        self._stats = IterStats() if iter_stats else None;  # До назначения колбэков
 
-                    tox_cb_t = getattr(tox, name[3:] + '_cb');  # ctypes.CFUNCTYPE(...)
-                    tox_set_cb = getattr(tox, 'callback_' + name[3:])
-                    
-                else:
-                    continue
-
-                # Назначаем колбэки, помня про замыкания (мы в цикле)
-                # Удерживаем ссыль на колбек в self.__<name>, внутри колбека вызывается python-метод инстанца self
+        self._handlers = {};  # name -> (handler, гистограмма iter_stats)
+        self._subs = {};      # name -> ((handler, ((позиция поля, значение), ...)), ...) подписчиков шины событий
 
-                # name схвачено в замыкании. getattr(self, ...) не явно биндит метот к self
-                # typedef void tox_<name>_cb(Tox *tox, ...);
+        self._bootstrap_pending = {};  # Ключ ноды -> (BootstrapNode, perf_counter() bootstrap) - ждут соединения (см. connect())
+        self._bootstrap_sub = None
+        self._ring = EventRing(iter_batch) if iter_batch or iter_events or iter_executor else None;  # События итерации в режиме iter_batch
+        self._executor = OrderedExecutor(iter_executor) if iter_executor is not None else None
 
-                restype = getattr(tox_cb_t, '_restype_', None); argtypes = getattr(tox_cb_t, '_argtypes_', tuple())
-
-                def _cb_call(_tp, *args, name=name, restype=restype, argtypes=argtypes):  # Замыкание по name, restype, argtypes
-                    with self.tlock:
-                        # Колбеки всегда имеют первый параметр указывающий на _toxptr (_tp)
-                        py_args = [ to_py(ctobj, ct) for ctobj, ct in zip_longest(args, argtypes[1:]) ]
-                        ret = getattr(self, name)(*py_args)
-                        return to_ct(ret, restype)
-                
-                cb = tox_cb_t( _cb_call )
+        self._batches = None;  # Пачки событий без обработчиков в режиме iter_events
+        if iter_events:
+            self._batches = deque(maxlen=None if iter_events is True else iter_events)
+            Tox.events_init(self._toxptr)
+        self._toxaddr = cast(self._toxptr, c_void_p).value
+        Tox._toxes[self._toxaddr] = self
 
-                # XXX коллбек устанавливаемый здесь может быть только один
-                setattr(self, '__' + name, cb);  tox_set_cb(self._toxptr, cb);  # Удерживаем ссыль на колбек и назначаем его
+        # Инициализируем колбэки если они определены в наследниках (найдены при создании класса) - первые подписчики шины
+        for cb_name, attr in type(self)._callbacks.items():
+            self.subscribe(cb_name, getattr(self, attr))
 
         self._getattr_cache = {};  # Кеш оберток self.__getattr__()
 
 
         self._iter_time = None
+        self._iter_next = None;  # Дедлайн следующей итерации (time())
+        self._iter_wake = False
+        self._iter_errors = 0;    # Ошибок итерации подряд (выдержка в Reactor)
+        self._iter_ident = None;  # Поток выполняющий итерацию (режим iter_queue)
+        self._iter_queue = iter_queue
+        self._calls = deque();    # Очередь вызовов [(call, args, future)] в режиме iter_queue
         self._iter_thread = None
         self._iter_priority = iter_priority
+        self._iter_adaptive = iter_adaptive
+        self._iter_delay = None;   # Текущая пауза до следующей итерации, s
+        self._iter_events = 0;     # Колбэки за итерацию
+        self._iter_busy = False
+        self._iter_active = time();  # Момент последней активности
+        self._iter_deadline = iter_deadline
+
+        self._reactor = None;  # Реактор-владелец (при итерациях в общем Reactor/ReactorPool)
         
-        self.start_iterate()
+        self.start_iterate(reactor)
         
 
-    def start_iterate(self):
-        if self._iter_thread is None:
-            self._iter_thread = threading.Thread(target=self._iter_run, daemon=True)
-            self._iter_thread.start()
+    def start_iterate(self, reactor=None):
+        """
+            Итерации в собственном потоке или в общем реакторе. Переключение между ними: stop_iterate() и снова start_iterate()
+        """
+        if self._iter_thread is None and self._reactor is None:
+            if reactor is not None:
+                reactor.register(self)
+            else:
+                self._iter_thread = threading.Thread(target=self._iter_run, daemon=True)
+                self._iter_thread.start()
         
     def stop_iterate(self):
+        while (reactor := self._reactor) is not None:  # Владелец может смениться (воровство работы в ReactorPool)
+            reactor.unregister(self)
+            
         if self._iter_thread is not None:
             self._iter_thread = None;  # Атомарная
+            self.wakeup()
+
+    def wakeup(self):
+        """
+            Досрочная итерация: будит поток итераций ожидающий дедлайна (режим iter_deadline)
+        """
+        with self.tcond:
+            self._iter_wake = True; self._iter_busy = True
+            self.tcond.notify()
+
+            if (reactor := self._reactor) is not None:
+                reactor.wakeup(self)
+
+
+    def __del__(self):
+        if '_toxptr' in self.__dict__:  # Не отвергнут проверкой параметров в начале __init__()
+            self.close()
+
+
+    def _set_callback(self, name, handler):
+        """
+            Назначение нативного колбэка tox_callback_<name> на python-вызов handler(*args, user_data)
+            (name как в toxcore без префикса tox_ и суффикса _cb)
+        """
+        if handler is None:
+            self._handlers.pop(name, None)
+        else:
+            self._handlers[name] = (handler, self._stats.callback(name) if self._stats is not None else None)
+
+        if self._batches is None and self._toxptr is not None:  # В режиме iter_events колбэки ядра заняты tox_events_init()
+            getattr(tox, 'callback_' + name)(self._toxptr, Tox._thunk(name) if handler is not None else getattr(tox, name + '_cb')());  # NULL
 
+    def subscribe(self, name, handler, **filters):
+        """
+            Подписка handler(*args, user_data) на события колбэка tox_callback_<name>, подписчиков у события сколько угодно.
+            filters - равенства полей события (имена полей как в EVENT_FIELDS):
+
+                tox.subscribe('friend_message', handler, friend_number=0)
+
+            Нативный колбэк назначается с первым подписчиком и снимается с последним: на события без подписчиков
+            переходов C -> python нет. Единственный подписчик без фильтров назначается без раздачи шиной (только обертка
+            с тем же try/except). Исключения подписчика логируются и не мешают остальным. Возвращает handler (для unsubscribe())
+        """
+        if not hasattr(tox, 'callback_' + name):  # До изменения _subs - опечатка не оставит мертвую запись
+            raise ValueError(f"{type(self).__name__}: no callback '{name}'")
 
-    def __del__(self): self.close()
+        fields = EVENT_FIELDS.get(name, ())
+
+        for field in filters:
+            if field not in fields:
+                raise ValueError(f"{type(self).__name__}: {name}: no field '{field}'")
+
+        match = tuple((fields.index(field), value) for field, value in filters.items())
+
+        with self.tlock:
+            self._subs[name] = self._subs.get(name, ()) + ((handler, match),)
+            self._bus_update(name)
+
+        return handler
+
+    def unsubscribe(self, name, handler):
+        """
+            Снятие подписки handler (всех его фильтров) с событий name. Нативный колбэк снимается с последним подписчиком
+        """
+        with self.tlock:
+            self._subs[name] = tuple(sub for sub in self._subs.get(name, ()) if sub[0] != handler)
+            self._bus_update(name)
+
+    def _bus_update(self, name):
+        """
+            XXX Под tlock. Подписчики меняются копированием кортежа - раздача идущая в другом потоке видит целый снимок
+        """
+        if not (subs := self._subs[name]):
+            del self._subs[name]
+            self._set_callback(name, None)
+        elif len(subs) == 1 and not subs[0][1]:
+            self._set_callback(name, self._guarded(name, subs[0][0]))
+        elif not getattr(self._handlers.get(name, (None,))[0], 'tox_bus', False):
+            self._set_callback(name, self._bus(name))
+
+    def _guarded(self, name, handler):
+        def guarded(*args):
+            try:
+                handler(*args)
+            except Exception as e:
+                logging.error(f"{type(self).__name__}: {name}: {e}")
+
+        return guarded
+
+    def _bus(self, name):
+        subs = self._subs
+
+        def dispatch(*args):
+            for handler, match in subs.get(name, ()):
+                if all(args[i] == value for i, value in match):
+                    try:
+                        handler(*args)
+                    except Exception as e:
+                        logging.error(f"{type(self).__name__}: {name}: {e}")
+
+        dispatch.tox_bus = True
+
+        return dispatch
+
+    @staticmethod
+    def _thunk(name):
+        """
+            Общий для всех инстансов нативный колбэк tox_<name>_cb. Инстанс находится по адресу struct Tox
+            в Tox._toxes, обработчик - в его self._handlers
+        """
+        if (thunk := Tox._thunks.get(name)) is not None:
+            return thunk
+
+        tox_cb_t = getattr(tox, name + '_cb');  # ctypes.CFUNCTYPE(...)
+
+        # typedef void tox_<name>_cb(Tox *tox, ...);
+
+        restype = getattr(tox_cb_t, '_restype_', None); argtypes = getattr(tox_cb_t, '_argtypes_', tuple())
+
+        convert = py_converter(argtypes[1:]);  # memoryview ровно на данные (живут пока идет колбэк)
+        copy = py_converter(argtypes[1:], copy=True);  # bytes для раздачи после итерации
+
+        busy = name in Tox.BUSY_CALLBACKS; toxes = Tox._toxes
+
+        def _cb_call(_tp, *args):  # Замыкание по name, restype, convert, copy
+            if (self := toxes.get(_tp)) is None:
+                return to_ct(None, restype)
+
+            if (ring := self._ring) is not None:  # Уже под tlock (внутри tox_iterate())
+                self._iter_events += 1
+                if busy: self._iter_busy = True
+
+                ring.push((name, copy(*args)))
+                return to_ct(None, restype)
+
+            with self.tlock:
+                self._iter_events += 1
+                if busy: self._iter_busy = True
+
+                if (entry := self._handlers.get(name)) is None:
+                    return to_ct(None, restype)
+                handler, hist = entry
+
+                py_args = convert(*args)
+
+                if hist is None:
+                    ret = handler(*py_args)
+                else:
+                    t0 = perf_counter(); ret = handler(*py_args)
+                    hist.record_s(perf_counter() - t0)
+
+                return to_ct(ret, restype)
+
+        # Первый параметр (Tox *) принимаем как c_void_p - ctypes отдает его сразу адресом (int) без объекта-указателя.
+        # cast() к типу из биндингов, который ждет tox_callback_<name>, удерживает исходный переходник
+        thunk = cast(CFUNCTYPE(restype, c_void_p, *argtypes[1:])(_cb_call), tox_cb_t)
+        return Tox._thunks.setdefault(name, thunk);  # XXX При гонке остается первый (он уже мог быть назначен)
     
 
+    @staticmethod
+    def _native(name):
+        """
+            Общая для всех инстансов обертка нативной функции tox_<name>: native(self, lock, *args) -> результат.
+            Генерируется один раз на функцию под ее сигнатуру: скаляры ctypes преобразует сам по argtypes и они проходят
+            как есть, user_data - в указатель на py_object, остальные указатели и структуры - через to_ct().
+            Результат-скаляр возвращается как есть, указатели - через to_py(). Недостающие аргументы - None (NULL).
+            После close() (struct Tox освобождена) - RuntimeError под той же блокировкой, до нативного вызова
+
+            Последний параметр Tox_Err_* (по __doc__ биндингов) если его не передали: вызов идет с ячейкой ошибки,
+            заранее выделенной на поток, и при ошибке поднимается исключение из errors.error_table() (ToxError).
+            None - как раньше NULL без проверки, переданная ячейка Tox.Err_*() - заполняется без исключения
+
+            Атрибуты: static_call - без Tox * первым параметром, wakeup - функция отправки (см. WAKEUP_WORDS)
+        """
+        if (native := Tox._natives.get(name)) is not None:
+            return native
+
+        fn = getattr(tox, name)
+        restype = getattr(fn, 'restype', None); argtypes = tuple(getattr(fn, 'argtypes', None) or ())
+
+        static_call = not (argtypes and argtypes[0] is POINTER(Tox.struct_Tox))
+        if not static_call:
+            argtypes = argtypes[1:]
+
+        wakeup = not static_call and not Tox.WAKEUP_WORDS.isdisjoint(name.split('_'))
+
+        ns = {'fn': fn, 'to_ct': to_ct, 'to_py': to_py, 'pointer': pointer, 'py_object': py_object, 'restype': restype}
+
+        items = [] if static_call else ["self._toxptr"]
+
+        err = err_type(fn) if argtypes else None
+
+        plain = restype is None or issubclass(restype, _SimpleCData) and restype is not c_void_p
+
+        for i, ct in enumerate(argtypes):
+            a = f"a{i}"
+
+            if err and i == len(argtypes) - 1:                                                # Tox_Err_* *error
+                ns.update(ct_err=ct, AUTO=_AUTO, local=threading.local(), errors=error_table(err), fail=_fail)
+                items.append(a)
+            elif ct is c_void_p:                                                              # void *user_data
+                items.append(f"(None if {a} is None else pointer(py_object({a})))")
+            elif issubclass(ct, _SimpleCData) and ct not in (c_char_p, c_wchar_p):  # Скаляры и перечисления
+                items.append(a)
+            else:
+                ns[f"ct{i}"] = ct
+                items.append(f"to_ct({a}, ct{i})")
+
+        defaults = [ 'None' ] * len(argtypes)
+        if err:
+            defaults[-1] = 'AUTO'; e = f"a{len(argtypes) - 1}"
+
+        lines = [
+            f"def {name}(self, lock, {''.join(f'a{i}={d}, ' for i, d in enumerate(defaults))}):",
+            *([
+                f"    if {e} is AUTO:",
+                "        try:",
+                f"            cell, {e} = local.cell",
+                "        except AttributeError:",
+                f"            cell = ct_err._type_(); {e} = pointer(cell); local.cell = (cell, {e})",
+                "        cell.value = 0",
+                "    else:",
+                f"        cell = None; {e} = to_ct({e}, ct_err)",
+            ] if err else []),
+            "    with lock:",
+            None if static_call else "        if self._toxptr is None: raise RuntimeError(f'{type(self).__name__}: closed')",
+            f"        ret = fn({', '.join(items)})",
+            "        self.wakeup()" if wakeup else None,
+            f"    if cell is not None and cell.value: fail({name!r}, errors, cell.value)" if err else None,
+            "    return ret" if plain else "    return to_py(ret, restype)",
+        ]
+
+        exec("\n".join(line for line in lines if line is not None) + "\n", ns);  # pylint: disable=W0122
+
+        native = ns[name]; native.static_call = static_call; native.wakeup = wakeup
+        return Tox._natives.setdefault(name, native)
+
     def __getattr__(self, name):
 
-        _getattr_cache = self._getattr_cache; _toxptr = self._toxptr
+        _getattr_cache = self._getattr_cache
         
         
         if name in _getattr_cache:
@@ -261,25 +571,33 @@ class Tox(metaclass=MetaTox):
 
         tox_attr = getattr(tox, name)
         if isinstance(tox_attr, _CFuncPtr):
-            restype = getattr(tox_attr, 'restype', None); argtypes = getattr(tox_attr, 'argtypes', [])
+            native = Tox._native(name); static_call = native.static_call; wakeup = native.wakeup
 
-            static_call = True
-            if argtypes and argtypes[0] is POINTER(Tox.struct_Tox):
-                argtypes = argtypes[1:]
-                static_call = False
+            unlocked = not static_call and self.opts.experimental_thread_safety and not self.UNLOCKED_WORDS.isdisjoint(name.split('_'))
+
+            lock = self.tguard if unlocked else self.tlock if self._stats is None else TimedLock(self.tlock, self._stats.lock_wait)
+
+            call = partial(native, self, lock)
+
+            if self._iter_queue and not static_call:
+                calls = self._calls
                 
-            def wrap(*args):
-                with self.tlock:
-                    ct_args = [ to_ct(pyobj, ct) for pyobj, ct in zip_longest(args, argtypes) ];  # Скип POINTER_T(struct_Tox) (это как бы си-шный self)
+                def wrap(*args):
+                    if threading.get_ident() == self._iter_ident:
+                        return call(*args)
 
-                    if static_call:
-                        ret = tox_attr(*ct_args)
-                    else:
-                        ret = tox_attr(_toxptr, *ct_args)
+                    calls.append((call, args, fut := Future()));  # deque.append() атомарная - без блокировок
 
-                    return to_py(ret, restype)
+                    if not self._iterating():                      # Разбирать очередь некому (и после финального в close())
+                        self._drop_calls()
+                    elif not self._iter_wake:                      # Поток итераций еще не разбужен
+                        self.wakeup()
+                    return fut
+            else:
+                wrap = call
 
             wrap.tox_attr = tox_attr
+            wrap.wakeup = wakeup
             wrap.__name__ = name
 
             _getattr_cache[name] = wrap
@@ -291,6 +609,177 @@ class Tox(metaclass=MetaTox):
 
 
 
+    def fetch(self, name, *args, text=False):
+        """
+            Составной геттер "размер, затем данные" (tox_<name>_size() и tox_<name>()) под одним захватом tlock:
+
+                name = tox.fetch('friend_get_name', friend_number, text=True)
+                friends = tox.fetch('self_get_friend_list')
+
+            bytes (text - str, списки uint32 - list). Данные читаются в переиспользуемый буфер потока на FETCH_SIZE байт
+            (больше - разовый буфер), ошибки Tox_Err_* - исключениями как в обертках без ячейки ошибки (см. _native())
+        """
+        data = Tox._fetcher(name)(self, self.tlock if self._stats is None else TimedLock(self.tlock, self._stats.lock_wait), *args)
+        return data.decode(errors='backslashreplace') if text else data
+
+    @staticmethod
+    def _fetcher(name):
+        if (fetcher := Tox._fetchers.get(name)) is not None:
+            return fetcher
+
+        size_fn = getattr(tox, name + '_size'); fn = getattr(tox, name)
+
+        size_errors = error_table(e) if (e := err_type(size_fn)) else None
+        errors = error_table(e) if (e := err_type(fn)) else None
+
+        ct = fn.argtypes[-2 if errors is not None else -1];  # Массив данных (type_t data[])
+        item = sizeof(ct._type_); code = ct._type_._type_
+
+        local = Tox._fetch_local
+
+        def fetch(self, lock, *args):
+            try:
+                buf, views, cell, cell_p = local.pool
+            except AttributeError:
+                buf = bytearray(Tox.FETCH_SIZE); views = {}; cell = c_uint32(); cell_p = pointer(cell)
+                local.pool = (buf, views, cell, cell_p)
+
+            with lock:
+                if (toxptr := self._toxptr) is None:
+                    raise RuntimeError(f"{type(self).__name__}: closed")
+
+                if size_errors is not None:
+                    cell.value = 0; size = size_fn(toxptr, *args, cell_p)
+                    if cell.value: _fail(name + '_size', size_errors, cell.value)
+                else:
+                    size = size_fn(toxptr, *args)
+
+                if size * item > len(buf):
+                    buf = bytearray(size * item); data = cast((c_ubyte * len(buf)).from_buffer(buf), POINTER(ct)).contents
+                elif (data := views.get(ct)) is None:
+                    data = views[ct] = cast((c_ubyte * len(buf)).from_buffer(buf), POINTER(ct)).contents
+
+                if errors is not None:
+                    cell.value = 0; fn(toxptr, *args, data, cell_p)
+                    if cell.value: _fail(name, errors, cell.value)
+                else:
+                    fn(toxptr, *args, data)
+
+                if item == 1:
+                    return bytes(memoryview(buf)[:size])
+                return memoryview(buf)[:size * item].cast(code).tolist()
+
+        return Tox._fetchers.setdefault(name, fetch)
+
+    def friends_table(self, friend_numbers=None, text=False):
+        """
+            Состояние друзей колонками за один захват tlock (для списков на десятки тысяч контактов):
+
+                friend_number                       array('I')
+                public_key                          bytes N * PUBLIC_KEY_SIZE подряд
+                name, status_message                [bytes] (text - [str])
+                status, connection_status           array('B')
+                last_online                         array('Q')
+
+            friend_numbers - по умолчанию все друзья (self_get_friend_list в том же захвате)
+        """
+        with self._table_lock():
+            numbers = array('I', Tox._fetcher('self_get_friend_list')(self, nullcontext()) if friend_numbers is None else friend_numbers)
+
+            return self._columns((), numbers, text, (
+                ('public_key', None, 'friend_get_public_key'),
+                ('name', str, 'friend_get_name'),
+                ('status_message', str, 'friend_get_status_message'),
+                ('status', 'B', 'friend_get_status'),
+                ('connection_status', 'B', 'friend_get_connection_status'),
+                ('last_online', 'Q', 'friend_get_last_online'),
+            ), 'friend_number')
+
+    def conference_peers_table(self, conference_number, offline=False, text=False):
+        """
+            Пиры конференции колонками за один захват tlock: peer_number array('I'), public_key bytes N * PUBLIC_KEY_SIZE,
+            name [bytes] (text - [str]) и is_ours array('B'). offline - отключившиеся пиры: вместо is_ours last_active array('Q')
+        """
+        prefix = 'conference_offline_peer' if offline else 'conference_peer'
+
+        with self._table_lock():
+            count = addressed(prefix + '_count')(self._toxaddr, conference_number, addressof(cell := c_uint32()))
+            if cell.value:
+                _fail(prefix + '_count', error_table(err_type(getattr(tox, prefix + '_count'))), cell.value)
+
+            return self._columns((conference_number,), array('I', range(count)), text, (
+                ('public_key', None, prefix + '_get_public_key'),
+                ('name', str, prefix + '_get_name'),
+                ('last_active', 'Q', prefix + '_get_last_active') if offline else ('is_ours', 'B', prefix + '_number_is_ours'),
+            ), 'peer_number')
+
+    def group_peers_table(self, group_number, peer_ids, text=False):
+        """
+            Пиры группы NGC колонками за один захват tlock: peer_id array('I'), public_key bytes N * PUBLIC_KEY_SIZE,
+            name [bytes] (text - [str]), status, role, connection_status array('B').
+
+            XXX Перечисления пиров группы в toxcore нет - peer_ids собираются по колбэкам group_peer_join/group_peer_exit
+        """
+        with self._table_lock():
+            return self._columns((group_number,), array('I', peer_ids), text, (
+                ('public_key', None, 'group_peer_get_public_key'),
+                ('name', str, 'group_peer_get_name'),
+                ('status', 'B', 'group_peer_get_status'),
+                ('role', 'B', 'group_peer_get_role'),
+                ('connection_status', 'B', 'group_peer_get_connection_status'),
+            ), 'peer_id')
+
+    @contextmanager
+    def _table_lock(self):
+        """
+            tlock и проверка закрытия уже под ним: иначе close() успел бы освободить struct Tox между проверкой и захватом
+        """
+        with self.tlock if self._stats is None else TimedLock(self.tlock, self._stats.lock_wait):
+            if not self._toxptr:
+                raise RuntimeError(f"{type(self).__name__}: closed")
+            yield
+
+    def _columns(self, head, numbers, text, spec, key):
+        """
+            XXX Под tlock. Колонки по номерам numbers: вызовы tox_<name>(tox, *head, number, ..., error) по адресам (см. addressed()),
+            колонка за колонкой. spec - (колонка, тип, name): None - ключи в общий буфер, str - данные size-then-fetch,
+            иначе код array
+        """
+        p = self._toxaddr; n = len(numbers)
+        cell = c_uint32(); e = addressof(cell)
+        buf = (c_ubyte * Tox.FETCH_SIZE)(); b = addressof(buf)
+
+        columns = {key: numbers}
+
+        for column, kind, name in spec:
+            fn = addressed(name); errors = error_table(err_type(getattr(tox, name)))
+
+            if kind is None:                                                   # Ключи подряд в одном буфере
+                data = (c_ubyte * (n * PUBLIC_KEY_SIZE))(); d = addressof(data)
+                for i, number in enumerate(numbers):
+                    fn(p, *head, number, d + i * PUBLIC_KEY_SIZE, e)
+                    if cell.value: _fail(name, errors, cell.value)
+                columns[column] = bytes(data)
+
+            elif kind is str:                                                  # size-then-fetch в буфер
+                size_fn = addressed(name + '_size'); values = []
+                for number in numbers:
+                    size = size_fn(p, *head, number, e)
+                    if size > Tox.FETCH_SIZE: raise ValueError(f"{type(self).__name__}: {name}: {size} > FETCH_SIZE")
+                    fn(p, *head, number, b, e)
+                    if cell.value: _fail(name, errors, cell.value)
+                    values.append(string_at(b, size))
+                columns[column] = [ v.decode(errors='backslashreplace') for v in values ] if text else values
+
+            else:
+                values = array(kind)
+                for number in numbers:
+                    values.append(fn(p, *head, number, e))
+                    if cell.value: _fail(name, errors, cell.value)
+                columns[column] = values
+
+        return columns
+
     def _iterate(self, user_data=None):
         """
             toxcore требует что-бы вызовы iterate() были не чаще чем значение iteration_interval(), ms
@@ -304,31 +793,260 @@ class Tox(metaclass=MetaTox):
         
         with self.tlock:
 
+            self._iter_ident = threading.get_ident()
+
+            if self._calls:
+                self._iter_calls()
+
             if self._toxptr is None:
                 return
             
             if self._iter_time is None:
-                Tox.iterate(self._toxptr, user_data_p)
+                self._tox_iterate(user_data_p)
                 self._iter_time = time();      # Момент последней итерации
                 return
 
-            iteration_interval = Tox.iteration_interval(self._toxptr) / 1000.0;  # s
+            iteration_interval = tox.iteration_interval(self._toxptr) / 1000.0;  # s
                 
             dtime = time() - self._iter_time;  # Время с последней итерации 
 
             if dtime < iteration_interval:
                 sleep(iteration_interval - dtime)
                 
-                Tox.iterate(self._toxptr, user_data_p)
+                self._tox_iterate(user_data_p, self._iter_time + iteration_interval)
                 self._iter_time += iteration_interval
                 return
 
             # Немедленная итерация (долго не было)
             
-            Tox.iterate(self._toxptr, user_data_p)
+            self._tox_iterate(user_data_p, self._iter_time + iteration_interval)
             self._iter_time += dtime
             return
 
+    def _tox_iterate(self, user_data_p, deadline=None):
+        """
+            XXX Под tlock. tox_iterate() с замерами режима iter_stats (опоздание - только итерациям по дедлайну, не досрочным)
+        """
+        iterate = tox.iterate if self._batches is None else self._events_iterate
+
+        if (stats := self._stats) is None:
+            iterate(self._toxptr, user_data_p)
+            return
+
+        if deadline is not None and (late := time() - deadline) >= 0:
+            stats.lateness.record_s(late)
+
+        t0 = perf_counter(); iterate(self._toxptr, user_data_p)
+        stats.iterate.record_s(perf_counter() - t0)
+
+    def _events_iterate(self, toxptr, _user_data_p):
+        """
+            XXX Под tlock. Итерация режима iter_events: события с обработчиками - в EventRing (раздаются после итерации),
+            остальные - пачкой в self._batches. self_connection_status также закрывает ждущие ноды connect()
+        """
+        events_p = tox.events_iterate(toxptr, False, pointer(error := Tox.Err_Events_Iterate()))
+        if error.value != Tox.ERR_EVENTS_ITERATE_OK:
+            logging.warning(f"{type(self).__name__}: {error_table('Tox_Err_Events_Iterate')[error.value][1]}")
+
+        if not events_p:
+            return
+
+        try:
+            events = events_decode(events_p)
+        finally:
+            tox.events_free(events_p)
+
+        ring = self._ring; handlers = self._handlers; batch = []
+
+        for event in events:
+            if event[0] in handlers:
+                ring.push(event)
+            else:
+                batch.append(event)
+
+            if event[0] in self.BUSY_CALLBACKS:
+                self._iter_busy = True
+
+        self._iter_events += len(events)
+
+        if self._bootstrap_pending:  # Статистика нод connect() - без изъятия события у обработчиков и из пачек
+            for name, args in events:
+                if name == 'self_connection_status':
+                    self._bootstrap_status(*args)
+
+        if batch:
+            self._batches.append(batch)
+
+    def events(self):
+        """
+            Режим iter_events: очередная пачка событий одной итерации [(name, args)] без назначенных обработчиков
+            (args как у колбэков tox_<name>_cb, данные в bytes). Пустой список если пачек нет
+        """
+        batches = self._batches
+        return batches.popleft() if batches else []
+
+    def stats(self, reset=False):
+        """
+            Снимок гистограмм режима iter_stats (None если выключен): {iterate, lateness, lock_wait, callbacks: {name: ...}},
+            каждая {count, min, mean, max, p50, p90, p99, p999} в секундах. Итерации не останавливаются
+        """
+        return self._stats.snapshot(reset) if self._stats is not None else None
+
+    def _iter_calls(self):
+        """
+            XXX Под tlock в потоке итераций. Выполнение пачки вызовов из очереди режима iter_queue
+        """
+        calls = self._calls
+
+        for _ in range(len(calls)):  # Пришедшие во время выполнения - в следующую пачку
+            call, args, fut = calls.popleft()
+
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                if self._toxptr is None:
+                    raise RuntimeError(f"{type(self).__name__}: closed")
+                fut.set_result(call(*args))
+            except Exception as e:
+                fut.set_exception(e)
+
+    def _iterating(self):
+        return self._toxptr is not None and (self._iter_thread is not None or self._reactor is not None)
+
+    def _drop_calls(self):
+        """
+            Вызовы очереди iter_queue, которые уже некому выполнить: их Future сразу получают RuntimeError
+        """
+        calls = self._calls
+        while True:
+            try:
+                _, _, fut = calls.popleft()
+            except IndexError:
+                return
+            if fut.set_running_or_notify_cancel():
+                fut.set_exception(RuntimeError(f"{type(self).__name__}: closed"))
+
+    def _iter_adapt(self, iteration_interval):
+        """
+            XXX Под tlock. Пауза до следующей итерации в режиме iter_adaptive
+        """
+        now = self._iter_time
+
+        if self._iter_busy:
+            delay = 0.0;  # Подряд
+
+        elif self._iter_events or now - self._iter_active < self.ADAPTIVE_IDLE:
+            delay = iteration_interval
+
+        else:
+            delay = min(max(2 * (self._iter_delay or 0.0), iteration_interval), self._iter_adaptive)
+
+        if self._iter_busy or self._iter_events:
+            self._iter_active = now
+
+        self._iter_busy = False; self._iter_events = 0
+
+        if delay != self._iter_delay:
+            self._iter_delay = delay
+            self.iter_rate_hook(self.iter_rate())
+
+        return delay
+
+    def iter_rate(self):
+        """
+            Текущая частота итераций, 1/s (inf - итерации подряд)
+        """
+        delay = self._iter_delay
+        return None if delay is None else 1.0 / delay if delay else inf
+
+    def iter_rate_hook(self, rate):
+        """
+            Перекрывается в наследниках: смена частоты итераций в режиме iter_adaptive (вызывается в потоке итераций под tlock)
+        """
+
+    def _iter_step(self, user_data=None):
+        """
+            Одна итерация без сна. Возвращает паузу, s до следующего дедлайна (None если ядро закрыто):
+            iteration_interval() или адаптивную в режиме iter_adaptive
+        """
+        user_data_p = pointer(py_object(user_data)) if user_data is not None else None;  # None ~ c_void_p()
+
+        with self.tlock:
+
+            self._iter_ident = threading.get_ident()
+
+            if self._calls:
+                self._iter_calls(); self._iter_busy = True
+
+            if self._toxptr is None:
+                return None
+
+            self._tox_iterate(user_data_p, self._iter_next)
+            self._iter_time = time()
+
+            iteration_interval = tox.iteration_interval(self._toxptr) / 1000.0;  # s
+            if self._iter_adaptive:
+                iteration_interval = self._iter_adapt(iteration_interval)
+            else:
+                self._iter_delay = iteration_interval
+                
+            self._iter_next = self._iter_time + iteration_interval
+
+        if self._ring:
+            self._iter_dispatch()
+
+        return iteration_interval
+
+    def _iter_dispatch(self):
+        """
+            Раздача событий накопленных за итерацию в режиме iter_batch (в потоке итераций, вне tlock)
+        """
+        ring = self._ring; handlers = self._handlers
+
+        if (executor := self._executor) is not None:
+            while ring:
+                name, args = ring.pop()
+                if (entry := handlers.get(name)) is not None:  # Могли отписаться после итерации
+                    executor.submit(self.order_key(name, args), entry[0], *args)
+            return
+
+        while ring:
+            name, args = ring.pop()
+            if (entry := handlers.get(name)) is None:
+                continue
+            handler, hist = entry
+
+            t0 = perf_counter() if hist is not None else None
+            try:
+                handler(*args)
+            except Exception as e:
+                logging.error(f"{type(self).__name__}: {name}: {e}")
+
+            if hist is not None:
+                hist.record_s(perf_counter() - t0)
+
+    @classmethod
+    def order_key(cls, name, args):
+        """
+            Ключ очередности события в режиме iter_executor: (поле, номер) если первое поле из ORDER_FIELDS,
+            иначе имя события (такие события идут по очереди в пределах своего имени)
+        """
+        if (fields := EVENT_FIELDS.get(name)) and fields[0] in cls.ORDER_FIELDS:
+            return fields[0], args[0]
+        return name
+
+    def _iter_wait(self):
+        """
+            Ожидание дедлайна следующей итерации или self.wakeup(). tlock на время ожидания отпускается
+        """
+        with self.tcond:
+            if not self._iter_wake and self._iter_next is not None:
+                timeout = self._iter_next - time()
+                if timeout > 0:
+                    self.tcond.wait(timeout)
+                    
+            self._iter_wake = False
+
     def _iter_run(self):
         """
             При использовании интерфейса мы не заморачиваемся системным поллингом ядра (он происходит автоматом в потоке _iter_run)
@@ -339,10 +1057,16 @@ class Tox(metaclass=MetaTox):
                                                                                # Даже если быстро дать новый self.start_iterate(),
                                                                                # то старый висячий поток не останется
 
-            
+            if self._iter_deadline or self._iter_queue or self._iter_adaptive:
+                self._iter_wait()
+                self._iter_step()
+                continue
                                                                                
             self._iterate()
 
+            if self._ring:
+                self._iter_dispatch()
+
             if self._iter_priority is not None:
                 sleep(self._iter_priority)
 
@@ -356,39 +1080,91 @@ class Tox(metaclass=MetaTox):
             В случае загрузки из файла состояния клиент не должен пытаться соединяться в течении 10 секунд после первого вызова tox_iterate и,
             в случае отсутствия соединения, повторить агрессивную стратегию соединения выше.
 
+            Ноды (BOOTSTRAP_COUNT) выбирает BOOTSTRAP_REGISTRY.select() по здоровью, а не случайно. Исходы идут в его статистику:
+            ошибка tox_bootstrap() - сразу провал, соединение (self_connection_status) - успех с временем до соединения
+            для всех ждущих нод, нет соединения за BOOTSTRAP_TIMEOUT к следующему connect() - провал. На диск статистика
+            пишется здесь и в close()
+
             XXX Короче во вне проверять раз в 10 секунд self_get_connection_status() и если нет подключения снова вызвать connect()
                 Помним про self.tlock (у нас для Tox.iterate() отдельный поток)
         """
-        with self.tlock:
+        if bootstraps is None:
+            bootstraps = BOOTSTRAP_REGISTRY.nodes()
 
-            if bootstraps is None:
-                bootstraps = BOOTSTRAP_NODES
-            
-            if bootstraps:
-                bootstraps = bootstraps.copy(); shuffle(bootstraps);  # (ipv4 + ":" + port, pubkey)
+        nodes = [ n if isinstance(n, BootstrapNode) else BootstrapNode.from_url(*n) for n in bootstraps ];  # И прежние (ipv4:port, pubkey)
+
+        if not self.opts.ipv6_enabled:
+            nodes = [ n for n in nodes if n.ipv4 ]
 
-                for url, pubkey in bootstraps[:4]:
-                    addr, *port = url.split(':'); port = int(port and port[0] or 33445); pubkey = bytes.fromhex(pubkey)
+        if self._bootstrap_sub is None:  # В режиме iter_events подписка увела бы событие из self.events() - там смотрит _events_iterate()
+            self._bootstrap_sub = self._bootstrap_status if self._batches is not None else \
+                self.subscribe('self_connection_status', self._bootstrap_status)
+
+        with self.tlock:
+            connected = Tox.self_get_connection_status(self._toxptr) != Tox.CONNECTION_NONE
+            self._bootstrap_resolve(connected, expired=True)
+
+            if nodes:
+                for node in BOOTSTRAP_REGISTRY.select(nodes, self.BOOTSTRAP_COUNT):
+                    host, port, pubkey = node.host, node.port, node.public_key
 
                     assert len(pubkey) == Tox.public_key_size()
 
                     # bool tox_bootstrap(Tox *tox, const char *host, uint16_t port, const uint8_t public_key[TOX_PUBLIC_KEY_SIZE], Tox_Err_Bootstrap *error);
 
                     # Tox.bootstrap(self._toxptr, c_char_p(addr.encode()), c_uint16(port), (c_ubyte * len(pubkey))(*pubkey), POINTER(Tox.Err_Bootstrap)(error := Tox.Err_Bootstrap()))
-                    Tox.bootstrap(self._toxptr, c_char_p(addr.encode()), c_uint16(port), (c_ubyte * len(pubkey))(*pubkey), pointer(error := Tox.Err_Bootstrap()))
+                    Tox.bootstrap(self._toxptr, c_char_p(host.encode()), c_uint16(port), (c_ubyte * len(pubkey))(*pubkey), pointer(error := Tox.Err_Bootstrap()))
                     if error.value != Tox.ERR_BOOTSTRAP_OK:
-                        logging.warning(f"{type(self).__name__}: {string_at(Tox.err_bootstrap_to_string(error)).decode(errors='backslashreplace')} ({addr}:{port})")
-                        
-        
+                        logging.warning(f"{type(self).__name__}: {error_table('Tox_Err_Bootstrap')[error.value][1]} ({host}:{port})")
+                        BOOTSTRAP_REGISTRY.record(node, False)
+
+                    elif not connected:
+                        self._bootstrap_pending.setdefault(node.key, (node, perf_counter()))
+
+                self.wakeup()
+
+        BOOTSTRAP_REGISTRY.save()
+
+    def _bootstrap_resolve(self, connected, expired=False):
+        """
+            XXX Под tlock. Исход ждущих нод: при соединении - успех (время до него), иначе (expired) провал тех,
+            что ждут дольше BOOTSTRAP_TIMEOUT
+        """
+        now = perf_counter()
+
+        for key, (node, t0) in list(self._bootstrap_pending.items()):
+            if connected:
+                BOOTSTRAP_REGISTRY.record(node, True, now - t0)
+            elif expired and now - t0 > self.BOOTSTRAP_TIMEOUT:
+                BOOTSTRAP_REGISTRY.record(node, False)
+            else:
+                continue
+            del self._bootstrap_pending[key]
+
+    def _bootstrap_status(self, connection_status, _user_data=None):
+        if connection_status != Tox.CONNECTION_NONE and self._bootstrap_pending:
+            with self.tlock:
+                self._bootstrap_resolve(True);  # Только в памяти: запись на диск - в connect()/close(), не в потоке итераций
+
     def close(self):
         with self.tlock:
+            self._bootstrap_pending.clear();  # Исход неизвестен - в статистику не идет
+
             if self._toxptr:
+                Tox._toxes.pop(self._toxaddr, None);  # Адрес может достаться следующему tox_new()
+                self.tguard.close();                  # Вызовы мимо tlock еще могут работать со struct Tox
                 try:
                     Tox.kill(self._toxptr); self._toxptr = None
                 except Exception as e:
                     logging.error(f"tox_kill: {e}")
 
                 self.stop_iterate()
+
+            if self._calls:
+                self._drop_calls();  # Ожидающие в очереди получат исключение (вставшие позже - сразу в wrap())
+
+        if self._bootstrap_sub is not None:
+            BOOTSTRAP_REGISTRY.save()
     
 
     def join(self, timeout=None):
@@ -400,6 +1176,9 @@ class Tox(metaclass=MetaTox):
             if not ((t := self._iter_thread) and t.is_alive()):
                 t = None
 
+            if (reactor := self._reactor) is not None:
+                t = reactor._thread
+
         if t:
             t.join(timeout)
 
@@ -451,3 +1230,17 @@ class Tox(metaclass=MetaTox):
 
         
     
+
+
+def __getattr__(name):
+    """
+        Прежние имена модуля (только для чтения): BOOTSTRAP_NODES - ((ipv4 + ":" + port, pubkey), ...) из BOOTSTRAP_REGISTRY,
+        BOOTSTRAP_FILE - его путь. Свои ноды - через BOOTSTRAP_REGISTRY.add() (кортеж: прежний BOOTSTRAP_NODES.append()
+        падает, а не теряет ноду молча)
+    """
+    if name == 'BOOTSTRAP_NODES':
+        return tuple((f"{n.ipv4}:{n.port}", n.public_key.hex().upper()) for n in BOOTSTRAP_REGISTRY if n.ipv4)
+    if name == 'BOOTSTRAP_FILE':
+        return BOOTSTRAP_REGISTRY.path
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import re, requests
+import re
 
 
 if __name__ == '__main__':
@@ -23,9 +23,16 @@ if __name__ == '__main__':
         _bootstrap = subparsers.add_parser('bootstrap', description="Download Bootstrap Nodes")
         _bootstrap.add_argument('link', type=str, nargs='?', default=BOOTSTRAP_LINK, help="Bootstrap Nodes Link")
 
+        _signatures = subparsers.add_parser('signatures', description="Build binding signature table (after clang2py or libtoxcore update)")
+
+        _bench = subparsers.add_parser('bench', description="Benchmarks", formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+        _bench.add_argument('name', type=str, nargs='*', help="Benchmark names (all if empty)")
+
     args = parser.parse_args()
 
     if args.command == 'bootstrap':
+        import requests
+        
         BOOTSTRAP_LINK = args.link or BOOTSTRAP_LINK
         print(f"{BOOTSTRAP_LINK=}")
 
@@ -47,6 +54,20 @@ if __name__ == '__main__':
                     for l in m:
                         f.write('\t'.join(l) + '\n')
 
+    elif args.command == 'signatures':
+        from importlib import import_module
+        from .toxcore import signatures, FIXME_STUB, BINDINGS, SIGNATURES_PATH
+
+        table = signatures.dump(SIGNATURES_PATH, FIXME_STUB,
+                                import_module(f".toxcore.{BINDINGS}", __package__), import_module(".toxcore.tox_events", __package__))
+        print(f"{SIGNATURES_PATH}: libtoxcore {'.'.join(str(v) for v in table['version'])}, {len(table['names'])} names")
+
+    elif args.command == 'bench':
+        from . import bench
+
+        for name in args.name or bench.BENCHMARKS:
+            bench.BENCHMARKS[name]()
+
 
                 
 
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=W0212
+
+import asyncio, logging, threading
+
+from . import Tox
+from .reactor import Reactor
+from .toxcore import frozen
+
+
+class AsyncTox(Tox):
+    """
+        Tox для asyncio: итерации планируются в цикле событий через loop.call_later() по iteration_interval()
+        (без отдельного потока), поэтому один цикл держит сколько угодно инстансов.
+
+        Нативные вызовы через __getattr__ как у Tox. Вызовы отправки (см. Tox.WAKEUP_WORDS) возвращают asyncio.Future,
+        которая выполняется результатом вызова после ближайшей tox_iterate() (когда отправка ушла в сеть):
+
+            msg_id = await tox.friend_send_message(friend_number, 0, b"hello", 5, error)
+
+        События колбэков - асинхронные итераторы:
+
+            async for friend_number, type, message, length, _ in tox.stream('friend_message', friend_number=0): ...
+
+        XXX Создавать и использовать только из потока цикла событий
+    """
+
+    def __init__(self, *args, loop=None, **opts):
+
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_ident = threading.get_ident()
+
+        self._aio_active = False
+        self._iter_handle = None;  # asyncio.Handle следующей итерации
+        self._iter_soon = False
+
+        self._sends = [];    # Ожидающие итерации отправки [(future, ret)]
+        self._streams = set();  # Открытые _Stream
+
+        super().__init__(*args, **opts)
+
+
+    def __getattr__(self, name):
+        attr = super().__getattr__(name)
+
+        if getattr(attr, 'wakeup', False):
+            attr = self._getattr_cache[name] = self._aio_send(attr)
+
+        return attr
+
+    def _aio_send(self, wrap):
+        loop = self._loop
+
+        def send(*args):
+            fut = loop.create_future()
+            try:
+                self._sends.append((fut, wrap(*args)));  # wrap() сам будит итерацию
+            except Exception as e:
+                fut.set_exception(e)
+            return fut
+
+        send.tox_attr = wrap.tox_attr
+        send.__name__ = wrap.__name__
+
+        return send
+
+
+    def start_iterate(self, reactor=None):
+        if reactor is not None:
+            raise ValueError(f"{type(self).__name__}: iterates in the event loop, reactor is not supported")
+
+        if not self._aio_active:
+            self._aio_active = True
+            self._aio_wakeup()
+
+    def stop_iterate(self):
+        self._aio_active = False
+
+        if self._iter_handle is not None:
+            self._iter_handle.cancel(); self._iter_handle = None
+
+    def wakeup(self):
+        if threading.get_ident() == self._loop_ident:
+            self._aio_wakeup()
+        else:
+            self._loop.call_soon_threadsafe(self._aio_wakeup)
+
+    def _aio_wakeup(self):
+        if self._aio_active and not self._iter_soon and not self._iter_errors:  # После ошибки - только по выдержке
+            if self._iter_handle is not None:
+                self._iter_handle.cancel()
+
+            self._iter_soon = True
+            self._iter_handle = self._loop.call_soon(self._aio_iterate)
+
+    def _aio_iterate(self):
+        self._iter_handle = None; self._iter_soon = False;  # Пробуждения во время итерации планируют следующую сразу
+
+        sends, self._sends = self._sends, []
+
+        interval = None
+        try:
+            interval = self._iter_step()
+        except Exception as e:
+            for fut, _ in sends:
+                if not fut.done(): fut.set_exception(e)
+
+            self._iter_errors += 1
+            if (interval := Reactor._backoff(self)) is None:  # Та же выдержка, что у Reactor, и остановка после ERROR_LIMIT подряд
+                self._aio_active = False
+                logging.error(f"{type(self).__name__}: iterations stopped after {self._iter_errors} errors in a row")
+            raise
+        else:
+            self._iter_errors = 0
+            for fut, ret in sends:
+                if not fut.done(): fut.set_result(ret)
+        finally:
+            if self._aio_active and self._iter_handle is None:
+                self._iter_handle = self._loop.call_later(0.0 if interval is None else interval, self._aio_iterate) if self._toxptr else None
+
+
+    def stream(self, name, maxsize=0, **filters):
+        """
+            Асинхронный итератор событий колбэка tox_callback_<name> (name как в toxcore без префикса tox_ и суффикса _cb).
+            Каждый поток - подписчик шины событий (filters как у Tox.subscribe()), с закрытием потока подписка снимается.
+            Данные по указателям копируются в bytes
+        """
+        return _Stream(self, name, maxsize, filters)
+
+
+    def close(self):
+        super().close()
+
+        for stream in tuple(self._streams):
+            stream.end()
+
+
+class _Stream:
+
+    def __init__(self, atox, name, maxsize=0, filters=None):
+        self._atox, self._name = atox, name
+        self._queue = asyncio.Queue(maxsize)
+
+        atox.subscribe(name, self._event, **(filters or {}))
+        atox._streams.add(self)
+
+    def _event(self, *args):
+        if (q := self._queue) is not None and not q.full():  # При переполнении (maxsize) новые события отбрасываются
+            q.put_nowait(frozen(args))
+
+    def end(self):
+        if (q := self._queue) is not None:
+            if q.full(): q.get_nowait()
+            q.put_nowait(None);  # Конец потока событий
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._queue is None or (args := await self._queue.get()) is None:
+            self.close()
+            raise StopAsyncIteration
+        return args
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._queue is not None:
+            self._queue = None
+            self._atox._streams.discard(self)
+            self._atox.unsubscribe(self._name, self._event)
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Бенчмарки: python -m toxdoor bench [name ...]
+"""
+
+import os, sys, logging, threading, subprocess
+
+from ctypes import c_ubyte, cast, pointer, py_object, c_void_p, POINTER
+from itertools import zip_longest
+from time import perf_counter
+
+from . import Tox
+from .toxcore import tox, to_ct, to_py, _to_ct, _to_py, py_converter, BINDINGS
+
+
+logging.getLogger().setLevel(logging.ERROR);  # Ошибки вызовов в бенчмарках ожидаемы (логи ядра тоже отсекаются)
+
+
+def _opts(**opts):
+    return {'local_discovery_enabled': False, 'udp_enabled': False, **opts}
+
+
+def _report(title, rows):
+    print(title)
+    for row in rows:
+        print('    ' + '  '.join(f"{c:>14}" if not isinstance(c, float) else f"{c:>14.1f}" for c in row))
+
+
+def bench_threads(calls=40000, threads=(1, 2, 4, 8)):
+    """
+        Вызовы из нескольких потоков: глобальный tlock против experimental_thread_safety (чтение и отправка мимо tlock)
+    """
+    rows = [('mode', 'threads', 'calls/s')]
+
+    for mode, opts in (('tlock', _opts()), ('tlock+deadline', _opts(iter_deadline=True)),
+                       ('thread_safety', _opts(experimental_thread_safety=True))):
+        t = Tox(**opts); t.friend_add_norequest(bytes(range(32)), Tox.Err_Friend_Add());  # Друг 0 (не в сети)
+
+        for n in threads:
+            def run(n=n, t=t):
+                address = bytearray(Tox.address_size()); message = b'x' * 128; error = Tox.Err_Friend_Send_Message()
+
+                for _ in range(calls // n // 2):
+                    t.self_get_address(address)
+                    t.friend_send_message(0, 0, message, len(message), error)
+
+            ts = [ threading.Thread(target=run) for _ in range(n) ]
+
+            t0 = perf_counter()
+            for th in ts: th.start()
+            for th in ts: th.join()
+
+            rows.append((mode, n, calls / (perf_counter() - t0)))
+
+        t.close()
+
+    _report(bench_threads.__doc__.strip(), rows)
+
+
+def bench_callbacks(events=200000, names=('friend_message', 'file_recv_chunk', 'conference_message', 'group_message')):
+    """
+        Накладные расходы на событие колбэка: общий to_py() по каждому аргументу против сгенерированного py_converter(),
+        и полный путь через нативный переходник (ctypes -> _cb_call -> пустой обработчик)
+    """
+    rows = [('callback', 'to_py, us', 'converter, us', 'thunk, us')]
+
+    data = (c_ubyte * 1024)(); data_p = cast(data, POINTER(c_ubyte))
+    user_data_p = pointer(py_object('bench')); user_data = cast(user_data_p, c_void_p).value
+
+    t = Tox(**_opts(iter_deadline=True));  # Поток итераций не держит tlock во сне
+
+    for name in names:
+        argtypes = getattr(tox, name + '_cb')._argtypes_[1:]
+
+        # Аргументы как их отдает ctypes: указатели - объектами POINTER, скаляры - int, user_data - адресом
+        args = tuple(user_data if ct is c_void_p else data_p if hasattr(ct, 'contents') else 5 for ct in argtypes)
+
+        t0 = perf_counter()
+        for _ in range(events):
+            for ctobj, ct in zip_longest(args, argtypes):
+                to_py(ctobj, ct)
+        generic = (perf_counter() - t0) / events * 1e6
+
+        convert = py_converter(argtypes)
+
+        t0 = perf_counter()
+        for _ in range(events):
+            convert(*args)
+        compiled = (perf_counter() - t0) / events * 1e6
+
+        t._set_callback(name, lambda *args: None); thunk = Tox._thunk(name)
+
+        t0 = perf_counter()
+        for _ in range(events):
+            thunk(t._toxptr, *args)
+        native = (perf_counter() - t0) / events * 1e6
+
+        rows.append((name, generic, compiled, native))
+
+    t.close()
+
+    _report(bench_callbacks.__doc__.strip(), rows)
+
+
+def _generic_call(t, name):
+    """
+        Прежний путь Tox.__getattr__(): _to_ct() по каждому аргументу через zip_longest() и _to_py() результата
+        (ветвление по типам на каждый вызов, без кэша преобразований to_ct()/to_py())
+    """
+    fn = getattr(tox, name); restype = fn.restype; argtypes = fn.argtypes[1:]
+
+    def call(*args):
+        with t.tlock:
+            ret = fn(t._toxptr, *[ _to_ct(pyobj, ct) for pyobj, ct in zip_longest(args, argtypes) ])
+            return _to_py(ret, restype)
+
+    return call
+
+
+def bench_calls(calls=200000):
+    """
+        Накладные расходы нативного вызова: ctypes напрямую, прежняя обертка (_to_ct()/_to_py() по zip_longest())
+        и сгенерированная Tox._native() (err - без ячейки ошибки: проверяет обертка; bytes во входные буферы - одним
+        from_buffer_copy() в to_ct()). native у функций WAKEUP_WORDS (self_set_status_message) включает wakeup()
+    """
+    rows = [('function', 'ctypes, us', 'generic, us', 'native, us')]
+
+    t = Tox(**_opts(iter_deadline=True)); t.friend_add_norequest(bytes(range(32)), Tox.Err_Friend_Add())
+
+    address = bytearray(Tox.address_size()); address_ct = (c_ubyte * len(address)).from_buffer(address)
+    error = Tox.Err_Friend_Query()
+
+    public_key = bytes(range(32)); public_key_ct = (c_ubyte * 32).from_buffer_copy(public_key)
+    status = b'x' * Tox.max_status_message_length()
+    status_ct = cast((c_ubyte * len(status)).from_buffer_copy(status), POINTER(tox.self_set_status_message.argtypes[1])).contents
+
+    for label, name, args, ct_args in (
+        ('self_get_nospam', 'self_get_nospam', (), ()),
+        ('self_get_address', 'self_get_address', (address,), (address_ct,)),
+        ('friend_get_connection_status', 'friend_get_connection_status', (0, error), (0, pointer(error))),
+        ('friend_get_last_online', 'friend_get_last_online', (0, None), (0, None)),
+        ('err', 'friend_get_connection_status', (0,), (0, pointer(error))),
+        ('friend_by_public_key', 'friend_by_public_key', (public_key, None), (public_key_ct, None)),
+        (f'self_set_status_message {len(status)} B', 'self_set_status_message', (status, len(status), None), (status_ct, len(status), None)),
+    ):
+        fn = getattr(tox, name); generic = _generic_call(t, name); native = getattr(t, name)
+
+        timings = []
+        for call, a in ((lambda *a, fn=fn: fn(t._toxptr, *a), ct_args), (generic, args), (native, args)):
+            t0 = perf_counter()
+            for _ in range(calls):
+                call(*a)
+            timings.append((perf_counter() - t0) / calls * 1e6)
+
+        rows.append((label, *timings))
+
+    t.close()
+
+    _report(bench_calls.__doc__.strip(), rows)
+
+
+def bench_convert(calls=100000):
+    """
+        Преобразование аргументов по сигнатурам: ветвление _to_ct() на каждый аргумент против специализированных
+        преобразований по паре типов (to_ct()), и то же для результатов и указателей (_to_py() против to_py())
+    """
+    rows = [('signature', 'generic, us', 'cached, us')]
+
+    message = b'x' * 128; buffer = bytearray(Tox.address_size()); user_data = object()
+    data = (c_ubyte * 1024)(); data_p = cast(data, POINTER(c_ubyte))
+
+    for name, args in (
+        ('friend_send_message', (0, 0, message, len(message), Tox.Err_Friend_Send_Message())),
+        ('friend_add_norequest', (bytes(range(32)), None)),
+        ('self_get_address', (buffer,)),
+        ('conference_send_message', (0, 0, message, len(message), None)),
+        ('iterate', (user_data,)),
+    ):
+        argtypes = getattr(tox, name).argtypes[1:]; pairs = tuple(zip(args, argtypes))
+
+        timings = []
+        for convert in (_to_ct, to_ct):
+            t0 = perf_counter()
+            for _ in range(calls):
+                for pyobj, ct in pairs:
+                    convert(pyobj, ct)
+            timings.append((perf_counter() - t0) / calls * 1e6)
+
+        rows.append((name, *timings))
+
+    for label, pairs in (
+        ('results', ((5, tox.friend_send_message.restype), (True, tox.self_set_name.restype), (None, None))),
+        ('pointers', ((data_p, None), (data_p, None))),
+    ):
+        timings = []
+        for convert in (_to_py, to_py):
+            t0 = perf_counter()
+            for _ in range(calls):
+                for ctobj, ct in pairs:
+                    convert(ctobj, ct)
+            timings.append((perf_counter() - t0) / calls * 1e6)
+
+        rows.append((label, *timings))
+
+    _report(bench_convert.__doc__.strip(), rows)
+
+
+def bench_import(runs=10):
+    """
+        Время импорта пакета в новом интерпретаторе (-X importtime, лучшее из runs): биндинги и их пространство имен
+        (из таблицы сигнатур - без модулей tox_lin/tox_win и tox_events)
+    """
+    rows = [('module', 'self, ms', 'cumulative, ms')]
+
+    package = __package__; modules = (f"{package}.toxcore.signatures", f"{package}.toxcore.{BINDINGS}",
+                                      f"{package}.toxcore.tox_events", f"{package}.toxcore", package)
+    paths = (os.path.dirname(os.path.dirname(os.path.abspath(__file__))), os.environ.get('PYTHONPATH'))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in paths if p))
+
+    best = {}
+    for _ in range(runs):
+        stderr = subprocess.run((sys.executable, '-X', 'importtime', '-c', f"import {package}"),
+                                env=env, capture_output=True, text=True, check=True).stderr
+
+        for line in stderr.splitlines():
+            if line.startswith('import time:') and (name := line.rpartition('|')[2].strip()) in modules:
+                own, total = (int(v) / 1000 for v in line[len('import time:'):].split('|')[:2])
+                best[name] = min(best.get(name, (own, total)), (own, total), key=lambda v: v[1])
+
+    for name in modules:
+        if name in best:
+            rows.append((name[len(package) + 1:] or package, *best[name]))
+
+    _report(bench_import.__doc__.strip(), rows)
+
+
+BENCHMARKS = {
+    'threads': bench_threads,
+    'callbacks': bench_callbacks,
+    'calls': bench_calls,
+    'convert': bench_convert,
+    'import': bench_import,
+}
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+import os, json, logging, tempfile, threading
+
+from random import shuffle, sample
+from time import time
+
+from .toxcore import PUBLIC_KEY_SIZE
+
+
+BOOTSTRAP_FILE = 'bootstrap.txt'; BOOTSTRAP_FIELDS = 5;  # ipv4 ipv6 port pubkey maintainer через \t (python -m toxdoor bootstrap)
+
+
+class BootstrapNode:
+    """
+        Нода из https://nodes.tox.chat/: ipv4/ipv6 - адрес или имя хоста (None если нет), public_key - bytes
+    """
+
+    def __init__(self, ipv4, ipv6, port, public_key, maintainer=None):
+        self.ipv4 = ipv4; self.ipv6 = ipv6
+        self.port = port; self.public_key = public_key
+        self.maintainer = maintainer
+
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.host}:{self.port}, {self.public_key.hex()[:8]}, {self.maintainer})"
+
+    @property
+    def key(self):
+        return (self.ipv4, self.ipv6, self.port, self.public_key)
+
+    @property
+    def host(self):
+        return self.ipv4 or self.ipv6
+
+    @classmethod
+    def from_url(cls, url, pubkey):
+        """
+            Из прежнего вида (ipv4 + ":" + port, pubkey hex)
+        """
+        host, *port = url.split(':'); port = int(port and port[0] or 33445)
+        return cls(host, None, port, bytes.fromhex(pubkey))
+
+
+def _address(value):
+    return None if not value or value == '-' or value.startswith('NONE') else value
+
+
+class BootstrapRegistry:
+    """
+        Ноды из bootstrap.txt, общие для всех Tox процесса. Файл читается при первом обращении (обычно первый connect()),
+        дубли отсекаются по ключу ноды через set. path - по умолчанию bootstrap.txt из текущей директории
+        (после python -m toxdoor bootstrap) или из пакета
+
+        Здоровье нод: успехи/провалы и время до соединения (record()) хранятся рядом с файлом нод (bootstrap.stats, json).
+        select() берет лучшие по баллу, ноды после провалов отдыхают с экспоненциальной выдержкой, а EXPLORE мест
+        отдается случайным из остальных - чтобы неизвестные и оправившиеся ноды тоже получали шанс
+    """
+
+    BACKOFF = 30.0; BACKOFF_MAX = 3600.0;  # s выдержки после 1-го провала подряд, дальше удваивается до BACKOFF_MAX
+    TTC_SCALE = 10.0;                       # s времени до соединения, при которых балл ноды падает вдвое (неизвестное - столько же)
+    TTC_ALPHA = 0.3;                        # Вес последнего замера в скользящем среднем времени до соединения
+    EXPLORE = 1;                            # Мест в select() для случайных нод вне лучших
+
+
+    def __init__(self, path=None):
+        self._path = path
+
+        self._lock = threading.Lock()
+        self._nodes = None;  # tuple(BootstrapNode) после загрузки
+        self._index = {};    # public_key -> [BootstrapNode]
+
+        self._stats = None;  # "host:port:pubkey" -> [успехи, провалы, провалов подряд, время последнего провала, среднее до соединения]
+        self._dirty = False
+        self._save_lock = threading.Lock();  # Записи save() по очереди (снимок пишется целиком, без перемешивания)
+        self._save_error = None
+
+
+    def __len__(self):
+        return len(self.nodes())
+
+    def __iter__(self):
+        return iter(self.nodes())
+
+
+    @property
+    def path(self):
+        if self._path is None:
+            self._path = BOOTSTRAP_FILE if os.path.exists(BOOTSTRAP_FILE) else os.path.join(os.path.dirname(__file__), BOOTSTRAP_FILE)
+        return self._path
+
+    def nodes(self):
+        if (nodes := self._nodes) is None:
+            with self._lock:
+                if (nodes := self._nodes) is None:
+                    nodes = self._nodes = self._load()
+        return nodes
+
+    def by_key(self, public_key):
+        """
+            Ноды с ключом public_key (у одного ключа может быть несколько адресов)
+        """
+        self.nodes()
+        return tuple(self._index.get(bytes(public_key), ()))
+
+    def add(self, *nodes):
+        """
+            Свои ноды в реестр (BootstrapNode или прежние (ipv4:port, pubkey)) - их увидят connect() всех Tox процесса.
+            Дубли по ключу ноды отсекаются, в bootstrap.txt не пишутся. Возвращает число добавленных
+        """
+        nodes = [ n if isinstance(n, BootstrapNode) else BootstrapNode.from_url(*n) for n in nodes ]
+
+        self.nodes()
+        with self._lock:
+            known = { n.key for n in self._nodes }; added = []
+            for node in nodes:
+                if node.key not in known:
+                    known.add(node.key); added.append(node)
+                    self._index.setdefault(node.public_key, []).append(node)
+            self._nodes = self._nodes + tuple(added)
+
+        return len(added)
+
+    @property
+    def stats_path(self):
+        return os.path.splitext(self.path)[0] + '.stats'
+
+    def reload(self):
+        with self._lock:
+            self._nodes = None; self._index = {}
+
+
+    @staticmethod
+    def _stat_key(node):
+        return f"{node.host}:{node.port}:{node.public_key.hex()}"
+
+    def _node_stats(self):
+        """
+            XXX Под self._lock
+        """
+        if self._stats is None:
+            try:
+                with open(self.stats_path, 'r', encoding='utf-8') as f:
+                    self._stats = { k: list(v) for k, v in json.load(f).items() }
+            except FileNotFoundError:
+                self._stats = {}
+            except (OSError, ValueError, AttributeError) as e:
+                logging.warning(f"{type(self).__name__}: {self.stats_path}: {e}")
+                self._stats = {}
+        return self._stats
+
+    def _score(self, stat, now):
+        """
+            Балл ноды: доля успехов (с априорной 1/2) деленная на (1 + время до соединения / TTC_SCALE).
+            None - нода в выдержке после провалов
+        """
+        successes, failures, in_row, failed, ttc = stat or (0, 0, 0, 0.0, None)
+
+        if in_row and now < failed + min(self.BACKOFF_MAX, self.BACKOFF * 2 ** (in_row - 1)):
+            return None
+
+        return (successes + 1) / (successes + failures + 2) / (1 + (self.TTC_SCALE if ttc is None else ttc) / self.TTC_SCALE)
+
+    def select(self, nodes, count):
+        """
+            count нод для tox_bootstrap(): лучшие по баллу и EXPLORE случайных из остальных готовых. Если готовых
+            не хватает - добор из нод в выдержке (раньше всех выходящих из нее)
+        """
+        nodes = list(nodes); shuffle(nodes);  # Равные баллы (и холодный старт без статистики) - в случайном порядке
+
+        now = time()
+        with self._lock:
+            stats = self._node_stats()
+            scored = [ (self._score(stat := stats.get(self._stat_key(n)), now), stat, n) for n in nodes ]
+
+        ready = sorted((item for item in scored if item[0] is not None), key=lambda item: -item[0])
+        resting = sorted((item for item in scored if item[0] is None), key=lambda item: item[1][3] + min(
+            self.BACKOFF_MAX, self.BACKOFF * 2 ** (item[1][2] - 1)))
+
+        explore = min(self.EXPLORE, max(0, count - 1), max(0, len(ready) - count))
+
+        picked = [ n for _, _, n in ready[:count - explore] ]
+        picked += sample([ n for _, _, n in ready[count - explore:] ], explore)
+        picked += [ n for _, _, n in resting[:count - len(picked)] ]
+
+        return picked
+
+    def record(self, node, ok, ttc=None):
+        """
+            Исход бутстрапа через node: ok и время до соединения ttc (s) или провал (ошибка tox_bootstrap(), нет соединения)
+        """
+        with self._lock:
+            stat = self._node_stats().setdefault(self._stat_key(node), [0, 0, 0, 0.0, None])
+
+            if ok:
+                stat[0] += 1; stat[2] = 0
+                if ttc is not None:
+                    stat[4] = ttc if stat[4] is None else stat[4] + self.TTC_ALPHA * (ttc - stat[4])
+            else:
+                stat[1] += 1; stat[2] += 1; stat[3] = time()
+
+            self._dirty = True
+
+    def save(self):
+        """
+            Статистика в stats_path (через уникальный временный файл и os.replace()). При ошибке записи снимок снова
+            помечается несохраненным (уйдет со следующим save()), предупреждение - при первой ошибке и при смене ошибки
+        """
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                data = json.dumps(self._stats); self._dirty = False
+
+            path = self.stats_path; tmp = None
+            try:
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path) or '.',
+                                                 prefix=os.path.basename(path) + '.', suffix='.tmp', delete=False) as f:
+                    tmp = f.name
+                    f.write(data)
+                os.replace(tmp, path)
+            except OSError as e:
+                if tmp is not None:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+                with self._lock:
+                    self._dirty = True
+                if (type(e), e.errno) != (type(self._save_error), getattr(self._save_error, 'errno', None)):  # Имя tmp в тексте разное
+                    logging.warning(f"{type(self).__name__}: {path}: {e}")
+                self._save_error = e
+            else:
+                self._save_error = None
+
+
+    def _load(self):
+        nodes = []; seen = set(); index = {}
+
+        if not os.path.exists(path := self.path):
+            return ()
+
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = (line or '').strip()
+                if not line or line.startswith('#'):
+                    continue
+
+                parts = line.split('\t')
+                if len(parts) < BOOTSTRAP_FIELDS: parts = parts + [''] * (BOOTSTRAP_FIELDS - len(parts))
+
+                (ipv4,
+                 ipv6,
+                 port,
+                 pubkey,
+                 maintainer) = parts[0: BOOTSTRAP_FIELDS]
+
+                ipv4, ipv6 = _address(ipv4), _address(ipv6)
+                if not (ipv4 or ipv6) or not port or not pubkey:
+                    continue
+
+                try:
+                    node = BootstrapNode(ipv4, ipv6, int(port), bytes.fromhex(pubkey), maintainer or None)
+                    if len(node.public_key) != PUBLIC_KEY_SIZE:
+                        raise ValueError(f"public key size {len(node.public_key)} != {PUBLIC_KEY_SIZE}")
+                except ValueError as e:
+                    logging.warning(f"{type(self).__name__}: {path}: {e} ({line})")
+                    continue
+
+                if node.key not in seen:
+                    seen.add(node.key); nodes.append(node)
+                    index.setdefault(node.public_key, []).append(node)
+
+        self._index = index
+        return tuple(nodes)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from ctypes import string_at
+
+from .toxcore import tox
+
+
+class ToxError(RuntimeError):
+    """
+        Ошибка нативного вызова по out-параметру Tox_Err_*: code - значение перечисления, name - его имя (TOX_ERR_...).
+        Для каждого перечисления свой наследник (см. error_class()): Tox_Err_Friend_Add -> FriendAddError
+    """
+
+    def __init__(self, message, code=None, name=None):
+        super().__init__(message)
+        self.code, self.name = code, name
+
+
+def err_type(fn):
+    """
+        Перечисление Tox_Err_* последнего параметра нативной функции (по сигнатуре в __doc__ биндингов) или None
+    """
+    params = (fn.__doc__ or '').partition('(')[2].partition(')')[0].split(', ')
+    return params[-1].split(' ')[0][len('LP_'):] if params[-1].startswith('LP_Tox_Err_') else None
+
+
+_classes = {};  # 'Tox_Err_Friend_Add' -> FriendAddError
+_tables = {};   # 'Tox_Err_Friend_Add' -> {value: (класс, текст, имя)}
+
+
+def error_class(etype):
+    """
+        Класс исключения перечисления etype ('Tox_Err_Friend_Add' -> FriendAddError)
+    """
+    if (cls := _classes.get(etype)) is None:
+        name = etype[len('Tox_Err_'):].replace('_', '') + 'Error'
+        cls = _classes.setdefault(etype, type(name, (ToxError,), {'__module__': __name__}))
+    return cls
+
+
+def error_table(etype):
+    """
+        Таблица перечисления etype {value: (класс, текст, имя)} без значения OK. Текст из tox_err_<...>_to_string()
+        (для перечислений без нее - имя значения). Строится один раз - при ошибке остается только поднять исключение
+    """
+    if (table := _tables.get(etype)) is not None:
+        return table
+
+    cls = error_class(etype); to_string = getattr(tox, f"err_{etype[len('Tox_Err_'):].lower()}_to_string", None)
+
+    table = {}
+    for value, name in getattr(tox, etype + '__enumvalues').items():
+        if value:
+            text = string_at(to_string(value)).decode(errors='backslashreplace') if to_string is not None else name
+            table[value] = (cls, text, name)
+
+    return _tables.setdefault(etype, table)
+
+
+def __getattr__(name):
+    """
+        Классы исключений по имени: errors.FriendAddError
+    """
+    for attr in dir(tox):
+        if attr.startswith('Tox_Err_') and attr.endswith('__enumvalues'):
+            if (cls := error_class(attr[:-len('__enumvalues')])).__name__ == name:
+                return cls
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=W0212
+
+import os, logging, threading, multiprocessing
+
+from concurrent.futures import Future
+from itertools import count
+from marshal import dumps, loads
+
+
+# Кодек: кортежи marshal поверх Connection.send_bytes()/recv_bytes()
+#
+#   -> (op, seq, ident, name, args, outs)   outs - позиции bytearray-аргументов (буферы результатов), вернутся обратно
+#   <- (OP_RESULT, seq, ok, value)          value - результат, (результат, буферы) при outs или (тип, текст) исключения
+#   <- (OP_EVENT, ident, name, args)        событие колбэка, данные по указателям в bytes
+
+OP_NEW, OP_CALL, OP_SUB, OP_UNSUB, OP_CLOSE, OP_STOP, OP_RESULT, OP_EVENT = range(8)
+
+
+class Farm:
+    """
+        Ферма идентичностей Tox, разложенных по процессам-воркерам (у каждого свой ReactorPool).
+        Разбор колбэков и преобразования аргументов - чистый питон под GIL, поэтому тысячи идентичностей
+        упираются в одно ядро. Здесь каждый воркер со своим GIL.
+
+        Единый фасад родителя не зависит от того, какой воркер владеет идентичностью:
+
+            farm = Farm()
+            ident = farm.spawn(savedata_data=...)
+            farm.subscribe(ident, 'friend_message', lambda ident, friend_number, type, message, length, _: ...)
+            farm.call(ident, 'friend_send_message', friend_number, 0, b"hello", 5, None).result()
+
+        Буферы результатов передаются как bytearray и заполняются по возвращении (как при локальном вызове).
+
+        XXX Обработчики событий вызываются в потоке чтения воркера: ждать в них .result() вызовов того же воркера нельзя
+    """
+
+    def __init__(self, workers=None, reactors=1, context='spawn'):
+        ctx = multiprocessing.get_context(context)
+
+        self._lock = threading.Lock()
+        self._seq = count()
+        self._idents = count()
+
+        self._owner = {};    # ident -> _Worker
+        self._pending = {};  # seq -> (future, worker, args, outs)
+        self._subs = {};     # (ident, name) -> [handler]
+
+        self._workers = [ _Worker(self, ctx, reactors) for _ in range(workers or os.cpu_count() or 1) ]
+
+
+    def spawn(self, **opts):
+        """
+            Новая идентичность в наименее загруженном воркере. opts - как у Tox() (только типы marshal)
+        """
+        with self._lock:
+            worker = min(self._workers, key=lambda w: w.idents)
+            ident = next(self._idents)
+            self._owner[ident] = worker; worker.idents += 1
+
+        try:
+            self._request(worker, OP_NEW, ident, None, opts).result()
+        except Exception:
+            self._forget(ident)
+            raise
+
+        return ident
+
+    def call(self, ident, name, *args):
+        """
+            Вызов метода Tox идентичности (нативного через __getattr__ или высокоуровневого). Возвращает Future
+        """
+        return self._request(self._owner[ident], OP_CALL, ident, name, args)
+
+    def subscribe(self, ident, name, handler):
+        """
+            handler(ident, *args) на события колбэка tox_callback_<name> идентичности
+        """
+        with self._lock:
+            handlers = self._subs.setdefault((ident, name), [])
+            handlers.append(handler)
+            first = len(handlers) == 1
+
+        if first:
+            self._request(self._owner[ident], OP_SUB, ident, name, ()).result()
+
+    def unsubscribe(self, ident, name, handler):
+        with self._lock:
+            handlers = self._subs.get((ident, name), [])
+            if handler in handlers:
+                handlers.remove(handler)
+            last = not handlers and self._subs.pop((ident, name), None) is not None
+
+        if last:
+            self._request(self._owner[ident], OP_UNSUB, ident, name, ()).result()
+
+    def close(self, ident):
+        try:
+            self._request(self._owner[ident], OP_CLOSE, ident, None, ()).result()
+        finally:
+            self._forget(ident)
+
+    def stop(self):
+        for worker in self._workers:
+            worker.stop()
+
+    def join(self, timeout=None):
+        for worker in self._workers:
+            worker.process.join(timeout)
+
+
+    def _forget(self, ident):
+        with self._lock:
+            if worker := self._owner.pop(ident, None):
+                worker.idents -= 1
+            for key in [ k for k in self._subs if k[0] == ident ]:
+                del self._subs[key]
+
+    def _request(self, worker, op, ident, name, args):
+        fut = Future(); outs = tuple(i for i, a in enumerate(args) if isinstance(a, bytearray))
+
+        with self._lock:
+            seq = next(self._seq)
+            self._pending[seq] = (fut, worker, args if outs else None, outs)
+
+        try:
+            worker.send((op, seq, ident, name, args, outs))
+        except Exception as e:
+            with self._lock:
+                self._pending.pop(seq, None)
+            fut.set_exception(e)
+
+        return fut
+
+    def _result(self, seq, ok, value):
+        with self._lock:
+            fut, _, args, outs = self._pending.pop(seq)
+
+        if not ok:
+            fut.set_exception(RuntimeError(f"{value[0]}: {value[1]}"))
+            return
+
+        if outs:
+            value, bufs = value
+            for i, buf in zip(outs, bufs):
+                args[i][:] = buf
+
+        fut.set_result(value)
+
+    def _event(self, ident, name, args):
+        for handler in tuple(self._subs.get((ident, name), ())):
+            try:
+                handler(ident, *args)
+            except Exception as e:
+                logging.error(f"{type(self).__name__}: {name}: {e}")
+
+    def _lost(self, worker):
+        with self._lock:
+            lost = [ seq for seq, p in self._pending.items() if p[1] is worker ]
+        for seq in lost:
+            self._result(seq, False, ('EOFError', f"worker {worker.process.pid} exited"))
+
+
+class _Worker:
+
+    def __init__(self, farm, ctx, reactors):
+        self.idents = 0
+
+        self.conn, child = ctx.Pipe()
+        self.slock = threading.Lock()
+
+        self.process = ctx.Process(target=_worker_run, args=(child, reactors), daemon=True)
+        self.process.start(); child.close()
+
+        self.reader = threading.Thread(target=self._read, args=(farm,), daemon=True)
+        self.reader.start()
+
+    def send(self, msg):
+        data = dumps(msg)
+        with self.slock:
+            self.conn.send_bytes(data)
+
+    def stop(self):
+        try:
+            self.send((OP_STOP, -1, None, None, (), ()))
+        except OSError:
+            pass
+
+    def _read(self, farm):
+        conn = self.conn
+        while True:
+            try:
+                msg = loads(conn.recv_bytes())
+            except (EOFError, OSError):
+                break
+
+            if msg[0] == OP_EVENT:
+                farm._event(*msg[1:])
+            elif msg[0] == OP_RESULT and msg[1] >= 0:
+                farm._result(*msg[1:])
+
+        farm._lost(self)
+
+
+def _plain(value):
+    """
+        Результаты вызовов к типам marshal
+    """
+    if isinstance(value, Future):
+        value = value.result()
+    if isinstance(value, (memoryview, bytearray)):
+        return bytes(value)
+    return value
+
+
+def _worker_run(conn, reactors):
+    """
+        Процесс-воркер: свой ReactorPool и словарь ident -> Tox. Команды читаются в главном потоке,
+        события уходят из потоков реакторов (отправка под блокировкой)
+    """
+    from . import Tox, ReactorPool
+    from .toxcore import frozen
+
+    pool = ReactorPool(reactors); toxes = {}; subs = {}; slock = threading.Lock()
+
+    def send(msg):
+        data = dumps(msg)
+        with slock:
+            conn.send_bytes(data)
+
+    def event(ident, name, args):
+        try:
+            send((OP_EVENT, ident, name, frozen(args)))
+        except (OSError, ValueError) as e:
+            logging.error(f"farm worker {os.getpid()}: {name}: {e}")
+
+    while True:
+        try:
+            op, seq, ident, name, args, outs = loads(conn.recv_bytes())
+        except (EOFError, OSError):
+            break
+
+        if op == OP_STOP:
+            break
+
+        try:
+            ret = None
+
+            if op == OP_NEW:
+                toxes[ident] = Tox(reactor=pool, **args)
+
+            elif op == OP_CALL:
+                if outs:
+                    args = list(args)
+                    for i in outs:
+                        args[i] = bytearray(args[i])
+
+                ret = _plain(getattr(toxes[ident], name)(*args))
+
+                if outs:
+                    ret = (ret, tuple(bytes(args[i]) for i in outs))
+
+            elif op == OP_SUB:
+                subs[ident, name] = toxes[ident].subscribe(name, lambda *a, ident=ident, name=name: event(ident, name, a))
+
+            elif op == OP_UNSUB:
+                toxes[ident].unsubscribe(name, subs.pop((ident, name), None))
+
+            elif op == OP_CLOSE:
+                toxes.pop(ident).close()
+                for key in [ k for k in subs if k[0] == ident ]:
+                    del subs[key]
+
+            send((OP_RESULT, seq, True, ret))
+
+        except Exception as e:
+            send((OP_RESULT, seq, False, (type(e).__name__, str(e))))
+
+    for t in toxes.values():
+        t.close()
+
+    pool.stop()
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+
+class CloseGuard:
+    """
+        Контекст вызовов мимо tlock (experimental_thread_safety): считает идущие вызовы, close() закрывает вход
+        и ждет, пока они выйдут - только после этого можно tox_kill(). Вход после close() - RuntimeError
+    """
+
+    def __init__(self, name="Tox"):
+        self.name = name
+
+        self._cond = threading.Condition(threading.Lock())
+        self._active = 0; self._closed = False
+
+
+    def __enter__(self):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"{self.name}: closed")
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self._active -= 1
+            if not self._active:
+                self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.wait_for(lambda: not self._active)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import logging, threading
+
+from collections import deque
+from functools import partial
+
+
+class OrderedExecutor:
+    """
+        Обертка над пулом потоков concurrent.futures (ThreadPoolExecutor): задачи с одним ключом выполняются строго
+        по очереди, с разными ключами - параллельно. В пуле одновременно не больше одной задачи ключа, следующая
+        отправляется по завершении предыдущей (add_done_callback).
+
+        XXX Только пулы потоков: задачи здесь - обработчики событий Tox (методы инстанса с его struct Tox * и tlock),
+            в другой процесс через pickle они не передаются. Tox(iter_executor=ProcessPoolExecutor(...)) - TypeError
+    """
+
+    def __init__(self, executor):
+        self.executor = executor
+
+        self._lock = threading.Lock()
+        self._queues = {};  # key -> deque([(fn, args)]) ожидающих. Ключ есть, пока его задача в пуле или в очереди
+
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(q) for q in self._queues.values())
+
+
+    def submit(self, key, fn, *args):
+        with self._lock:
+            if (queue := self._queues.get(key)) is not None:
+                queue.append((fn, args))
+                return
+
+            self._queues[key] = deque(((fn, args),))
+
+        self._pump(key)
+
+    def _pump(self, key):
+        """
+            Отправка в пул следующей задачи ключа (ключ снимается, когда задач больше нет)
+        """
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                fn, args = queue.popleft()
+
+            try:
+                fut = self.executor.submit(fn, *args)
+            except Exception as e:  # Пул остановлен
+                logging.error(f"{type(self).__name__}: {key}: {e}")
+                continue
+
+            fut.add_done_callback(partial(self._done, key))
+            return
+
+    def _done(self, key, fut):
+        if not fut.cancelled() and (e := fut.exception()) is not None:
+            logging.error(f"{type(self).__name__}: {key}: {e}")
+
+        self._pump(key)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# pylint: disable=W0212
+
+import os, logging, threading
+
+from heapq import heappush, heappop
+from itertools import count
+from time import time
+
+
+class Reactor:
+    """
+        Один поток итераций на много инстансов Tox. Инстансы лежат в min-куче по дедлайнам
+        tox_iteration_interval() и итерируются когда подходит их время.
+
+        Куча с ленивым удалением: элемент [deadline, seq, tox], у снятого с расписания tox = None
+        (seq уникален, поэтому до сравнения самих tox дело не доходит).
+
+        В составе ReactorPool простаивающий реактор ворует просроченные инстансы у соседей.
+    """
+
+    STEAL_LAG = 0.005;  # s, опоздание головы кучи после которого будим простаивающего соседа
+
+    ERROR_BACKOFF = 0.05; ERROR_BACKOFF_MAX = 5.0;  # s до повтора после 1-й ошибки итерации подряд (не меньше iter_priority), дальше удваивается
+    ERROR_LIMIT = 20;                               # Ошибок итерации подряд, после которых инстанс снимается с расписания
+
+
+    def __init__(self, pool=None, name=None):
+        self._pool = pool
+
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+
+        self._heap = []
+        self._entries = {};  # tox -> [deadline, seq, tox]
+        self._seq = count()
+
+        self._idle = False
+        self._running = True
+
+        self._thread = threading.Thread(target=self._run, name=name or f"{type(self).__name__}-{id(self):x}", daemon=True)
+
+        if pool is None:
+            self._thread.start();  # Реакторы пула стартует сам пул (когда список соседей уже готов)
+
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    def register(self, tox, deadline=None):
+        """
+            Инстанс встает в расписание (по умолчанию на немедленную итерацию)
+        """
+        with self._lock:
+            tox._reactor = self
+            self._push(tox, time() if deadline is None else deadline)
+            self._cond.notify()
+        return self
+
+    def unregister(self, tox):
+        """
+            Снятие с расписания. Если инстанс в этот момент итерируется, то после итерации он в кучу не вернется
+        """
+        with self._lock:
+            if tox._reactor is not self:
+                return False;  # Уже украден соседом (или снят) - вызывающий перечитает tox._reactor
+
+            tox._reactor = None
+            if entry := self._entries.pop(tox, None):
+                entry[2] = None
+        return True
+
+    def wakeup(self, tox):
+        """
+            Досрочная итерация (tox._iter_wake уже выставлен вызывающим)
+        """
+        with self._lock:
+            if (entry := self._entries.get(tox)) and entry[0] > (now := time()):
+                entry[2] = None
+                self._push(tox, now)
+                self._cond.notify()
+
+    def stop(self):
+        with self._lock:
+            self._running = False
+            self._cond.notify_all()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+
+    def _push(self, tox, deadline):
+        heappush(self._heap, entry := [deadline, next(self._seq), tox])
+        self._entries[tox] = entry
+
+    def _timeout(self, now):
+        """
+            XXX Под self._lock. Время до дедлайна головы кучи (None если куча пуста). Снятые элементы выбрасываются
+        """
+        heap = self._heap
+
+        while heap and heap[0][2] is None:
+            heappop(heap)
+
+        return heap[0][0] - now if heap else None
+
+    def _pop_due(self, now):
+        """
+            XXX Под self._lock. Инстанс с подошедшим дедлайном или None
+        """
+        timeout = self._timeout(now)
+        if timeout is None or timeout > 0:
+            return None
+
+        tox = heappop(self._heap)[2]; del self._entries[tox]
+        return tox
+
+    def _steal(self, now):
+        """
+            Кража просроченного инстанса из кучи соседа. Владельцем становится вор
+        """
+        for victim in self._pool.victims(self):
+            with victim._lock:
+                if (tox := victim._pop_due(now)) is not None:
+                    tox._reactor = self
+                    return tox
+        return None
+
+    def _lagging(self, now):
+        timeout = self._timeout(now)
+        return timeout is not None and timeout < -self.STEAL_LAG;  # Голова кучи опаздывает больше STEAL_LAG
+
+
+    @classmethod
+    def _backoff(cls, tox):
+        """
+            Выдержка до повтора после tox._iter_errors ошибок итерации подряд или None - снять с расписания
+            (то же для итераций AsyncTox в цикле asyncio)
+        """
+        if tox._iter_errors >= cls.ERROR_LIMIT:
+            return None
+        return min(cls.ERROR_BACKOFF_MAX, max(cls.ERROR_BACKOFF, tox._iter_priority or 0.0) * 2 ** (tox._iter_errors - 1))
+
+
+    def _run(self):
+        while self._running:
+
+            with self._lock:
+                tox = self._pop_due(now := time())
+
+            if tox is None and self._pool is not None:
+                tox = self._steal(now)
+
+            if tox is None:
+                with self._lock:
+                    timeout = self._timeout(time())
+                    if self._running and (timeout is None or timeout > 0):
+                        self._idle = True
+                        self._cond.wait(timeout)
+                        self._idle = False
+                continue
+
+            tox._iter_wake = False
+            try:
+                interval = tox._iter_step(); tox._iter_errors = 0
+            except Exception as e:
+                tox._iter_errors += 1; interval = self._backoff(tox)
+                logging.error(f"{type(self).__name__}: {tox!r}: {e}" + (
+                    f" - unregistered after {tox._iter_errors} errors in a row" if interval is None else ''))
+
+            with self._lock:
+                if tox._reactor is self:
+                    if interval is None:    # Ядро закрыто (или итерация падает раз за разом)
+                        tox._reactor = None
+                    elif tox._iter_errors:  # Без досрочных итераций - иначе ошибка крутит цикл вхолостую
+                        self._push(tox, time() + interval)
+                    else:
+                        self._push(tox, time() if tox._iter_wake else tox._iter_next or time() + interval)
+
+                lagging = self._pool is not None and self._lagging(time())
+
+            if lagging:
+                self._pool.kick(self)
+
+
+class ReactorPool:
+    """
+        Небольшой фиксированный пул реакторов с воровством работы между ними.
+        Новые инстансы регистрируются в наименее загруженном реакторе
+    """
+
+    def __init__(self, size=None):
+        size = size or min(4, os.cpu_count() or 1)
+
+        self.reactors = [ Reactor(self, name=f"{type(self).__name__}-{i}") for i in range(size) ]
+
+        for r in self.reactors:
+            r._thread.start()
+
+
+    def __len__(self):
+        return sum(len(r) for r in self.reactors)
+
+
+    def register(self, tox, deadline=None):
+        return min(self.reactors, key=len).register(tox, deadline)
+
+    def victims(self, thief):
+        reactors = self.reactors; i = reactors.index(thief)
+        return reactors[i + 1:] + reactors[:i]
+
+    def kick(self, lagging):
+        """
+            Будим один простаивающий реактор, чтобы он украл работу у отстающего
+        """
+        for r in self.victims(lagging):
+            if r._idle:
+                with r._lock:
+                    r._cond.notify()
+                return
+
+    def stop(self):
+        for r in self.reactors:
+            r.stop()
+
+    def join(self, timeout=None):
+        for r in self.reactors:
+            r.join(timeout)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+
+class EventRing:
+    """
+        Кольцевой буфер событий колбэков для пакетной раздачи (режим iter_batch): во время tox_iterate() нативные колбэки
+        только кладут запись (name, args), после итерации записи раздаются обработчикам вне tlock.
+
+        Слоты выделены заранее. При переполнении емкость удваивается - события не теряются.
+
+        XXX Без блокировок: запись и раздача идут в одном потоке итераций
+    """
+
+    def __init__(self, size=256):
+        self._slots = [None] * max(1, size)
+        self._head = 0; self._len = 0
+
+
+    def __len__(self):
+        return self._len
+
+
+    def push(self, event):
+        slots = self._slots; size = len(slots)
+
+        if self._len == size:
+            self._slots = slots = slots[self._head:] + slots[:self._head] + [None] * size
+            self._head = 0; size += size
+
+        slots[(self._head + self._len) % size] = event; self._len += 1
+
+    def pop(self):
+        if not self._len:
+            raise IndexError(f"{type(self).__name__}: empty")
+
+        slots = self._slots; head = self._head
+
+        event = slots[head]; slots[head] = None
+        self._head = (head + 1) % len(slots); self._len -= 1
+
+        if not self._len:
+            self._head = 0
+
+        return event
@@ -29,7 +29,7 @@ setup(
     include_package_data=True,
 
     package_data={
-        'toxdoor': ['toxcore/libtoxcore.so', 'toxcore/libtox.dll', 'bootstrap.txt']
+        'toxdoor': ['toxcore/libtoxcore.so', 'toxcore/libtox.dll', 'toxcore/*.sig', 'bootstrap.txt']
     }
 
 )
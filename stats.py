@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+from time import perf_counter
+
+
+class Histogram:
+    """
+        HDR-подобная гистограмма целых значений (у нас микросекунды): корзины логарифмические по степеням двойки,
+        каждая степень поделена на SUB_BUCKETS // 2 линейных. Запись - индекс корзины и инкремент, без аллокаций.
+        Относительная погрешность квантилей не больше 2 / SUB_BUCKETS
+
+        XXX Запись без блокировок (все записи Tox идут под tlock), снимок читает копию корзин не останавливая запись
+    """
+
+    SUB_BITS = 5; SUB_BUCKETS = 1 << SUB_BITS
+    MAX_BITS = 40;  # 2**40 мкс ~ 12 суток, большее обрезается
+
+    QUANTILES = (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('p999', 0.999))
+
+
+    def __init__(self):
+        self._clear()
+
+    def _clear(self):
+        half = self.SUB_BUCKETS >> 1
+        self.counts = [0] * (self.SUB_BUCKETS + (self.MAX_BITS - self.SUB_BITS) * half)
+        self.total = 0; self.min = None; self.max = 0
+
+
+    def record(self, value):
+        if value < 0: value = 0
+        elif value >= 1 << self.MAX_BITS: value = (1 << self.MAX_BITS) - 1
+
+        if (shift := value.bit_length() - self.SUB_BITS) <= 0:
+            i = value
+        else:
+            half = self.SUB_BUCKETS >> 1
+            i = self.SUB_BUCKETS + (shift - 1) * half + (value >> shift) - half
+
+        self.counts[i] += 1; self.total += value
+
+        if self.min is None or value < self.min: self.min = value
+        self.max = max(self.max, value)
+
+    def record_s(self, seconds):
+        self.record(int(seconds * 1e6))
+
+
+    def bucket_value(self, i):
+        """
+            Середина корзины i
+        """
+        if i < self.SUB_BUCKETS:
+            return i
+
+        half = self.SUB_BUCKETS >> 1
+        shift, top = divmod(i - self.SUB_BUCKETS, half); shift += 1; top += half
+        return (top << shift) + ((1 << shift) >> 1)
+
+    def _quantile(self, counts, count, q, vmax):
+        seen = 0
+        for i, c in enumerate(counts):
+            seen += c
+            if count and seen >= q * count:
+                return min(self.bucket_value(i), vmax)
+        return 0
+
+    def snapshot(self, reset=False):
+        """
+            {count, min, mean, max, p50, p90, p99, p999} в секундах (count - штук). reset - обнулить после снимка
+        """
+        counts = self.counts.copy(); count = sum(counts)
+        total, vmin, vmax = self.total, self.min, self.max
+
+        if reset:
+            self._clear()
+
+        snap = {'count': count, 'min': (vmin or 0) / 1e6, 'mean': total / count / 1e6 if count else 0.0, 'max': vmax / 1e6}
+
+        for key, q in self.QUANTILES:
+            snap[key] = self._quantile(counts, count, q, vmax) / 1e6
+
+        return snap
+
+
+class IterStats:
+    """
+        Счетчики цикла итераций Tox (режим iter_stats):
+
+            iterate   - длительность tox_iterate()
+            lateness  - опоздание итерации относительно дедлайна iteration_interval()
+            lock_wait - ожидание tlock нативными вызовами через __getattr__
+            callbacks - время обработчиков колбэков по именам
+    """
+
+    def __init__(self):
+        self.iterate = Histogram()
+        self.lateness = Histogram()
+        self.lock_wait = Histogram()
+        self.callbacks = {};  # name -> Histogram
+
+    def callback(self, name):
+        if (hist := self.callbacks.get(name)) is None:
+            hist = self.callbacks[name] = Histogram()
+        return hist
+
+    def snapshot(self, reset=False):
+        return {
+            'iterate': self.iterate.snapshot(reset),
+            'lateness': self.lateness.snapshot(reset),
+            'lock_wait': self.lock_wait.snapshot(reset),
+            'callbacks': { name: hist.snapshot(reset) for name, hist in list(self.callbacks.items()) },
+        }
+
+
+class TimedLock:
+    """
+        Контекст блокировки с записью времени ее ожидания в гистограмму (запись уже под блокировкой)
+    """
+
+    def __init__(self, lock, hist):
+        self.lock, self.hist = lock, hist
+
+    def __enter__(self):
+        t0 = perf_counter(); self.lock.acquire()
+        self.hist.record_s(perf_counter() - t0)
+        return self
+
+    def __exit__(self, *exc):
+        self.lock.release()
@@ -4,14 +4,17 @@ import os, platform
 
 from ctypes import (
     c_void_p, c_char_p, c_wchar_p, POINTER,
-    pointer, py_object, cast, string_at, wstring_at,
-    c_char, c_wchar,
+    pointer, py_object, cast, string_at, wstring_at, addressof,
+    c_char, c_wchar, c_ubyte, sizeof,
 
 
     _Pointer, _SimpleCData, Array,
 )
 # from ctypes.util import find_library
-from ctypes import cdll
+from ctypes import cdll, PyDLL, c_uint32, c_uint64
+from functools import partial
+
+from . import signatures
 
 
 if not (TOXCORE_LIBS := os.environ.get('TOXCORE_LIBS')):
@@ -44,27 +47,242 @@ else:
 FIXME_STUB = cdll.LoadLibrary(TOXCORE_PATH)
 
 # FIXME tox_win.py и tox_lin отличаются только парой констант ( WORD_SIZE is: 8 / 4 )
-if platform.system() == "Windows":
-    from . import tox_win as tox
+BINDINGS = 'tox_win' if platform.system() == "Windows" else 'tox_lin'
+
+# Таблица сигнатур рядом с биндингами (см. signatures): без нее или для другой версии libtoxcore - исполняем сгенерированные
+SIGNATURES_PATH = os.path.join(os.path.dirname(__file__), BINDINGS + '.sig')
+
+
+if (_loaded := signatures.load(SIGNATURES_PATH, FIXME_STUB, f"{__name__}.{BINDINGS}")) is not None:
+    tox, _LAZY = _loaded
+
 else:
-    from . import tox_lin as tox
+    # Сгенерированные биндинги импортируются только после FIXME_STUB (см. выше)
+    # pylint: disable=C0413
+    if platform.system() == "Windows":
+        from . import tox_win as tox
+    else:
+        from . import tox_lin as tox
 
+    # sed -in "s/^_libraries\['FIXME_STUB'\].*/from . import FIXME_STUB; _libraries.update(FIXME_STUB = FIXME_STUB)/" tox_lin.py
+    assert tox._libraries['FIXME_STUB'] is FIXME_STUB
 
-# sed -in "s/^_libraries\['FIXME_STUB'\].*/from . import FIXME_STUB; _libraries.update(FIXME_STUB = FIXME_STUB)/" tox_lin.py
-assert tox._libraries['FIXME_STUB'] is FIXME_STUB
+    from . import tox_events;  # tox_events.h и tox_dispatch.h в генерацию tox_lin/tox_win не вошли - вливаем в то же пространство имен
 
+    _LAZY = { name: partial(getattr, tox_events, name) for name in tox_events.__all__ }
 
 
-for name in (tox_names := dir(tox)):
-    # Просто добавляем в пространство имен tox функции и константы без избыточного префикса tox_/Tox_/TOX_
-    
-    if name.startswith('tox_') or name.startswith('Tox_') or name.startswith('TOX_'):
-        add_name = name[4:]
-        assert add_name not in tox_names
-        setattr(tox, add_name, getattr(tox, name))
+# Имена без избыточного префикса tox_/Tox_/TOX_ и имена tox_events (прототипы функций из таблицы сигнатур) не раскладываются
+# по tox заранее (~2300 setattr и проверка коллизий по списку dir() - основная часть времени импорта), а разрешаются
+# модульным __getattr__ при первом обращении и оседают в пространстве имен tox
 
+_PREFIXES = ('tox_', 'Tox_', 'TOX_')
 
-def to_ct(pyobj, ct):
+
+def _tox_getattr(name):
+    """
+        iterate -> tox_iterate, Err_New -> Tox_Err_New, events_iterate -> tox_events_iterate (из _LAZY)
+    """
+    for full_name in (name, *(prefix + name for prefix in _PREFIXES)):
+        if full_name in tox.__dict__:
+            value = tox.__dict__[full_name]
+        elif (factory := _LAZY.get(full_name)) is not None:
+            value = factory(); setattr(tox, full_name, value)
+        else:
+            continue
+
+        setattr(tox, name, value)
+        return value
+
+    raise AttributeError(f"module {tox.__name__!r} has no attribute {name!r}")
+
+
+def _tox_dir():
+    names = set(tox.__dict__) | set(_LAZY)
+    return sorted(names | { name[len('tox_'):] for name in names if name.startswith(_PREFIXES) })
+
+
+tox.__getattr__ = _tox_getattr
+tox.__dir__ = _tox_dir
+
+
+PUBLIC_KEY_SIZE = tox.public_key_size()
+
+
+def frozen(py_args):
+    """
+        Данные по указателям из колбэков живут только пока колбэк выполняется - копируем их в bytes
+        (memoryview от py_converter() уже ровно на длину данных)
+    """
+    return tuple(bytes(arg) if isinstance(arg, memoryview) else arg for arg in py_args)
+
+
+_py_converters = {};  # tuple(argtypes) -> convert(*args)
+
+def py_converter(argtypes, copy=False):
+    """
+        Специализированное преобразование аргументов колбэка под его сигнатуру (то же что to_py() по каждому аргументу):
+        convert(*args) -> tuple. Генерируется один раз на сигнатуру: скаляры ctypes уже отдает питоновскими и они
+        проходят как есть, преобразуются только указатели
+
+        Указатель на данные берет длину из следующего аргумента size_t (ключи без длины - PUBLIC_KEY_SIZE): memoryview
+        ровно на данные без копирования, copy - сразу bytes (переживут колбэк). Строки char * с длиной - без поиска NUL
+
+        argtypes - без первого POINTER(struct_Tox)
+    """
+    key = tuple(argtypes)
+
+    if (convert := _py_converters.get((key, copy))) is not None:
+        return convert
+
+    MAX_LENGTH = 2**32;  # Как в to_py()
+
+    ns = {}; items = []
+
+    for i, ct in enumerate(key):
+        a = f"a{i}"
+
+        length = f"a{i + 1}" if key[i + 1:i + 2] == (c_uint64,) else None;  # size_t length сразу за данными
+
+        if ct is c_void_p:                                                    # void *user_data
+            ns['py_object_p'] = POINTER(py_object)
+            items.append(f"(None if {a} is None else cast({a}, py_object_p).contents.value)")
+
+        elif isinstance(ct, type) and issubclass(ct, _Pointer) and issubclass(ct._type_, _SimpleCData):
+            rt = ct._type_
+
+            if rt is c_char:
+                items.append(f"(None if not {a} else string_at({a}{', ' + length if length else ''})"
+                             + ".decode(errors='backslashreplace'))")
+            elif rt is c_wchar:
+                items.append(f"(None if not {a} else wstring_at({a}{', ' + length if length else ''}))")
+            else:
+                if length is None and rt is c_ubyte:
+                    length = "PUBLIC_KEY_SIZE"
+
+                if copy and rt._type_ == 'B' and length:
+                    items.append(f"(None if not {a} else string_at({a}, {length}))")
+                else:
+                    ns[f"t{i}"] = rt * MAX_LENGTH
+                    view = (f"memoryview(t{i}.from_address(addressof({a}.contents))).cast('B')"
+                            + ("" if rt._type_ == 'B' else f".cast('{rt._type_}')") + (f"[:{length}]" if length else ""))
+                    items.append(f"(None if not {a} else {'bytes(' + view + ')' if copy else view})")
+
+        elif isinstance(ct, type) and issubclass(ct, _SimpleCData):  # Скаляры и перечисления
+            items.append(a)
+
+        else:
+            ns[f"ct{i}"] = ct
+            items.append(f"to_py({a}, ct{i})")
+
+    args = ", ".join(f"a{i}" for i in range(len(key)))
+    code = f"def convert({args}):\n    return ({', '.join(items)}{',' if len(items) == 1 else ''})\n"
+
+    ns.update(cast=cast, string_at=string_at, wstring_at=wstring_at, addressof=addressof, to_py=to_py, PUBLIC_KEY_SIZE=PUBLIC_KEY_SIZE)
+    exec(code, ns);  # pylint: disable=W0122
+
+    convert = _py_converters[key, copy] = ns['convert']
+    return convert
+
+
+# Геттеры событий - чтения полей структур: вызываем их без отпускания GIL (PyDLL) и с адресами вместо объектов-указателей.
+# На каждое событие таких вызовов несколько, и отпускание/захват GIL стоит дороже самого вызова
+_PY_LIB = PyDLL(TOXCORE_PATH)
+
+
+def _fast(name, restype):
+    fn = _PY_LIB['tox_' + name];  # Через [] - новый объект функции (атрибуты кешируются и общие)
+    fn.restype = c_void_p if issubclass(restype, _Pointer) else restype
+    fn.argtypes = (c_void_p,)
+    return fn
+
+
+_addressed = {};  # name -> функция с прототипом по адресам
+
+def addressed(name):
+    """
+        Отдельный объект функции tox_<name> (PyDLL - без отпускания GIL, как геттеры событий) с прототипом по адресам:
+        указатели и массивы (struct Tox *, буферы, ячейка ошибки) передаются int-адресами без создания объектов ctypes
+        на вызов. Для массовых запросов коротких геттеров в циклах, где адреса считаются смещениями в одном буфере
+
+        XXX Только под tlock: колбэки ядра (tox_iterate()) тогда не идут и ядру не нужен GIL, пока держим его мы
+    """
+    if (fn := _addressed.get(name)) is not None:
+        return fn
+
+    proto = getattr(tox, name)
+
+    fn = _PY_LIB['tox_' + name];  # Через [] - новый объект функции
+    fn.restype = c_void_p if isinstance(proto.restype, type) and issubclass(proto.restype, _Pointer) else proto.restype
+    fn.argtypes = tuple(c_void_p if issubclass(ct, (_Pointer, Array)) else ct for ct in proto.argtypes)
+
+    return _addressed.setdefault(name, fn)
+
+
+EVENT_FIELDS = {  # name -> поля события (порядок аргументов колбэка tox_<name>_cb)
+    tox.Event_Type__enumvalues[event_type][len('TOX_EVENT_'):].lower(): fields for event_type, fields in tox.event_fields.items()
+}
+
+_event_decoders = {};  # Tox_Event_Type -> decode(event)
+
+def event_decoder(event_type):
+    """
+        Разбор события из tox_events_iterate(): decode(адрес const Tox_Event) -> (name, args). args как у колбэков
+        tox_<name>_cb (с user_data = None в конце), данные по указателям сразу копируются в bytes по длине из
+        следующего поля (ключи - PUBLIC_KEY_SIZE). Генерируется один раз на тип события
+    """
+    if (decode := _event_decoders.get(event_type)) is not None:
+        return decode
+
+    name = tox.Event_Type__enumvalues[event_type][len('TOX_EVENT_'):].lower()
+    fields = tox.event_fields[event_type]
+
+    ns = {'get_event': _fast(f"event_get_{name}", c_void_p), 'string_at': string_at, 'PUBLIC_KEY_SIZE': PUBLIC_KEY_SIZE}
+
+    lines = [ "def decode(event):", "    e = get_event(event)" ]
+
+    pointers = []
+    for i, field in enumerate(fields):
+        restype = getattr(tox, f"event_{name}_get_{field}").restype
+        ns[f"g{i}"] = _fast(f"event_{name}_get_{field}", restype)
+        lines.append(f"    v{i} = g{i}(e)")
+
+        if issubclass(restype, _Pointer):
+            pointers.append(i)
+
+    for i in pointers:
+        size = f"v{i + 1}" if fields[i + 1:i + 2] == (fields[i] + '_length',) else "PUBLIC_KEY_SIZE"
+        lines.append(f"    v{i} = string_at(v{i}, {size}) if v{i} else b''")
+
+    lines.append(f"    return {name!r}, ({''.join(f'v{i}, ' for i in range(len(fields)))}None)")
+
+    exec("\n".join(lines) + "\n", ns);  # pylint: disable=W0122
+
+    decode = _event_decoders[event_type] = ns['decode']
+    return decode
+
+
+_events_get_size = _fast('events_get_size', c_uint32)
+_events_get = _PY_LIB['tox_events_get']; _events_get.restype = c_void_p; _events_get.argtypes = (c_void_p, c_uint32)
+_event_get_type = _fast('event_get_type', c_uint32)
+
+
+def events_decode(events_p):
+    """
+        Все события Tox_Events * одной итерации: [(name, args)]
+    """
+    addr = cast(events_p, c_void_p).value; decoders = _event_decoders
+    events = []
+
+    for i in range(_events_get_size(addr)):
+        event = _events_get(addr, i)
+        event_type = _event_get_type(event)
+        events.append((decoders.get(event_type) or event_decoder(event_type))(event))
+
+    return events
+
+
+def _to_ct(pyobj, ct):
     """
         Типы указателей в ctypes которые созданы не через POINTER(), а также как и скаляры: c_void_p, c_char_p, c_wchar_p
 
@@ -103,7 +321,7 @@ def to_ct(pyobj, ct):
 
         if issubclass(rt, _SimpleCData):                        # Указатель на целочисленный тип (это может быть и начало массива)
             if isinstance(py, type(None)):
-                return ct(None)
+                return ct();  # NULL (ct(None) для указателей на скаляры - TypeError)
             
             if isinstance(py, (bool, int, float)):              # Указатель на скаляр
                 return ct(rt(py))
@@ -135,7 +353,7 @@ def to_ct(pyobj, ct):
         return py
 
 
-def to_py(ctobj, ct=None):
+def _to_py(ctobj, ct=None, length=None):
     """
         Type code   C Type             Minimum size in bytes
         'b'         signed integer     1
@@ -156,6 +374,8 @@ def to_py(ctobj, ct=None):
 
         если в типа данных указатель на c_char / w_char то копируем строки, другие указатели
         возвращаем через memoryview без (без копирования данных)
+
+        length - известная длина данных по указателю (memoryview ровно на нее, строки без поиска NUL)
     """
     
     assert not isinstance(ctobj, type)
@@ -163,7 +383,9 @@ def to_py(ctobj, ct=None):
 
     MAX_LENGTH = 2**32;  # Мы не можем в питоне сделать адекватный memoryview на ссылочные данные не зная длину данных
     
-    length = MAX_LENGTH
+    exact = length is not None
+    if not exact:
+        length = MAX_LENGTH
         
     
     if ctobj is None:
@@ -191,10 +413,11 @@ def to_py(ctobj, ct=None):
 
         if rt is c_char:
             # Строки различимы по последнему завершающему нулю в c-строках (можно применить string_at - она выгребет всю строку)
-            return string_at(ctobj).decode(errors='backslashreplace')
+            s = string_at(ctobj, length) if exact else string_at(ctobj)
+            return s.decode(errors='backslashreplace')
 
         if rt is c_wchar:
-            return wstring_at(ctobj).decode(errors='backslashreplace')
+            return wstring_at(ctobj, length) if exact else wstring_at(ctobj)
 
         # Это указатель на первый элемент массива (длина или не известна или некая максимально возможная).
         # Нужно что-то вернуть модифицируемое по ссылке указывающее на С-ишную память и это только memoryview в питоне
@@ -225,13 +448,139 @@ def to_py(ctobj, ct=None):
             return to_py(c_void_p(ctobj))
 
         return ctobj
-        
-    
 
 
+# Преобразования to_ct()/to_py() зависят только от типа python-объекта и типа ctypes, поэтому ветвление по цепочкам
+# issubclass()/isinstance() делается один раз на пару типов, а на вызов остается специализированная функция.
+# Редкие ветки (c_char_p/c_wchar_p результаты, указатели на структуры) идут в общие _to_ct()/_to_py()
 
-    
+_to_ct_converters = {};  # (type(pyobj), ct) -> convert(pyobj)
+_to_py_converters = {};  # (type(ctobj), ct) -> convert(ctobj, length)
+
+
+def to_ct(pyobj, ct):
+    """
+        То же что _to_ct(): типы указателей в ctypes которые созданы не через POINTER(), а также как и скаляры: c_void_p, c_char_p, c_wchar_p
+
+        XXX py_object юзаем как пользовательские данные для которых предусмотрена передача через `void *user_data`
+    """
+    if (convert := _to_ct_converters.get((type(pyobj), ct))) is None:
+        convert = _to_ct_converters[type(pyobj), ct] = _to_ct_converter(type(pyobj), ct)
+    return convert(pyobj)
+
+
+def to_py(ctobj, ct=None, length=None):
+    """
+        То же что _to_py(): скаляры ctypes в python, строки c_char / c_wchar копируются, остальные указатели - memoryview
+        без копирования (length - известная длина данных)
+    """
+    if (convert := _to_py_converters.get((type(ctobj), ct))) is None:
+        convert = _to_py_converters[type(ctobj), ct] = _to_py_converter(type(ctobj), ct)
+    return convert(ctobj, length)
+
+
+def _to_ct_converter(pytype, ct):
+    """
+        Специализированное to_ct() для пары (тип python-объекта, тип ctypes): convert(pyobj) -> объект ctypes
+    """
+    assert not issubclass(pytype, type) and (ct is None or isinstance(ct, type))
+
+    if ct is None: ct = type(None)
+
+    if ct is c_char_p:
+        ct = POINTER(c_char)
+    elif ct is c_wchar_p:
+        ct = POINTER(c_wchar)
+
+    py = bytes if pytype is str else pytype;  # Строки кодируются перед преобразованием
+
+    def encoded(convert):
+        return (lambda pyobj: convert(pyobj.encode())) if pytype is str else convert
+
+    if issubclass(ct, _SimpleCData):
+        if ct is c_void_p:
+            return (lambda pyobj: None) if issubclass(pytype, type(None)) else (lambda pyobj: pointer(py_object(pyobj)))
+
+        if issubclass(py, (bool, int, float)):
+            return ct
+
+        return encoded(lambda pyobj: pyobj)
+
+    if issubclass(ct, _Pointer):
+        rt = ct._type_
+
+        if issubclass(rt, _SimpleCData):
+            if issubclass(py, type(None)):
+                return lambda pyobj: ct()
+
+            if issubclass(py, (bool, int, float)):
+                return lambda pyobj: ct(rt(pyobj))
+
+            if issubclass(py, bytes) and sizeof(rt) == 1:  # Одно копирование буфера вместо распаковки по байтам
+                return encoded(lambda pyobj: (rt * len(pyobj)).from_buffer_copy(pyobj))
+
+            if issubclass(py, (bytes, tuple)):
+                return encoded(lambda pyobj: (rt * len(pyobj))(*pyobj))
+
+            if issubclass(py, (bytearray, memoryview)):
+                return lambda pyobj: (rt * len(pyobj)).from_buffer(pyobj)
+
+        return encoded((lambda pyobj: pyobj) if issubclass(py, _Pointer) else pointer)
+
+    if issubclass(ct, Array):
+        rt = ct._type_; length = ct._length_; target = POINTER(rt * length)
+
+        if issubclass(py, bytes) and sizeof(rt) == 1:  # Ключи и прочие массивы фиксированной длины - сразу своим типом
+            return encoded(lambda pyobj: ct.from_buffer_copy(pyobj) if len(pyobj) == length else
+                           cast((rt * len(pyobj)).from_buffer_copy(pyobj), target).contents)
+
+        if issubclass(py, (bytes, tuple)):
+            return encoded(lambda pyobj: cast((rt * len(pyobj))(*pyobj), target).contents)
+
+        if issubclass(py, (bytearray, memoryview)):
+            return lambda pyobj: cast((rt * len(pyobj)).from_buffer(pyobj), target).contents
+
+        if issubclass(py, type(None)):
+            return lambda pyobj: cast((rt * 0)(), target).contents
+
+        return encoded((lambda pyobj: pyobj) if issubclass(py, _Pointer) else pointer)
+
+    return encoded(lambda pyobj: pyobj)
+
+
+def _to_py_converter(ctype, ct=None):
+    """
+        Специализированное to_py() для пары (тип объекта ctypes, ожидаемый тип): convert(ctobj, length) -> python
+    """
+    generic = lambda ctobj, length: _to_py(ctobj, ct, length)
+
+    if issubclass(ctype, type(None)):
+        return lambda ctobj, length: None
+
+    if issubclass(ctype, (c_void_p, c_char_p, c_wchar_p)):
+        return generic
+
+    if issubclass(ctype, _SimpleCData):
+        return lambda ctobj, length: ctobj.value
+
+    if issubclass(ctype, _Pointer):
+        rt = ctype._type_
+
+        if rt is c_char or rt is c_wchar or not issubclass(rt, _SimpleCData):
+            return generic
+
+        typecode = rt._type_; unbound = rt * 2**32
+
+        def convert(ctobj, length):
+            m = memoryview(unbound.from_address(addressof(ctobj.contents))).cast('B').cast(typecode)
+            return m if length is None else m[:length]
 
+        return convert
 
+    if issubclass(ctype, Array):
+        return generic
 
+    if ct is c_void_p and issubclass(ctype, int):
+        return generic
 
+    return lambda ctobj, length: ctobj
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Таблица сигнатур биндингов (marshal): то же пространство имен, что дают сгенерированные tox_lin/tox_win + tox_events,
+    но без исполнения 9k строк присваиваний restype/argtypes/__doc__ по одному. Типы строятся при загрузке,
+    прототипы функций - при первом обращении (см. toxcore._tox_getattr())
+
+        python -m toxdoor signatures    # После перегенерации биндингов (clang2py) или смены libtoxcore
+
+    Типы в таблице - дескрипторы из кортежей и строк:
+
+        None                        void
+        'c_uint'                    скаляр ctypes по имени
+        ('P', d)                    указатель POINTER(d)
+        ('A', d, length)            массив d * length
+        ('S', name)                 структура/объединение из structs
+        ('F', restype, argtypes)    CFUNCTYPE(restype, *argtypes)
+"""
+
+import ctypes, logging, marshal
+
+from ctypes import POINTER, CFUNCTYPE, Structure, Union, _CFuncPtr, _Pointer, _SimpleCData, Array
+from functools import partial
+from types import ModuleType
+
+
+FORMAT = 1;  # Версия формата таблицы
+
+
+def _version(lib):
+    return (lib.tox_version_major(), lib.tox_version_minor(), lib.tox_version_patch())
+
+
+def describe(ct):
+    """
+        Дескриптор типа ctypes (см. модуль)
+    """
+    if ct is None:
+        return None
+
+    if issubclass(ct, _Pointer):
+        return ('P', describe(ct._type_))
+    if issubclass(ct, Array):
+        return ('A', describe(ct._type_), ct._length_)
+    if issubclass(ct, (Structure, Union)):
+        return ('S', ct.__name__)
+    if issubclass(ct, _CFuncPtr):
+        return ('F', describe(ct._restype_), tuple(describe(a) for a in ct._argtypes_))
+
+    if issubclass(ct, _SimpleCData) and getattr(ctypes, ct.__name__, None) is ct:
+        return ct.__name__
+
+    raise TypeError(f"{ct!r}: no descriptor")
+
+
+def dump(path, lib, bindings, events):
+    """
+        Таблица из сгенерированных модулей биндингов: все имена tox_lin/tox_win и tox_events по его __all__.
+        Вспомогательное из генератора (POINTER_T, string_cast(), AsDictMixin, _libraries, ...) в таблицу не идет
+    """
+    names = {}; structs = {}
+
+    def struct(ct):
+        if ct.__name__ not in structs:
+            structs[ct.__name__] = None;  # Рекурсивные ссылки через указатели на себя
+            fields = ct.__dict__.get('_fields_')
+            structs[ct.__name__] = (
+                'union' if issubclass(ct, Union) else 'struct', ct.__dict__.get('_pack_'),
+                None if fields is None else tuple((f[0], describe(f[1]), *f[2:]) for f in fields),
+            )
+            for f in fields or ():
+                walk(f[1])
+
+    def walk(ct):
+        while isinstance(ct, type) and issubclass(ct, (_Pointer, Array)):
+            ct = ct._type_
+        if isinstance(ct, type) and issubclass(ct, (Structure, Union)):
+            struct(ct)
+        elif isinstance(ct, type) and issubclass(ct, _CFuncPtr):
+            for a in (ct._restype_, *ct._argtypes_):
+                walk(a)
+
+    for module, module_names in ((bindings, list(vars(bindings))), (events, events.__all__)):
+        for name in module_names:
+            value = getattr(module, name)
+
+            if name.startswith('_') or name in {'Structure', 'Union', 'POINTER_T'}:
+                continue
+
+            if isinstance(value, _CFuncPtr):
+                argtypes = tuple(value.argtypes or ())
+                names[name] = ('f', describe(value.restype), tuple(describe(a) for a in argtypes), value.__doc__)
+                for ct in (value.restype, *argtypes):
+                    walk(ct)
+
+            elif isinstance(value, type) and issubclass(value, (_SimpleCData, _Pointer, Array, Structure, Union, _CFuncPtr)):
+                names[name] = ('t', describe(value)); walk(value)
+
+            elif value is None or isinstance(value, (int, str, dict, tuple)):
+                names[name] = ('v', value)
+
+    table = {'format': FORMAT, 'version': _version(lib), 'structs': structs, 'names': names}
+
+    with open(path, 'wb') as f:
+        marshal.dump(table, f)
+
+    return table
+
+
+def _function(lib, name, build, restype, argtypes, doc):
+    fn = lib[name];  # Через [] - свой объект функции (атрибуты lib делят с ним сгенерированные модули, если их импортируют)
+    fn.restype = build(restype)
+    fn.argtypes = [ build(a) for a in argtypes ]
+    fn.__doc__ = doc
+    return fn
+
+
+def load(path, lib, name):
+    """
+        Модуль биндингов name из таблицы path и словарь ленивых имен {name: factory()} (прототипы функций) или None,
+        если таблицы нет или она не для загруженной libtoxcore (тогда - сгенерированные модули)
+    """
+    try:
+        with open(path, 'rb') as f:
+            table = marshal.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logging.warning(f"{path}: {e}")
+        return None
+
+    if not isinstance(table, dict) or table.get('format') != FORMAT:
+        logging.warning(f"{path}: format {table.get('format') if isinstance(table, dict) else None} != {FORMAT}")
+        return None
+
+    if (version := _version(lib)) != table['version']:
+        logging.warning(f"{path}: table for libtoxcore {'.'.join(str(v) for v in table['version'])}, loaded"
+                        f" {'.'.join(str(v) for v in version)} - run: python -m toxdoor signatures")
+        return None
+
+    module = ModuleType(name, __doc__); ns = module.__dict__
+    ns.update(_libraries={'FIXME_STUB': lib}, FIXME_STUB=lib, POINTER_T=POINTER)
+
+    types = {}
+
+    for struct_name, (kind, pack, _) in table['structs'].items():
+        attrs = {'__module__': name}
+        if pack:
+            attrs['_pack_'] = pack
+        types['S', struct_name] = type(struct_name, (Union if kind == 'union' else Structure,), attrs)
+
+    def build(d):
+        if d is None:
+            return None
+        if (ct := types.get(d)) is None:
+            if isinstance(d, str):
+                ct = getattr(ctypes, d)
+            elif d[0] == 'P':
+                ct = POINTER(build(d[1]))
+            elif d[0] == 'A':
+                ct = build(d[1]) * d[2]
+            elif d[0] == 'F':
+                ct = CFUNCTYPE(build(d[1]), *(build(a) for a in d[2]))
+            else:
+                raise TypeError(f"{path}: {d!r}: bad descriptor")
+            types[d] = ct
+        return ct
+
+    for struct_name, (_, _, fields) in table['structs'].items():
+        if fields is not None:
+            types['S', struct_name]._fields_ = [ (f[0], build(f[1]), *f[2:]) for f in fields ]
+
+    lazy = {}
+
+    for attr, entry in table['names'].items():
+        if entry[0] == 't':
+            ns[attr] = build(entry[1])
+        elif entry[0] == 'v':
+            ns[attr] = entry[1]
+        else:
+            lazy[attr] = partial(_function, lib, attr, build, *entry[1:])
+
+    return module, lazy
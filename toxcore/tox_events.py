@@ -0,0 +1,3062 @@
+# hand-written after the clang2py output of tox_lin.py/tox_win.py for the headers the generator run did not include:
+# c-toxcore/toxcore/tox_events.h c-toxcore/toxcore/tox_dispatch.h (c-toxcore v0.2.21, ABI checked against libtoxcore)
+# -*- coding: utf-8 -*-
+#
+import ctypes
+
+from . import tox as _tox;  # Биндинги tox.h уже загружены (tox_lin/tox_win): общие POINTER_T, struct_Tox, перечисления
+from . import FIXME_STUB
+
+_libraries = {}
+_libraries.update(FIXME_STUB = FIXME_STUB)
+
+POINTER_T = _tox.POINTER_T
+Structure = ctypes.Structure
+
+struct_Tox = _tox.struct_Tox
+
+Tox_Connection = _tox.Tox_Connection
+Tox_User_Status = _tox.Tox_User_Status
+Tox_Message_Type = _tox.Tox_Message_Type
+Tox_File_Control = _tox.Tox_File_Control
+Tox_Conference_Type = _tox.Tox_Conference_Type
+Tox_Group_Privacy_State = _tox.Tox_Group_Privacy_State
+Tox_Group_Voice_State = _tox.Tox_Group_Voice_State
+Tox_Group_Topic_Lock = _tox.Tox_Group_Topic_Lock
+Tox_Group_Exit_Type = _tox.Tox_Group_Exit_Type
+Tox_Group_Join_Fail = _tox.Tox_Group_Join_Fail
+Tox_Group_Mod_Event = _tox.Tox_Group_Mod_Event
+
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Events(Structure):
+    pass
+
+Tox_Events = struct_Tox_Events
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event(Structure):
+    pass
+
+Tox_Event = struct_Tox_Event
+
+# c-toxcore/toxcore/tox_events.h
+
+# values for enumeration 'Tox_Event_Type'
+Tox_Event_Type__enumvalues = {
+    0: 'TOX_EVENT_SELF_CONNECTION_STATUS',
+    1: 'TOX_EVENT_FRIEND_REQUEST',
+    2: 'TOX_EVENT_FRIEND_CONNECTION_STATUS',
+    3: 'TOX_EVENT_FRIEND_LOSSY_PACKET',
+    4: 'TOX_EVENT_FRIEND_LOSSLESS_PACKET',
+    5: 'TOX_EVENT_FRIEND_NAME',
+    6: 'TOX_EVENT_FRIEND_STATUS',
+    7: 'TOX_EVENT_FRIEND_STATUS_MESSAGE',
+    8: 'TOX_EVENT_FRIEND_MESSAGE',
+    9: 'TOX_EVENT_FRIEND_READ_RECEIPT',
+    10: 'TOX_EVENT_FRIEND_TYPING',
+    11: 'TOX_EVENT_FILE_CHUNK_REQUEST',
+    12: 'TOX_EVENT_FILE_RECV',
+    13: 'TOX_EVENT_FILE_RECV_CHUNK',
+    14: 'TOX_EVENT_FILE_RECV_CONTROL',
+    15: 'TOX_EVENT_CONFERENCE_INVITE',
+    16: 'TOX_EVENT_CONFERENCE_CONNECTED',
+    17: 'TOX_EVENT_CONFERENCE_PEER_LIST_CHANGED',
+    18: 'TOX_EVENT_CONFERENCE_PEER_NAME',
+    19: 'TOX_EVENT_CONFERENCE_TITLE',
+    20: 'TOX_EVENT_CONFERENCE_MESSAGE',
+    21: 'TOX_EVENT_GROUP_PEER_NAME',
+    22: 'TOX_EVENT_GROUP_PEER_STATUS',
+    23: 'TOX_EVENT_GROUP_TOPIC',
+    24: 'TOX_EVENT_GROUP_PRIVACY_STATE',
+    25: 'TOX_EVENT_GROUP_VOICE_STATE',
+    26: 'TOX_EVENT_GROUP_TOPIC_LOCK',
+    27: 'TOX_EVENT_GROUP_PEER_LIMIT',
+    28: 'TOX_EVENT_GROUP_PASSWORD',
+    29: 'TOX_EVENT_GROUP_MESSAGE',
+    30: 'TOX_EVENT_GROUP_PRIVATE_MESSAGE',
+    31: 'TOX_EVENT_GROUP_CUSTOM_PACKET',
+    32: 'TOX_EVENT_GROUP_CUSTOM_PRIVATE_PACKET',
+    33: 'TOX_EVENT_GROUP_INVITE',
+    34: 'TOX_EVENT_GROUP_PEER_JOIN',
+    35: 'TOX_EVENT_GROUP_PEER_EXIT',
+    36: 'TOX_EVENT_GROUP_SELF_JOIN',
+    37: 'TOX_EVENT_GROUP_JOIN_FAIL',
+    38: 'TOX_EVENT_GROUP_MODERATION',
+    39: 'TOX_EVENT_DHT_NODES_RESPONSE',
+    255: 'TOX_EVENT_INVALID',
+}
+TOX_EVENT_SELF_CONNECTION_STATUS = 0
+TOX_EVENT_FRIEND_REQUEST = 1
+TOX_EVENT_FRIEND_CONNECTION_STATUS = 2
+TOX_EVENT_FRIEND_LOSSY_PACKET = 3
+TOX_EVENT_FRIEND_LOSSLESS_PACKET = 4
+TOX_EVENT_FRIEND_NAME = 5
+TOX_EVENT_FRIEND_STATUS = 6
+TOX_EVENT_FRIEND_STATUS_MESSAGE = 7
+TOX_EVENT_FRIEND_MESSAGE = 8
+TOX_EVENT_FRIEND_READ_RECEIPT = 9
+TOX_EVENT_FRIEND_TYPING = 10
+TOX_EVENT_FILE_CHUNK_REQUEST = 11
+TOX_EVENT_FILE_RECV = 12
+TOX_EVENT_FILE_RECV_CHUNK = 13
+TOX_EVENT_FILE_RECV_CONTROL = 14
+TOX_EVENT_CONFERENCE_INVITE = 15
+TOX_EVENT_CONFERENCE_CONNECTED = 16
+TOX_EVENT_CONFERENCE_PEER_LIST_CHANGED = 17
+TOX_EVENT_CONFERENCE_PEER_NAME = 18
+TOX_EVENT_CONFERENCE_TITLE = 19
+TOX_EVENT_CONFERENCE_MESSAGE = 20
+TOX_EVENT_GROUP_PEER_NAME = 21
+TOX_EVENT_GROUP_PEER_STATUS = 22
+TOX_EVENT_GROUP_TOPIC = 23
+TOX_EVENT_GROUP_PRIVACY_STATE = 24
+TOX_EVENT_GROUP_VOICE_STATE = 25
+TOX_EVENT_GROUP_TOPIC_LOCK = 26
+TOX_EVENT_GROUP_PEER_LIMIT = 27
+TOX_EVENT_GROUP_PASSWORD = 28
+TOX_EVENT_GROUP_MESSAGE = 29
+TOX_EVENT_GROUP_PRIVATE_MESSAGE = 30
+TOX_EVENT_GROUP_CUSTOM_PACKET = 31
+TOX_EVENT_GROUP_CUSTOM_PRIVATE_PACKET = 32
+TOX_EVENT_GROUP_INVITE = 33
+TOX_EVENT_GROUP_PEER_JOIN = 34
+TOX_EVENT_GROUP_PEER_EXIT = 35
+TOX_EVENT_GROUP_SELF_JOIN = 36
+TOX_EVENT_GROUP_JOIN_FAIL = 37
+TOX_EVENT_GROUP_MODERATION = 38
+TOX_EVENT_DHT_NODES_RESPONSE = 39
+TOX_EVENT_INVALID = 255
+Tox_Event_Type = ctypes.c_uint32 # enum
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_type_to_string = _libraries['FIXME_STUB'].tox_event_type_to_string
+    tox_event_type_to_string.restype = POINTER_T(ctypes.c_char)
+# tox_event_type_to_string(value)
+    tox_event_type_to_string.argtypes = [Tox_Event_Type]
+except AttributeError:
+    pass
+tox_event_type_to_string.__doc__ = """LP_c_char tox_event_type_to_string(Tox_Event_Type value)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_events_get_size = _libraries['FIXME_STUB'].tox_events_get_size
+    tox_events_get_size.restype = ctypes.c_uint32
+# tox_events_get_size(events)
+    tox_events_get_size.argtypes = [POINTER_T(struct_Tox_Events)]
+except AttributeError:
+    pass
+tox_events_get_size.__doc__ = """c_uint32 tox_events_get_size(LP_struct_Tox_Events events)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_events_get = _libraries['FIXME_STUB'].tox_events_get
+    tox_events_get.restype = POINTER_T(struct_Tox_Event)
+# tox_events_get(events, index)
+    tox_events_get.argtypes = [POINTER_T(struct_Tox_Events), ctypes.c_uint32]
+except AttributeError:
+    pass
+tox_events_get.__doc__ = """LP_struct_Tox_Event tox_events_get(LP_struct_Tox_Events events, c_uint32 index)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_type = _libraries['FIXME_STUB'].tox_event_get_type
+    tox_event_get_type.restype = Tox_Event_Type
+# tox_event_get_type(event)
+    tox_event_get_type.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_type.__doc__ = """Tox_Event_Type tox_event_get_type(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Self_Connection_Status(Structure):
+    pass
+
+Tox_Event_Self_Connection_Status = struct_Tox_Event_Self_Connection_Status
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_self_connection_status_get_connection_status = _libraries['FIXME_STUB'].tox_event_self_connection_status_get_connection_status
+    tox_event_self_connection_status_get_connection_status.restype = Tox_Connection
+# tox_event_self_connection_status_get_connection_status(self_connection_status)
+    tox_event_self_connection_status_get_connection_status.argtypes = [POINTER_T(struct_Tox_Event_Self_Connection_Status)]
+except AttributeError:
+    pass
+tox_event_self_connection_status_get_connection_status.__doc__ = """Tox_Connection tox_event_self_connection_status_get_connection_status(LP_struct_Tox_Event_Self_Connection_Status self_connection_status)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_self_connection_status = _libraries['FIXME_STUB'].tox_event_get_self_connection_status
+    tox_event_get_self_connection_status.restype = POINTER_T(struct_Tox_Event_Self_Connection_Status)
+# tox_event_get_self_connection_status(event)
+    tox_event_get_self_connection_status.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_self_connection_status.__doc__ = """LP_struct_Tox_Event_Self_Connection_Status tox_event_get_self_connection_status(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Request(Structure):
+    pass
+
+Tox_Event_Friend_Request = struct_Tox_Event_Friend_Request
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_request_get_public_key = _libraries['FIXME_STUB'].tox_event_friend_request_get_public_key
+    tox_event_friend_request_get_public_key.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_friend_request_get_public_key(friend_request)
+    tox_event_friend_request_get_public_key.argtypes = [POINTER_T(struct_Tox_Event_Friend_Request)]
+except AttributeError:
+    pass
+tox_event_friend_request_get_public_key.__doc__ = """LP_c_ubyte tox_event_friend_request_get_public_key(LP_struct_Tox_Event_Friend_Request friend_request)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_request_get_message = _libraries['FIXME_STUB'].tox_event_friend_request_get_message
+    tox_event_friend_request_get_message.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_friend_request_get_message(friend_request)
+    tox_event_friend_request_get_message.argtypes = [POINTER_T(struct_Tox_Event_Friend_Request)]
+except AttributeError:
+    pass
+tox_event_friend_request_get_message.__doc__ = """LP_c_ubyte tox_event_friend_request_get_message(LP_struct_Tox_Event_Friend_Request friend_request)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_request_get_message_length = _libraries['FIXME_STUB'].tox_event_friend_request_get_message_length
+    tox_event_friend_request_get_message_length.restype = ctypes.c_uint32
+# tox_event_friend_request_get_message_length(friend_request)
+    tox_event_friend_request_get_message_length.argtypes = [POINTER_T(struct_Tox_Event_Friend_Request)]
+except AttributeError:
+    pass
+tox_event_friend_request_get_message_length.__doc__ = """c_uint32 tox_event_friend_request_get_message_length(LP_struct_Tox_Event_Friend_Request friend_request)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_request = _libraries['FIXME_STUB'].tox_event_get_friend_request
+    tox_event_get_friend_request.restype = POINTER_T(struct_Tox_Event_Friend_Request)
+# tox_event_get_friend_request(event)
+    tox_event_get_friend_request.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_request.__doc__ = """LP_struct_Tox_Event_Friend_Request tox_event_get_friend_request(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Connection_Status(Structure):
+    pass
+
+Tox_Event_Friend_Connection_Status = struct_Tox_Event_Friend_Connection_Status
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_connection_status_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_connection_status_get_friend_number
+    tox_event_friend_connection_status_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_connection_status_get_friend_number(friend_connection_status)
+    tox_event_friend_connection_status_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Connection_Status)]
+except AttributeError:
+    pass
+tox_event_friend_connection_status_get_friend_number.__doc__ = """c_uint32 tox_event_friend_connection_status_get_friend_number(LP_struct_Tox_Event_Friend_Connection_Status friend_connection_status)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_connection_status_get_connection_status = _libraries['FIXME_STUB'].tox_event_friend_connection_status_get_connection_status
+    tox_event_friend_connection_status_get_connection_status.restype = Tox_Connection
+# tox_event_friend_connection_status_get_connection_status(friend_connection_status)
+    tox_event_friend_connection_status_get_connection_status.argtypes = [POINTER_T(struct_Tox_Event_Friend_Connection_Status)]
+except AttributeError:
+    pass
+tox_event_friend_connection_status_get_connection_status.__doc__ = """Tox_Connection tox_event_friend_connection_status_get_connection_status(LP_struct_Tox_Event_Friend_Connection_Status friend_connection_status)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_connection_status = _libraries['FIXME_STUB'].tox_event_get_friend_connection_status
+    tox_event_get_friend_connection_status.restype = POINTER_T(struct_Tox_Event_Friend_Connection_Status)
+# tox_event_get_friend_connection_status(event)
+    tox_event_get_friend_connection_status.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_connection_status.__doc__ = """LP_struct_Tox_Event_Friend_Connection_Status tox_event_get_friend_connection_status(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Lossy_Packet(Structure):
+    pass
+
+Tox_Event_Friend_Lossy_Packet = struct_Tox_Event_Friend_Lossy_Packet
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_lossy_packet_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_lossy_packet_get_friend_number
+    tox_event_friend_lossy_packet_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_lossy_packet_get_friend_number(friend_lossy_packet)
+    tox_event_friend_lossy_packet_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Lossy_Packet)]
+except AttributeError:
+    pass
+tox_event_friend_lossy_packet_get_friend_number.__doc__ = """c_uint32 tox_event_friend_lossy_packet_get_friend_number(LP_struct_Tox_Event_Friend_Lossy_Packet friend_lossy_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_lossy_packet_get_data = _libraries['FIXME_STUB'].tox_event_friend_lossy_packet_get_data
+    tox_event_friend_lossy_packet_get_data.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_friend_lossy_packet_get_data(friend_lossy_packet)
+    tox_event_friend_lossy_packet_get_data.argtypes = [POINTER_T(struct_Tox_Event_Friend_Lossy_Packet)]
+except AttributeError:
+    pass
+tox_event_friend_lossy_packet_get_data.__doc__ = """LP_c_ubyte tox_event_friend_lossy_packet_get_data(LP_struct_Tox_Event_Friend_Lossy_Packet friend_lossy_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_lossy_packet_get_data_length = _libraries['FIXME_STUB'].tox_event_friend_lossy_packet_get_data_length
+    tox_event_friend_lossy_packet_get_data_length.restype = ctypes.c_uint32
+# tox_event_friend_lossy_packet_get_data_length(friend_lossy_packet)
+    tox_event_friend_lossy_packet_get_data_length.argtypes = [POINTER_T(struct_Tox_Event_Friend_Lossy_Packet)]
+except AttributeError:
+    pass
+tox_event_friend_lossy_packet_get_data_length.__doc__ = """c_uint32 tox_event_friend_lossy_packet_get_data_length(LP_struct_Tox_Event_Friend_Lossy_Packet friend_lossy_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_lossy_packet = _libraries['FIXME_STUB'].tox_event_get_friend_lossy_packet
+    tox_event_get_friend_lossy_packet.restype = POINTER_T(struct_Tox_Event_Friend_Lossy_Packet)
+# tox_event_get_friend_lossy_packet(event)
+    tox_event_get_friend_lossy_packet.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_lossy_packet.__doc__ = """LP_struct_Tox_Event_Friend_Lossy_Packet tox_event_get_friend_lossy_packet(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Lossless_Packet(Structure):
+    pass
+
+Tox_Event_Friend_Lossless_Packet = struct_Tox_Event_Friend_Lossless_Packet
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_lossless_packet_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_lossless_packet_get_friend_number
+    tox_event_friend_lossless_packet_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_lossless_packet_get_friend_number(friend_lossless_packet)
+    tox_event_friend_lossless_packet_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Lossless_Packet)]
+except AttributeError:
+    pass
+tox_event_friend_lossless_packet_get_friend_number.__doc__ = """c_uint32 tox_event_friend_lossless_packet_get_friend_number(LP_struct_Tox_Event_Friend_Lossless_Packet friend_lossless_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_lossless_packet_get_data = _libraries['FIXME_STUB'].tox_event_friend_lossless_packet_get_data
+    tox_event_friend_lossless_packet_get_data.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_friend_lossless_packet_get_data(friend_lossless_packet)
+    tox_event_friend_lossless_packet_get_data.argtypes = [POINTER_T(struct_Tox_Event_Friend_Lossless_Packet)]
+except AttributeError:
+    pass
+tox_event_friend_lossless_packet_get_data.__doc__ = """LP_c_ubyte tox_event_friend_lossless_packet_get_data(LP_struct_Tox_Event_Friend_Lossless_Packet friend_lossless_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_lossless_packet_get_data_length = _libraries['FIXME_STUB'].tox_event_friend_lossless_packet_get_data_length
+    tox_event_friend_lossless_packet_get_data_length.restype = ctypes.c_uint32
+# tox_event_friend_lossless_packet_get_data_length(friend_lossless_packet)
+    tox_event_friend_lossless_packet_get_data_length.argtypes = [POINTER_T(struct_Tox_Event_Friend_Lossless_Packet)]
+except AttributeError:
+    pass
+tox_event_friend_lossless_packet_get_data_length.__doc__ = """c_uint32 tox_event_friend_lossless_packet_get_data_length(LP_struct_Tox_Event_Friend_Lossless_Packet friend_lossless_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_lossless_packet = _libraries['FIXME_STUB'].tox_event_get_friend_lossless_packet
+    tox_event_get_friend_lossless_packet.restype = POINTER_T(struct_Tox_Event_Friend_Lossless_Packet)
+# tox_event_get_friend_lossless_packet(event)
+    tox_event_get_friend_lossless_packet.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_lossless_packet.__doc__ = """LP_struct_Tox_Event_Friend_Lossless_Packet tox_event_get_friend_lossless_packet(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Name(Structure):
+    pass
+
+Tox_Event_Friend_Name = struct_Tox_Event_Friend_Name
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_name_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_name_get_friend_number
+    tox_event_friend_name_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_name_get_friend_number(friend_name)
+    tox_event_friend_name_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Name)]
+except AttributeError:
+    pass
+tox_event_friend_name_get_friend_number.__doc__ = """c_uint32 tox_event_friend_name_get_friend_number(LP_struct_Tox_Event_Friend_Name friend_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_name_get_name = _libraries['FIXME_STUB'].tox_event_friend_name_get_name
+    tox_event_friend_name_get_name.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_friend_name_get_name(friend_name)
+    tox_event_friend_name_get_name.argtypes = [POINTER_T(struct_Tox_Event_Friend_Name)]
+except AttributeError:
+    pass
+tox_event_friend_name_get_name.__doc__ = """LP_c_ubyte tox_event_friend_name_get_name(LP_struct_Tox_Event_Friend_Name friend_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_name_get_name_length = _libraries['FIXME_STUB'].tox_event_friend_name_get_name_length
+    tox_event_friend_name_get_name_length.restype = ctypes.c_uint32
+# tox_event_friend_name_get_name_length(friend_name)
+    tox_event_friend_name_get_name_length.argtypes = [POINTER_T(struct_Tox_Event_Friend_Name)]
+except AttributeError:
+    pass
+tox_event_friend_name_get_name_length.__doc__ = """c_uint32 tox_event_friend_name_get_name_length(LP_struct_Tox_Event_Friend_Name friend_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_name = _libraries['FIXME_STUB'].tox_event_get_friend_name
+    tox_event_get_friend_name.restype = POINTER_T(struct_Tox_Event_Friend_Name)
+# tox_event_get_friend_name(event)
+    tox_event_get_friend_name.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_name.__doc__ = """LP_struct_Tox_Event_Friend_Name tox_event_get_friend_name(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Status(Structure):
+    pass
+
+Tox_Event_Friend_Status = struct_Tox_Event_Friend_Status
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_status_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_status_get_friend_number
+    tox_event_friend_status_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_status_get_friend_number(friend_status)
+    tox_event_friend_status_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Status)]
+except AttributeError:
+    pass
+tox_event_friend_status_get_friend_number.__doc__ = """c_uint32 tox_event_friend_status_get_friend_number(LP_struct_Tox_Event_Friend_Status friend_status)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_status_get_status = _libraries['FIXME_STUB'].tox_event_friend_status_get_status
+    tox_event_friend_status_get_status.restype = Tox_User_Status
+# tox_event_friend_status_get_status(friend_status)
+    tox_event_friend_status_get_status.argtypes = [POINTER_T(struct_Tox_Event_Friend_Status)]
+except AttributeError:
+    pass
+tox_event_friend_status_get_status.__doc__ = """Tox_User_Status tox_event_friend_status_get_status(LP_struct_Tox_Event_Friend_Status friend_status)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_status = _libraries['FIXME_STUB'].tox_event_get_friend_status
+    tox_event_get_friend_status.restype = POINTER_T(struct_Tox_Event_Friend_Status)
+# tox_event_get_friend_status(event)
+    tox_event_get_friend_status.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_status.__doc__ = """LP_struct_Tox_Event_Friend_Status tox_event_get_friend_status(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Status_Message(Structure):
+    pass
+
+Tox_Event_Friend_Status_Message = struct_Tox_Event_Friend_Status_Message
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_status_message_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_status_message_get_friend_number
+    tox_event_friend_status_message_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_status_message_get_friend_number(friend_status_message)
+    tox_event_friend_status_message_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Status_Message)]
+except AttributeError:
+    pass
+tox_event_friend_status_message_get_friend_number.__doc__ = """c_uint32 tox_event_friend_status_message_get_friend_number(LP_struct_Tox_Event_Friend_Status_Message friend_status_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_status_message_get_message = _libraries['FIXME_STUB'].tox_event_friend_status_message_get_message
+    tox_event_friend_status_message_get_message.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_friend_status_message_get_message(friend_status_message)
+    tox_event_friend_status_message_get_message.argtypes = [POINTER_T(struct_Tox_Event_Friend_Status_Message)]
+except AttributeError:
+    pass
+tox_event_friend_status_message_get_message.__doc__ = """LP_c_ubyte tox_event_friend_status_message_get_message(LP_struct_Tox_Event_Friend_Status_Message friend_status_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_status_message_get_message_length = _libraries['FIXME_STUB'].tox_event_friend_status_message_get_message_length
+    tox_event_friend_status_message_get_message_length.restype = ctypes.c_uint32
+# tox_event_friend_status_message_get_message_length(friend_status_message)
+    tox_event_friend_status_message_get_message_length.argtypes = [POINTER_T(struct_Tox_Event_Friend_Status_Message)]
+except AttributeError:
+    pass
+tox_event_friend_status_message_get_message_length.__doc__ = """c_uint32 tox_event_friend_status_message_get_message_length(LP_struct_Tox_Event_Friend_Status_Message friend_status_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_status_message = _libraries['FIXME_STUB'].tox_event_get_friend_status_message
+    tox_event_get_friend_status_message.restype = POINTER_T(struct_Tox_Event_Friend_Status_Message)
+# tox_event_get_friend_status_message(event)
+    tox_event_get_friend_status_message.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_status_message.__doc__ = """LP_struct_Tox_Event_Friend_Status_Message tox_event_get_friend_status_message(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Message(Structure):
+    pass
+
+Tox_Event_Friend_Message = struct_Tox_Event_Friend_Message
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_message_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_message_get_friend_number
+    tox_event_friend_message_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_message_get_friend_number(friend_message)
+    tox_event_friend_message_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Message)]
+except AttributeError:
+    pass
+tox_event_friend_message_get_friend_number.__doc__ = """c_uint32 tox_event_friend_message_get_friend_number(LP_struct_Tox_Event_Friend_Message friend_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_message_get_type = _libraries['FIXME_STUB'].tox_event_friend_message_get_type
+    tox_event_friend_message_get_type.restype = Tox_Message_Type
+# tox_event_friend_message_get_type(friend_message)
+    tox_event_friend_message_get_type.argtypes = [POINTER_T(struct_Tox_Event_Friend_Message)]
+except AttributeError:
+    pass
+tox_event_friend_message_get_type.__doc__ = """Tox_Message_Type tox_event_friend_message_get_type(LP_struct_Tox_Event_Friend_Message friend_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_message_get_message = _libraries['FIXME_STUB'].tox_event_friend_message_get_message
+    tox_event_friend_message_get_message.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_friend_message_get_message(friend_message)
+    tox_event_friend_message_get_message.argtypes = [POINTER_T(struct_Tox_Event_Friend_Message)]
+except AttributeError:
+    pass
+tox_event_friend_message_get_message.__doc__ = """LP_c_ubyte tox_event_friend_message_get_message(LP_struct_Tox_Event_Friend_Message friend_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_message_get_message_length = _libraries['FIXME_STUB'].tox_event_friend_message_get_message_length
+    tox_event_friend_message_get_message_length.restype = ctypes.c_uint32
+# tox_event_friend_message_get_message_length(friend_message)
+    tox_event_friend_message_get_message_length.argtypes = [POINTER_T(struct_Tox_Event_Friend_Message)]
+except AttributeError:
+    pass
+tox_event_friend_message_get_message_length.__doc__ = """c_uint32 tox_event_friend_message_get_message_length(LP_struct_Tox_Event_Friend_Message friend_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_message = _libraries['FIXME_STUB'].tox_event_get_friend_message
+    tox_event_get_friend_message.restype = POINTER_T(struct_Tox_Event_Friend_Message)
+# tox_event_get_friend_message(event)
+    tox_event_get_friend_message.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_message.__doc__ = """LP_struct_Tox_Event_Friend_Message tox_event_get_friend_message(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Read_Receipt(Structure):
+    pass
+
+Tox_Event_Friend_Read_Receipt = struct_Tox_Event_Friend_Read_Receipt
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_read_receipt_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_read_receipt_get_friend_number
+    tox_event_friend_read_receipt_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_read_receipt_get_friend_number(friend_read_receipt)
+    tox_event_friend_read_receipt_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Read_Receipt)]
+except AttributeError:
+    pass
+tox_event_friend_read_receipt_get_friend_number.__doc__ = """c_uint32 tox_event_friend_read_receipt_get_friend_number(LP_struct_Tox_Event_Friend_Read_Receipt friend_read_receipt)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_read_receipt_get_message_id = _libraries['FIXME_STUB'].tox_event_friend_read_receipt_get_message_id
+    tox_event_friend_read_receipt_get_message_id.restype = ctypes.c_uint32
+# tox_event_friend_read_receipt_get_message_id(friend_read_receipt)
+    tox_event_friend_read_receipt_get_message_id.argtypes = [POINTER_T(struct_Tox_Event_Friend_Read_Receipt)]
+except AttributeError:
+    pass
+tox_event_friend_read_receipt_get_message_id.__doc__ = """c_uint32 tox_event_friend_read_receipt_get_message_id(LP_struct_Tox_Event_Friend_Read_Receipt friend_read_receipt)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_read_receipt = _libraries['FIXME_STUB'].tox_event_get_friend_read_receipt
+    tox_event_get_friend_read_receipt.restype = POINTER_T(struct_Tox_Event_Friend_Read_Receipt)
+# tox_event_get_friend_read_receipt(event)
+    tox_event_get_friend_read_receipt.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_read_receipt.__doc__ = """LP_struct_Tox_Event_Friend_Read_Receipt tox_event_get_friend_read_receipt(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Friend_Typing(Structure):
+    pass
+
+Tox_Event_Friend_Typing = struct_Tox_Event_Friend_Typing
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_typing_get_friend_number = _libraries['FIXME_STUB'].tox_event_friend_typing_get_friend_number
+    tox_event_friend_typing_get_friend_number.restype = ctypes.c_uint32
+# tox_event_friend_typing_get_friend_number(friend_typing)
+    tox_event_friend_typing_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Friend_Typing)]
+except AttributeError:
+    pass
+tox_event_friend_typing_get_friend_number.__doc__ = """c_uint32 tox_event_friend_typing_get_friend_number(LP_struct_Tox_Event_Friend_Typing friend_typing)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_friend_typing_get_typing = _libraries['FIXME_STUB'].tox_event_friend_typing_get_typing
+    tox_event_friend_typing_get_typing.restype = ctypes.c_bool
+# tox_event_friend_typing_get_typing(friend_typing)
+    tox_event_friend_typing_get_typing.argtypes = [POINTER_T(struct_Tox_Event_Friend_Typing)]
+except AttributeError:
+    pass
+tox_event_friend_typing_get_typing.__doc__ = """c_bool tox_event_friend_typing_get_typing(LP_struct_Tox_Event_Friend_Typing friend_typing)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_friend_typing = _libraries['FIXME_STUB'].tox_event_get_friend_typing
+    tox_event_get_friend_typing.restype = POINTER_T(struct_Tox_Event_Friend_Typing)
+# tox_event_get_friend_typing(event)
+    tox_event_get_friend_typing.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_friend_typing.__doc__ = """LP_struct_Tox_Event_Friend_Typing tox_event_get_friend_typing(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_File_Chunk_Request(Structure):
+    pass
+
+Tox_Event_File_Chunk_Request = struct_Tox_Event_File_Chunk_Request
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_chunk_request_get_friend_number = _libraries['FIXME_STUB'].tox_event_file_chunk_request_get_friend_number
+    tox_event_file_chunk_request_get_friend_number.restype = ctypes.c_uint32
+# tox_event_file_chunk_request_get_friend_number(file_chunk_request)
+    tox_event_file_chunk_request_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_File_Chunk_Request)]
+except AttributeError:
+    pass
+tox_event_file_chunk_request_get_friend_number.__doc__ = """c_uint32 tox_event_file_chunk_request_get_friend_number(LP_struct_Tox_Event_File_Chunk_Request file_chunk_request)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_chunk_request_get_file_number = _libraries['FIXME_STUB'].tox_event_file_chunk_request_get_file_number
+    tox_event_file_chunk_request_get_file_number.restype = ctypes.c_uint32
+# tox_event_file_chunk_request_get_file_number(file_chunk_request)
+    tox_event_file_chunk_request_get_file_number.argtypes = [POINTER_T(struct_Tox_Event_File_Chunk_Request)]
+except AttributeError:
+    pass
+tox_event_file_chunk_request_get_file_number.__doc__ = """c_uint32 tox_event_file_chunk_request_get_file_number(LP_struct_Tox_Event_File_Chunk_Request file_chunk_request)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_chunk_request_get_position = _libraries['FIXME_STUB'].tox_event_file_chunk_request_get_position
+    tox_event_file_chunk_request_get_position.restype = ctypes.c_uint64
+# tox_event_file_chunk_request_get_position(file_chunk_request)
+    tox_event_file_chunk_request_get_position.argtypes = [POINTER_T(struct_Tox_Event_File_Chunk_Request)]
+except AttributeError:
+    pass
+tox_event_file_chunk_request_get_position.__doc__ = """c_uint64 tox_event_file_chunk_request_get_position(LP_struct_Tox_Event_File_Chunk_Request file_chunk_request)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_chunk_request_get_length = _libraries['FIXME_STUB'].tox_event_file_chunk_request_get_length
+    tox_event_file_chunk_request_get_length.restype = ctypes.c_uint16
+# tox_event_file_chunk_request_get_length(file_chunk_request)
+    tox_event_file_chunk_request_get_length.argtypes = [POINTER_T(struct_Tox_Event_File_Chunk_Request)]
+except AttributeError:
+    pass
+tox_event_file_chunk_request_get_length.__doc__ = """c_uint16 tox_event_file_chunk_request_get_length(LP_struct_Tox_Event_File_Chunk_Request file_chunk_request)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_file_chunk_request = _libraries['FIXME_STUB'].tox_event_get_file_chunk_request
+    tox_event_get_file_chunk_request.restype = POINTER_T(struct_Tox_Event_File_Chunk_Request)
+# tox_event_get_file_chunk_request(event)
+    tox_event_get_file_chunk_request.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_file_chunk_request.__doc__ = """LP_struct_Tox_Event_File_Chunk_Request tox_event_get_file_chunk_request(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_File_Recv(Structure):
+    pass
+
+Tox_Event_File_Recv = struct_Tox_Event_File_Recv
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_get_friend_number = _libraries['FIXME_STUB'].tox_event_file_recv_get_friend_number
+    tox_event_file_recv_get_friend_number.restype = ctypes.c_uint32
+# tox_event_file_recv_get_friend_number(file_recv)
+    tox_event_file_recv_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_File_Recv)]
+except AttributeError:
+    pass
+tox_event_file_recv_get_friend_number.__doc__ = """c_uint32 tox_event_file_recv_get_friend_number(LP_struct_Tox_Event_File_Recv file_recv)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_get_file_number = _libraries['FIXME_STUB'].tox_event_file_recv_get_file_number
+    tox_event_file_recv_get_file_number.restype = ctypes.c_uint32
+# tox_event_file_recv_get_file_number(file_recv)
+    tox_event_file_recv_get_file_number.argtypes = [POINTER_T(struct_Tox_Event_File_Recv)]
+except AttributeError:
+    pass
+tox_event_file_recv_get_file_number.__doc__ = """c_uint32 tox_event_file_recv_get_file_number(LP_struct_Tox_Event_File_Recv file_recv)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_get_kind = _libraries['FIXME_STUB'].tox_event_file_recv_get_kind
+    tox_event_file_recv_get_kind.restype = ctypes.c_uint32
+# tox_event_file_recv_get_kind(file_recv)
+    tox_event_file_recv_get_kind.argtypes = [POINTER_T(struct_Tox_Event_File_Recv)]
+except AttributeError:
+    pass
+tox_event_file_recv_get_kind.__doc__ = """c_uint32 tox_event_file_recv_get_kind(LP_struct_Tox_Event_File_Recv file_recv)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_get_file_size = _libraries['FIXME_STUB'].tox_event_file_recv_get_file_size
+    tox_event_file_recv_get_file_size.restype = ctypes.c_uint64
+# tox_event_file_recv_get_file_size(file_recv)
+    tox_event_file_recv_get_file_size.argtypes = [POINTER_T(struct_Tox_Event_File_Recv)]
+except AttributeError:
+    pass
+tox_event_file_recv_get_file_size.__doc__ = """c_uint64 tox_event_file_recv_get_file_size(LP_struct_Tox_Event_File_Recv file_recv)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_get_filename = _libraries['FIXME_STUB'].tox_event_file_recv_get_filename
+    tox_event_file_recv_get_filename.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_file_recv_get_filename(file_recv)
+    tox_event_file_recv_get_filename.argtypes = [POINTER_T(struct_Tox_Event_File_Recv)]
+except AttributeError:
+    pass
+tox_event_file_recv_get_filename.__doc__ = """LP_c_ubyte tox_event_file_recv_get_filename(LP_struct_Tox_Event_File_Recv file_recv)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_get_filename_length = _libraries['FIXME_STUB'].tox_event_file_recv_get_filename_length
+    tox_event_file_recv_get_filename_length.restype = ctypes.c_uint32
+# tox_event_file_recv_get_filename_length(file_recv)
+    tox_event_file_recv_get_filename_length.argtypes = [POINTER_T(struct_Tox_Event_File_Recv)]
+except AttributeError:
+    pass
+tox_event_file_recv_get_filename_length.__doc__ = """c_uint32 tox_event_file_recv_get_filename_length(LP_struct_Tox_Event_File_Recv file_recv)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_file_recv = _libraries['FIXME_STUB'].tox_event_get_file_recv
+    tox_event_get_file_recv.restype = POINTER_T(struct_Tox_Event_File_Recv)
+# tox_event_get_file_recv(event)
+    tox_event_get_file_recv.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_file_recv.__doc__ = """LP_struct_Tox_Event_File_Recv tox_event_get_file_recv(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_File_Recv_Chunk(Structure):
+    pass
+
+Tox_Event_File_Recv_Chunk = struct_Tox_Event_File_Recv_Chunk
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_chunk_get_friend_number = _libraries['FIXME_STUB'].tox_event_file_recv_chunk_get_friend_number
+    tox_event_file_recv_chunk_get_friend_number.restype = ctypes.c_uint32
+# tox_event_file_recv_chunk_get_friend_number(file_recv_chunk)
+    tox_event_file_recv_chunk_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_File_Recv_Chunk)]
+except AttributeError:
+    pass
+tox_event_file_recv_chunk_get_friend_number.__doc__ = """c_uint32 tox_event_file_recv_chunk_get_friend_number(LP_struct_Tox_Event_File_Recv_Chunk file_recv_chunk)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_chunk_get_file_number = _libraries['FIXME_STUB'].tox_event_file_recv_chunk_get_file_number
+    tox_event_file_recv_chunk_get_file_number.restype = ctypes.c_uint32
+# tox_event_file_recv_chunk_get_file_number(file_recv_chunk)
+    tox_event_file_recv_chunk_get_file_number.argtypes = [POINTER_T(struct_Tox_Event_File_Recv_Chunk)]
+except AttributeError:
+    pass
+tox_event_file_recv_chunk_get_file_number.__doc__ = """c_uint32 tox_event_file_recv_chunk_get_file_number(LP_struct_Tox_Event_File_Recv_Chunk file_recv_chunk)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_chunk_get_position = _libraries['FIXME_STUB'].tox_event_file_recv_chunk_get_position
+    tox_event_file_recv_chunk_get_position.restype = ctypes.c_uint64
+# tox_event_file_recv_chunk_get_position(file_recv_chunk)
+    tox_event_file_recv_chunk_get_position.argtypes = [POINTER_T(struct_Tox_Event_File_Recv_Chunk)]
+except AttributeError:
+    pass
+tox_event_file_recv_chunk_get_position.__doc__ = """c_uint64 tox_event_file_recv_chunk_get_position(LP_struct_Tox_Event_File_Recv_Chunk file_recv_chunk)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_chunk_get_data = _libraries['FIXME_STUB'].tox_event_file_recv_chunk_get_data
+    tox_event_file_recv_chunk_get_data.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_file_recv_chunk_get_data(file_recv_chunk)
+    tox_event_file_recv_chunk_get_data.argtypes = [POINTER_T(struct_Tox_Event_File_Recv_Chunk)]
+except AttributeError:
+    pass
+tox_event_file_recv_chunk_get_data.__doc__ = """LP_c_ubyte tox_event_file_recv_chunk_get_data(LP_struct_Tox_Event_File_Recv_Chunk file_recv_chunk)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_chunk_get_data_length = _libraries['FIXME_STUB'].tox_event_file_recv_chunk_get_data_length
+    tox_event_file_recv_chunk_get_data_length.restype = ctypes.c_uint32
+# tox_event_file_recv_chunk_get_data_length(file_recv_chunk)
+    tox_event_file_recv_chunk_get_data_length.argtypes = [POINTER_T(struct_Tox_Event_File_Recv_Chunk)]
+except AttributeError:
+    pass
+tox_event_file_recv_chunk_get_data_length.__doc__ = """c_uint32 tox_event_file_recv_chunk_get_data_length(LP_struct_Tox_Event_File_Recv_Chunk file_recv_chunk)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_file_recv_chunk = _libraries['FIXME_STUB'].tox_event_get_file_recv_chunk
+    tox_event_get_file_recv_chunk.restype = POINTER_T(struct_Tox_Event_File_Recv_Chunk)
+# tox_event_get_file_recv_chunk(event)
+    tox_event_get_file_recv_chunk.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_file_recv_chunk.__doc__ = """LP_struct_Tox_Event_File_Recv_Chunk tox_event_get_file_recv_chunk(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_File_Recv_Control(Structure):
+    pass
+
+Tox_Event_File_Recv_Control = struct_Tox_Event_File_Recv_Control
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_control_get_friend_number = _libraries['FIXME_STUB'].tox_event_file_recv_control_get_friend_number
+    tox_event_file_recv_control_get_friend_number.restype = ctypes.c_uint32
+# tox_event_file_recv_control_get_friend_number(file_recv_control)
+    tox_event_file_recv_control_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_File_Recv_Control)]
+except AttributeError:
+    pass
+tox_event_file_recv_control_get_friend_number.__doc__ = """c_uint32 tox_event_file_recv_control_get_friend_number(LP_struct_Tox_Event_File_Recv_Control file_recv_control)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_control_get_file_number = _libraries['FIXME_STUB'].tox_event_file_recv_control_get_file_number
+    tox_event_file_recv_control_get_file_number.restype = ctypes.c_uint32
+# tox_event_file_recv_control_get_file_number(file_recv_control)
+    tox_event_file_recv_control_get_file_number.argtypes = [POINTER_T(struct_Tox_Event_File_Recv_Control)]
+except AttributeError:
+    pass
+tox_event_file_recv_control_get_file_number.__doc__ = """c_uint32 tox_event_file_recv_control_get_file_number(LP_struct_Tox_Event_File_Recv_Control file_recv_control)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_file_recv_control_get_control = _libraries['FIXME_STUB'].tox_event_file_recv_control_get_control
+    tox_event_file_recv_control_get_control.restype = Tox_File_Control
+# tox_event_file_recv_control_get_control(file_recv_control)
+    tox_event_file_recv_control_get_control.argtypes = [POINTER_T(struct_Tox_Event_File_Recv_Control)]
+except AttributeError:
+    pass
+tox_event_file_recv_control_get_control.__doc__ = """Tox_File_Control tox_event_file_recv_control_get_control(LP_struct_Tox_Event_File_Recv_Control file_recv_control)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_file_recv_control = _libraries['FIXME_STUB'].tox_event_get_file_recv_control
+    tox_event_get_file_recv_control.restype = POINTER_T(struct_Tox_Event_File_Recv_Control)
+# tox_event_get_file_recv_control(event)
+    tox_event_get_file_recv_control.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_file_recv_control.__doc__ = """LP_struct_Tox_Event_File_Recv_Control tox_event_get_file_recv_control(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Conference_Invite(Structure):
+    pass
+
+Tox_Event_Conference_Invite = struct_Tox_Event_Conference_Invite
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_invite_get_friend_number = _libraries['FIXME_STUB'].tox_event_conference_invite_get_friend_number
+    tox_event_conference_invite_get_friend_number.restype = ctypes.c_uint32
+# tox_event_conference_invite_get_friend_number(conference_invite)
+    tox_event_conference_invite_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Invite)]
+except AttributeError:
+    pass
+tox_event_conference_invite_get_friend_number.__doc__ = """c_uint32 tox_event_conference_invite_get_friend_number(LP_struct_Tox_Event_Conference_Invite conference_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_invite_get_type = _libraries['FIXME_STUB'].tox_event_conference_invite_get_type
+    tox_event_conference_invite_get_type.restype = Tox_Conference_Type
+# tox_event_conference_invite_get_type(conference_invite)
+    tox_event_conference_invite_get_type.argtypes = [POINTER_T(struct_Tox_Event_Conference_Invite)]
+except AttributeError:
+    pass
+tox_event_conference_invite_get_type.__doc__ = """Tox_Conference_Type tox_event_conference_invite_get_type(LP_struct_Tox_Event_Conference_Invite conference_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_invite_get_cookie = _libraries['FIXME_STUB'].tox_event_conference_invite_get_cookie
+    tox_event_conference_invite_get_cookie.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_conference_invite_get_cookie(conference_invite)
+    tox_event_conference_invite_get_cookie.argtypes = [POINTER_T(struct_Tox_Event_Conference_Invite)]
+except AttributeError:
+    pass
+tox_event_conference_invite_get_cookie.__doc__ = """LP_c_ubyte tox_event_conference_invite_get_cookie(LP_struct_Tox_Event_Conference_Invite conference_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_invite_get_cookie_length = _libraries['FIXME_STUB'].tox_event_conference_invite_get_cookie_length
+    tox_event_conference_invite_get_cookie_length.restype = ctypes.c_uint32
+# tox_event_conference_invite_get_cookie_length(conference_invite)
+    tox_event_conference_invite_get_cookie_length.argtypes = [POINTER_T(struct_Tox_Event_Conference_Invite)]
+except AttributeError:
+    pass
+tox_event_conference_invite_get_cookie_length.__doc__ = """c_uint32 tox_event_conference_invite_get_cookie_length(LP_struct_Tox_Event_Conference_Invite conference_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_conference_invite = _libraries['FIXME_STUB'].tox_event_get_conference_invite
+    tox_event_get_conference_invite.restype = POINTER_T(struct_Tox_Event_Conference_Invite)
+# tox_event_get_conference_invite(event)
+    tox_event_get_conference_invite.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_conference_invite.__doc__ = """LP_struct_Tox_Event_Conference_Invite tox_event_get_conference_invite(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Conference_Connected(Structure):
+    pass
+
+Tox_Event_Conference_Connected = struct_Tox_Event_Conference_Connected
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_connected_get_conference_number = _libraries['FIXME_STUB'].tox_event_conference_connected_get_conference_number
+    tox_event_conference_connected_get_conference_number.restype = ctypes.c_uint32
+# tox_event_conference_connected_get_conference_number(conference_connected)
+    tox_event_conference_connected_get_conference_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Connected)]
+except AttributeError:
+    pass
+tox_event_conference_connected_get_conference_number.__doc__ = """c_uint32 tox_event_conference_connected_get_conference_number(LP_struct_Tox_Event_Conference_Connected conference_connected)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_conference_connected = _libraries['FIXME_STUB'].tox_event_get_conference_connected
+    tox_event_get_conference_connected.restype = POINTER_T(struct_Tox_Event_Conference_Connected)
+# tox_event_get_conference_connected(event)
+    tox_event_get_conference_connected.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_conference_connected.__doc__ = """LP_struct_Tox_Event_Conference_Connected tox_event_get_conference_connected(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Conference_Peer_List_Changed(Structure):
+    pass
+
+Tox_Event_Conference_Peer_List_Changed = struct_Tox_Event_Conference_Peer_List_Changed
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_peer_list_changed_get_conference_number = _libraries['FIXME_STUB'].tox_event_conference_peer_list_changed_get_conference_number
+    tox_event_conference_peer_list_changed_get_conference_number.restype = ctypes.c_uint32
+# tox_event_conference_peer_list_changed_get_conference_number(conference_peer_list_changed)
+    tox_event_conference_peer_list_changed_get_conference_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Peer_List_Changed)]
+except AttributeError:
+    pass
+tox_event_conference_peer_list_changed_get_conference_number.__doc__ = """c_uint32 tox_event_conference_peer_list_changed_get_conference_number(LP_struct_Tox_Event_Conference_Peer_List_Changed conference_peer_list_changed)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_conference_peer_list_changed = _libraries['FIXME_STUB'].tox_event_get_conference_peer_list_changed
+    tox_event_get_conference_peer_list_changed.restype = POINTER_T(struct_Tox_Event_Conference_Peer_List_Changed)
+# tox_event_get_conference_peer_list_changed(event)
+    tox_event_get_conference_peer_list_changed.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_conference_peer_list_changed.__doc__ = """LP_struct_Tox_Event_Conference_Peer_List_Changed tox_event_get_conference_peer_list_changed(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Conference_Peer_Name(Structure):
+    pass
+
+Tox_Event_Conference_Peer_Name = struct_Tox_Event_Conference_Peer_Name
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_peer_name_get_conference_number = _libraries['FIXME_STUB'].tox_event_conference_peer_name_get_conference_number
+    tox_event_conference_peer_name_get_conference_number.restype = ctypes.c_uint32
+# tox_event_conference_peer_name_get_conference_number(conference_peer_name)
+    tox_event_conference_peer_name_get_conference_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Peer_Name)]
+except AttributeError:
+    pass
+tox_event_conference_peer_name_get_conference_number.__doc__ = """c_uint32 tox_event_conference_peer_name_get_conference_number(LP_struct_Tox_Event_Conference_Peer_Name conference_peer_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_peer_name_get_peer_number = _libraries['FIXME_STUB'].tox_event_conference_peer_name_get_peer_number
+    tox_event_conference_peer_name_get_peer_number.restype = ctypes.c_uint32
+# tox_event_conference_peer_name_get_peer_number(conference_peer_name)
+    tox_event_conference_peer_name_get_peer_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Peer_Name)]
+except AttributeError:
+    pass
+tox_event_conference_peer_name_get_peer_number.__doc__ = """c_uint32 tox_event_conference_peer_name_get_peer_number(LP_struct_Tox_Event_Conference_Peer_Name conference_peer_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_peer_name_get_name = _libraries['FIXME_STUB'].tox_event_conference_peer_name_get_name
+    tox_event_conference_peer_name_get_name.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_conference_peer_name_get_name(conference_peer_name)
+    tox_event_conference_peer_name_get_name.argtypes = [POINTER_T(struct_Tox_Event_Conference_Peer_Name)]
+except AttributeError:
+    pass
+tox_event_conference_peer_name_get_name.__doc__ = """LP_c_ubyte tox_event_conference_peer_name_get_name(LP_struct_Tox_Event_Conference_Peer_Name conference_peer_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_peer_name_get_name_length = _libraries['FIXME_STUB'].tox_event_conference_peer_name_get_name_length
+    tox_event_conference_peer_name_get_name_length.restype = ctypes.c_uint32
+# tox_event_conference_peer_name_get_name_length(conference_peer_name)
+    tox_event_conference_peer_name_get_name_length.argtypes = [POINTER_T(struct_Tox_Event_Conference_Peer_Name)]
+except AttributeError:
+    pass
+tox_event_conference_peer_name_get_name_length.__doc__ = """c_uint32 tox_event_conference_peer_name_get_name_length(LP_struct_Tox_Event_Conference_Peer_Name conference_peer_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_conference_peer_name = _libraries['FIXME_STUB'].tox_event_get_conference_peer_name
+    tox_event_get_conference_peer_name.restype = POINTER_T(struct_Tox_Event_Conference_Peer_Name)
+# tox_event_get_conference_peer_name(event)
+    tox_event_get_conference_peer_name.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_conference_peer_name.__doc__ = """LP_struct_Tox_Event_Conference_Peer_Name tox_event_get_conference_peer_name(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Conference_Title(Structure):
+    pass
+
+Tox_Event_Conference_Title = struct_Tox_Event_Conference_Title
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_title_get_conference_number = _libraries['FIXME_STUB'].tox_event_conference_title_get_conference_number
+    tox_event_conference_title_get_conference_number.restype = ctypes.c_uint32
+# tox_event_conference_title_get_conference_number(conference_title)
+    tox_event_conference_title_get_conference_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Title)]
+except AttributeError:
+    pass
+tox_event_conference_title_get_conference_number.__doc__ = """c_uint32 tox_event_conference_title_get_conference_number(LP_struct_Tox_Event_Conference_Title conference_title)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_title_get_peer_number = _libraries['FIXME_STUB'].tox_event_conference_title_get_peer_number
+    tox_event_conference_title_get_peer_number.restype = ctypes.c_uint32
+# tox_event_conference_title_get_peer_number(conference_title)
+    tox_event_conference_title_get_peer_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Title)]
+except AttributeError:
+    pass
+tox_event_conference_title_get_peer_number.__doc__ = """c_uint32 tox_event_conference_title_get_peer_number(LP_struct_Tox_Event_Conference_Title conference_title)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_title_get_title = _libraries['FIXME_STUB'].tox_event_conference_title_get_title
+    tox_event_conference_title_get_title.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_conference_title_get_title(conference_title)
+    tox_event_conference_title_get_title.argtypes = [POINTER_T(struct_Tox_Event_Conference_Title)]
+except AttributeError:
+    pass
+tox_event_conference_title_get_title.__doc__ = """LP_c_ubyte tox_event_conference_title_get_title(LP_struct_Tox_Event_Conference_Title conference_title)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_title_get_title_length = _libraries['FIXME_STUB'].tox_event_conference_title_get_title_length
+    tox_event_conference_title_get_title_length.restype = ctypes.c_uint32
+# tox_event_conference_title_get_title_length(conference_title)
+    tox_event_conference_title_get_title_length.argtypes = [POINTER_T(struct_Tox_Event_Conference_Title)]
+except AttributeError:
+    pass
+tox_event_conference_title_get_title_length.__doc__ = """c_uint32 tox_event_conference_title_get_title_length(LP_struct_Tox_Event_Conference_Title conference_title)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_conference_title = _libraries['FIXME_STUB'].tox_event_get_conference_title
+    tox_event_get_conference_title.restype = POINTER_T(struct_Tox_Event_Conference_Title)
+# tox_event_get_conference_title(event)
+    tox_event_get_conference_title.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_conference_title.__doc__ = """LP_struct_Tox_Event_Conference_Title tox_event_get_conference_title(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Conference_Message(Structure):
+    pass
+
+Tox_Event_Conference_Message = struct_Tox_Event_Conference_Message
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_message_get_conference_number = _libraries['FIXME_STUB'].tox_event_conference_message_get_conference_number
+    tox_event_conference_message_get_conference_number.restype = ctypes.c_uint32
+# tox_event_conference_message_get_conference_number(conference_message)
+    tox_event_conference_message_get_conference_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Message)]
+except AttributeError:
+    pass
+tox_event_conference_message_get_conference_number.__doc__ = """c_uint32 tox_event_conference_message_get_conference_number(LP_struct_Tox_Event_Conference_Message conference_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_message_get_peer_number = _libraries['FIXME_STUB'].tox_event_conference_message_get_peer_number
+    tox_event_conference_message_get_peer_number.restype = ctypes.c_uint32
+# tox_event_conference_message_get_peer_number(conference_message)
+    tox_event_conference_message_get_peer_number.argtypes = [POINTER_T(struct_Tox_Event_Conference_Message)]
+except AttributeError:
+    pass
+tox_event_conference_message_get_peer_number.__doc__ = """c_uint32 tox_event_conference_message_get_peer_number(LP_struct_Tox_Event_Conference_Message conference_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_message_get_type = _libraries['FIXME_STUB'].tox_event_conference_message_get_type
+    tox_event_conference_message_get_type.restype = Tox_Message_Type
+# tox_event_conference_message_get_type(conference_message)
+    tox_event_conference_message_get_type.argtypes = [POINTER_T(struct_Tox_Event_Conference_Message)]
+except AttributeError:
+    pass
+tox_event_conference_message_get_type.__doc__ = """Tox_Message_Type tox_event_conference_message_get_type(LP_struct_Tox_Event_Conference_Message conference_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_message_get_message = _libraries['FIXME_STUB'].tox_event_conference_message_get_message
+    tox_event_conference_message_get_message.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_conference_message_get_message(conference_message)
+    tox_event_conference_message_get_message.argtypes = [POINTER_T(struct_Tox_Event_Conference_Message)]
+except AttributeError:
+    pass
+tox_event_conference_message_get_message.__doc__ = """LP_c_ubyte tox_event_conference_message_get_message(LP_struct_Tox_Event_Conference_Message conference_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_conference_message_get_message_length = _libraries['FIXME_STUB'].tox_event_conference_message_get_message_length
+    tox_event_conference_message_get_message_length.restype = ctypes.c_uint32
+# tox_event_conference_message_get_message_length(conference_message)
+    tox_event_conference_message_get_message_length.argtypes = [POINTER_T(struct_Tox_Event_Conference_Message)]
+except AttributeError:
+    pass
+tox_event_conference_message_get_message_length.__doc__ = """c_uint32 tox_event_conference_message_get_message_length(LP_struct_Tox_Event_Conference_Message conference_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_conference_message = _libraries['FIXME_STUB'].tox_event_get_conference_message
+    tox_event_get_conference_message.restype = POINTER_T(struct_Tox_Event_Conference_Message)
+# tox_event_get_conference_message(event)
+    tox_event_get_conference_message.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_conference_message.__doc__ = """LP_struct_Tox_Event_Conference_Message tox_event_get_conference_message(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Peer_Name(Structure):
+    pass
+
+Tox_Event_Group_Peer_Name = struct_Tox_Event_Group_Peer_Name
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_name_get_group_number = _libraries['FIXME_STUB'].tox_event_group_peer_name_get_group_number
+    tox_event_group_peer_name_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_peer_name_get_group_number(group_peer_name)
+    tox_event_group_peer_name_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Name)]
+except AttributeError:
+    pass
+tox_event_group_peer_name_get_group_number.__doc__ = """c_uint32 tox_event_group_peer_name_get_group_number(LP_struct_Tox_Event_Group_Peer_Name group_peer_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_name_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_peer_name_get_peer_id
+    tox_event_group_peer_name_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_peer_name_get_peer_id(group_peer_name)
+    tox_event_group_peer_name_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Name)]
+except AttributeError:
+    pass
+tox_event_group_peer_name_get_peer_id.__doc__ = """c_uint32 tox_event_group_peer_name_get_peer_id(LP_struct_Tox_Event_Group_Peer_Name group_peer_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_name_get_name = _libraries['FIXME_STUB'].tox_event_group_peer_name_get_name
+    tox_event_group_peer_name_get_name.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_peer_name_get_name(group_peer_name)
+    tox_event_group_peer_name_get_name.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Name)]
+except AttributeError:
+    pass
+tox_event_group_peer_name_get_name.__doc__ = """LP_c_ubyte tox_event_group_peer_name_get_name(LP_struct_Tox_Event_Group_Peer_Name group_peer_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_name_get_name_length = _libraries['FIXME_STUB'].tox_event_group_peer_name_get_name_length
+    tox_event_group_peer_name_get_name_length.restype = ctypes.c_uint32
+# tox_event_group_peer_name_get_name_length(group_peer_name)
+    tox_event_group_peer_name_get_name_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Name)]
+except AttributeError:
+    pass
+tox_event_group_peer_name_get_name_length.__doc__ = """c_uint32 tox_event_group_peer_name_get_name_length(LP_struct_Tox_Event_Group_Peer_Name group_peer_name)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_peer_name = _libraries['FIXME_STUB'].tox_event_get_group_peer_name
+    tox_event_get_group_peer_name.restype = POINTER_T(struct_Tox_Event_Group_Peer_Name)
+# tox_event_get_group_peer_name(event)
+    tox_event_get_group_peer_name.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_peer_name.__doc__ = """LP_struct_Tox_Event_Group_Peer_Name tox_event_get_group_peer_name(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Peer_Status(Structure):
+    pass
+
+Tox_Event_Group_Peer_Status = struct_Tox_Event_Group_Peer_Status
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_status_get_group_number = _libraries['FIXME_STUB'].tox_event_group_peer_status_get_group_number
+    tox_event_group_peer_status_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_peer_status_get_group_number(group_peer_status)
+    tox_event_group_peer_status_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Status)]
+except AttributeError:
+    pass
+tox_event_group_peer_status_get_group_number.__doc__ = """c_uint32 tox_event_group_peer_status_get_group_number(LP_struct_Tox_Event_Group_Peer_Status group_peer_status)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_status_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_peer_status_get_peer_id
+    tox_event_group_peer_status_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_peer_status_get_peer_id(group_peer_status)
+    tox_event_group_peer_status_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Status)]
+except AttributeError:
+    pass
+tox_event_group_peer_status_get_peer_id.__doc__ = """c_uint32 tox_event_group_peer_status_get_peer_id(LP_struct_Tox_Event_Group_Peer_Status group_peer_status)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_status_get_status = _libraries['FIXME_STUB'].tox_event_group_peer_status_get_status
+    tox_event_group_peer_status_get_status.restype = Tox_User_Status
+# tox_event_group_peer_status_get_status(group_peer_status)
+    tox_event_group_peer_status_get_status.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Status)]
+except AttributeError:
+    pass
+tox_event_group_peer_status_get_status.__doc__ = """Tox_User_Status tox_event_group_peer_status_get_status(LP_struct_Tox_Event_Group_Peer_Status group_peer_status)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_peer_status = _libraries['FIXME_STUB'].tox_event_get_group_peer_status
+    tox_event_get_group_peer_status.restype = POINTER_T(struct_Tox_Event_Group_Peer_Status)
+# tox_event_get_group_peer_status(event)
+    tox_event_get_group_peer_status.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_peer_status.__doc__ = """LP_struct_Tox_Event_Group_Peer_Status tox_event_get_group_peer_status(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Topic(Structure):
+    pass
+
+Tox_Event_Group_Topic = struct_Tox_Event_Group_Topic
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_topic_get_group_number = _libraries['FIXME_STUB'].tox_event_group_topic_get_group_number
+    tox_event_group_topic_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_topic_get_group_number(group_topic)
+    tox_event_group_topic_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Topic)]
+except AttributeError:
+    pass
+tox_event_group_topic_get_group_number.__doc__ = """c_uint32 tox_event_group_topic_get_group_number(LP_struct_Tox_Event_Group_Topic group_topic)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_topic_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_topic_get_peer_id
+    tox_event_group_topic_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_topic_get_peer_id(group_topic)
+    tox_event_group_topic_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Topic)]
+except AttributeError:
+    pass
+tox_event_group_topic_get_peer_id.__doc__ = """c_uint32 tox_event_group_topic_get_peer_id(LP_struct_Tox_Event_Group_Topic group_topic)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_topic_get_topic = _libraries['FIXME_STUB'].tox_event_group_topic_get_topic
+    tox_event_group_topic_get_topic.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_topic_get_topic(group_topic)
+    tox_event_group_topic_get_topic.argtypes = [POINTER_T(struct_Tox_Event_Group_Topic)]
+except AttributeError:
+    pass
+tox_event_group_topic_get_topic.__doc__ = """LP_c_ubyte tox_event_group_topic_get_topic(LP_struct_Tox_Event_Group_Topic group_topic)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_topic_get_topic_length = _libraries['FIXME_STUB'].tox_event_group_topic_get_topic_length
+    tox_event_group_topic_get_topic_length.restype = ctypes.c_uint32
+# tox_event_group_topic_get_topic_length(group_topic)
+    tox_event_group_topic_get_topic_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Topic)]
+except AttributeError:
+    pass
+tox_event_group_topic_get_topic_length.__doc__ = """c_uint32 tox_event_group_topic_get_topic_length(LP_struct_Tox_Event_Group_Topic group_topic)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_topic = _libraries['FIXME_STUB'].tox_event_get_group_topic
+    tox_event_get_group_topic.restype = POINTER_T(struct_Tox_Event_Group_Topic)
+# tox_event_get_group_topic(event)
+    tox_event_get_group_topic.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_topic.__doc__ = """LP_struct_Tox_Event_Group_Topic tox_event_get_group_topic(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Privacy_State(Structure):
+    pass
+
+Tox_Event_Group_Privacy_State = struct_Tox_Event_Group_Privacy_State
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_privacy_state_get_group_number = _libraries['FIXME_STUB'].tox_event_group_privacy_state_get_group_number
+    tox_event_group_privacy_state_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_privacy_state_get_group_number(group_privacy_state)
+    tox_event_group_privacy_state_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Privacy_State)]
+except AttributeError:
+    pass
+tox_event_group_privacy_state_get_group_number.__doc__ = """c_uint32 tox_event_group_privacy_state_get_group_number(LP_struct_Tox_Event_Group_Privacy_State group_privacy_state)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_privacy_state_get_privacy_state = _libraries['FIXME_STUB'].tox_event_group_privacy_state_get_privacy_state
+    tox_event_group_privacy_state_get_privacy_state.restype = Tox_Group_Privacy_State
+# tox_event_group_privacy_state_get_privacy_state(group_privacy_state)
+    tox_event_group_privacy_state_get_privacy_state.argtypes = [POINTER_T(struct_Tox_Event_Group_Privacy_State)]
+except AttributeError:
+    pass
+tox_event_group_privacy_state_get_privacy_state.__doc__ = """Tox_Group_Privacy_State tox_event_group_privacy_state_get_privacy_state(LP_struct_Tox_Event_Group_Privacy_State group_privacy_state)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_privacy_state = _libraries['FIXME_STUB'].tox_event_get_group_privacy_state
+    tox_event_get_group_privacy_state.restype = POINTER_T(struct_Tox_Event_Group_Privacy_State)
+# tox_event_get_group_privacy_state(event)
+    tox_event_get_group_privacy_state.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_privacy_state.__doc__ = """LP_struct_Tox_Event_Group_Privacy_State tox_event_get_group_privacy_state(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Voice_State(Structure):
+    pass
+
+Tox_Event_Group_Voice_State = struct_Tox_Event_Group_Voice_State
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_voice_state_get_group_number = _libraries['FIXME_STUB'].tox_event_group_voice_state_get_group_number
+    tox_event_group_voice_state_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_voice_state_get_group_number(group_voice_state)
+    tox_event_group_voice_state_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Voice_State)]
+except AttributeError:
+    pass
+tox_event_group_voice_state_get_group_number.__doc__ = """c_uint32 tox_event_group_voice_state_get_group_number(LP_struct_Tox_Event_Group_Voice_State group_voice_state)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_voice_state_get_voice_state = _libraries['FIXME_STUB'].tox_event_group_voice_state_get_voice_state
+    tox_event_group_voice_state_get_voice_state.restype = Tox_Group_Voice_State
+# tox_event_group_voice_state_get_voice_state(group_voice_state)
+    tox_event_group_voice_state_get_voice_state.argtypes = [POINTER_T(struct_Tox_Event_Group_Voice_State)]
+except AttributeError:
+    pass
+tox_event_group_voice_state_get_voice_state.__doc__ = """Tox_Group_Voice_State tox_event_group_voice_state_get_voice_state(LP_struct_Tox_Event_Group_Voice_State group_voice_state)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_voice_state = _libraries['FIXME_STUB'].tox_event_get_group_voice_state
+    tox_event_get_group_voice_state.restype = POINTER_T(struct_Tox_Event_Group_Voice_State)
+# tox_event_get_group_voice_state(event)
+    tox_event_get_group_voice_state.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_voice_state.__doc__ = """LP_struct_Tox_Event_Group_Voice_State tox_event_get_group_voice_state(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Topic_Lock(Structure):
+    pass
+
+Tox_Event_Group_Topic_Lock = struct_Tox_Event_Group_Topic_Lock
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_topic_lock_get_group_number = _libraries['FIXME_STUB'].tox_event_group_topic_lock_get_group_number
+    tox_event_group_topic_lock_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_topic_lock_get_group_number(group_topic_lock)
+    tox_event_group_topic_lock_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Topic_Lock)]
+except AttributeError:
+    pass
+tox_event_group_topic_lock_get_group_number.__doc__ = """c_uint32 tox_event_group_topic_lock_get_group_number(LP_struct_Tox_Event_Group_Topic_Lock group_topic_lock)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_topic_lock_get_topic_lock = _libraries['FIXME_STUB'].tox_event_group_topic_lock_get_topic_lock
+    tox_event_group_topic_lock_get_topic_lock.restype = Tox_Group_Topic_Lock
+# tox_event_group_topic_lock_get_topic_lock(group_topic_lock)
+    tox_event_group_topic_lock_get_topic_lock.argtypes = [POINTER_T(struct_Tox_Event_Group_Topic_Lock)]
+except AttributeError:
+    pass
+tox_event_group_topic_lock_get_topic_lock.__doc__ = """Tox_Group_Topic_Lock tox_event_group_topic_lock_get_topic_lock(LP_struct_Tox_Event_Group_Topic_Lock group_topic_lock)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_topic_lock = _libraries['FIXME_STUB'].tox_event_get_group_topic_lock
+    tox_event_get_group_topic_lock.restype = POINTER_T(struct_Tox_Event_Group_Topic_Lock)
+# tox_event_get_group_topic_lock(event)
+    tox_event_get_group_topic_lock.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_topic_lock.__doc__ = """LP_struct_Tox_Event_Group_Topic_Lock tox_event_get_group_topic_lock(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Peer_Limit(Structure):
+    pass
+
+Tox_Event_Group_Peer_Limit = struct_Tox_Event_Group_Peer_Limit
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_limit_get_group_number = _libraries['FIXME_STUB'].tox_event_group_peer_limit_get_group_number
+    tox_event_group_peer_limit_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_peer_limit_get_group_number(group_peer_limit)
+    tox_event_group_peer_limit_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Limit)]
+except AttributeError:
+    pass
+tox_event_group_peer_limit_get_group_number.__doc__ = """c_uint32 tox_event_group_peer_limit_get_group_number(LP_struct_Tox_Event_Group_Peer_Limit group_peer_limit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_limit_get_peer_limit = _libraries['FIXME_STUB'].tox_event_group_peer_limit_get_peer_limit
+    tox_event_group_peer_limit_get_peer_limit.restype = ctypes.c_uint32
+# tox_event_group_peer_limit_get_peer_limit(group_peer_limit)
+    tox_event_group_peer_limit_get_peer_limit.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Limit)]
+except AttributeError:
+    pass
+tox_event_group_peer_limit_get_peer_limit.__doc__ = """c_uint32 tox_event_group_peer_limit_get_peer_limit(LP_struct_Tox_Event_Group_Peer_Limit group_peer_limit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_peer_limit = _libraries['FIXME_STUB'].tox_event_get_group_peer_limit
+    tox_event_get_group_peer_limit.restype = POINTER_T(struct_Tox_Event_Group_Peer_Limit)
+# tox_event_get_group_peer_limit(event)
+    tox_event_get_group_peer_limit.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_peer_limit.__doc__ = """LP_struct_Tox_Event_Group_Peer_Limit tox_event_get_group_peer_limit(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Password(Structure):
+    pass
+
+Tox_Event_Group_Password = struct_Tox_Event_Group_Password
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_password_get_group_number = _libraries['FIXME_STUB'].tox_event_group_password_get_group_number
+    tox_event_group_password_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_password_get_group_number(group_password)
+    tox_event_group_password_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Password)]
+except AttributeError:
+    pass
+tox_event_group_password_get_group_number.__doc__ = """c_uint32 tox_event_group_password_get_group_number(LP_struct_Tox_Event_Group_Password group_password)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_password_get_password = _libraries['FIXME_STUB'].tox_event_group_password_get_password
+    tox_event_group_password_get_password.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_password_get_password(group_password)
+    tox_event_group_password_get_password.argtypes = [POINTER_T(struct_Tox_Event_Group_Password)]
+except AttributeError:
+    pass
+tox_event_group_password_get_password.__doc__ = """LP_c_ubyte tox_event_group_password_get_password(LP_struct_Tox_Event_Group_Password group_password)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_password_get_password_length = _libraries['FIXME_STUB'].tox_event_group_password_get_password_length
+    tox_event_group_password_get_password_length.restype = ctypes.c_uint32
+# tox_event_group_password_get_password_length(group_password)
+    tox_event_group_password_get_password_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Password)]
+except AttributeError:
+    pass
+tox_event_group_password_get_password_length.__doc__ = """c_uint32 tox_event_group_password_get_password_length(LP_struct_Tox_Event_Group_Password group_password)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_password = _libraries['FIXME_STUB'].tox_event_get_group_password
+    tox_event_get_group_password.restype = POINTER_T(struct_Tox_Event_Group_Password)
+# tox_event_get_group_password(event)
+    tox_event_get_group_password.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_password.__doc__ = """LP_struct_Tox_Event_Group_Password tox_event_get_group_password(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Message(Structure):
+    pass
+
+Tox_Event_Group_Message = struct_Tox_Event_Group_Message
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_message_get_group_number = _libraries['FIXME_STUB'].tox_event_group_message_get_group_number
+    tox_event_group_message_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_message_get_group_number(group_message)
+    tox_event_group_message_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Message)]
+except AttributeError:
+    pass
+tox_event_group_message_get_group_number.__doc__ = """c_uint32 tox_event_group_message_get_group_number(LP_struct_Tox_Event_Group_Message group_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_message_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_message_get_peer_id
+    tox_event_group_message_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_message_get_peer_id(group_message)
+    tox_event_group_message_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Message)]
+except AttributeError:
+    pass
+tox_event_group_message_get_peer_id.__doc__ = """c_uint32 tox_event_group_message_get_peer_id(LP_struct_Tox_Event_Group_Message group_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_message_get_message_type = _libraries['FIXME_STUB'].tox_event_group_message_get_message_type
+    tox_event_group_message_get_message_type.restype = Tox_Message_Type
+# tox_event_group_message_get_message_type(group_message)
+    tox_event_group_message_get_message_type.argtypes = [POINTER_T(struct_Tox_Event_Group_Message)]
+except AttributeError:
+    pass
+tox_event_group_message_get_message_type.__doc__ = """Tox_Message_Type tox_event_group_message_get_message_type(LP_struct_Tox_Event_Group_Message group_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_message_get_message = _libraries['FIXME_STUB'].tox_event_group_message_get_message
+    tox_event_group_message_get_message.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_message_get_message(group_message)
+    tox_event_group_message_get_message.argtypes = [POINTER_T(struct_Tox_Event_Group_Message)]
+except AttributeError:
+    pass
+tox_event_group_message_get_message.__doc__ = """LP_c_ubyte tox_event_group_message_get_message(LP_struct_Tox_Event_Group_Message group_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_message_get_message_length = _libraries['FIXME_STUB'].tox_event_group_message_get_message_length
+    tox_event_group_message_get_message_length.restype = ctypes.c_uint32
+# tox_event_group_message_get_message_length(group_message)
+    tox_event_group_message_get_message_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Message)]
+except AttributeError:
+    pass
+tox_event_group_message_get_message_length.__doc__ = """c_uint32 tox_event_group_message_get_message_length(LP_struct_Tox_Event_Group_Message group_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_message_get_message_id = _libraries['FIXME_STUB'].tox_event_group_message_get_message_id
+    tox_event_group_message_get_message_id.restype = ctypes.c_uint32
+# tox_event_group_message_get_message_id(group_message)
+    tox_event_group_message_get_message_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Message)]
+except AttributeError:
+    pass
+tox_event_group_message_get_message_id.__doc__ = """c_uint32 tox_event_group_message_get_message_id(LP_struct_Tox_Event_Group_Message group_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_message = _libraries['FIXME_STUB'].tox_event_get_group_message
+    tox_event_get_group_message.restype = POINTER_T(struct_Tox_Event_Group_Message)
+# tox_event_get_group_message(event)
+    tox_event_get_group_message.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_message.__doc__ = """LP_struct_Tox_Event_Group_Message tox_event_get_group_message(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Private_Message(Structure):
+    pass
+
+Tox_Event_Group_Private_Message = struct_Tox_Event_Group_Private_Message
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_private_message_get_group_number = _libraries['FIXME_STUB'].tox_event_group_private_message_get_group_number
+    tox_event_group_private_message_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_private_message_get_group_number(group_private_message)
+    tox_event_group_private_message_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Private_Message)]
+except AttributeError:
+    pass
+tox_event_group_private_message_get_group_number.__doc__ = """c_uint32 tox_event_group_private_message_get_group_number(LP_struct_Tox_Event_Group_Private_Message group_private_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_private_message_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_private_message_get_peer_id
+    tox_event_group_private_message_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_private_message_get_peer_id(group_private_message)
+    tox_event_group_private_message_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Private_Message)]
+except AttributeError:
+    pass
+tox_event_group_private_message_get_peer_id.__doc__ = """c_uint32 tox_event_group_private_message_get_peer_id(LP_struct_Tox_Event_Group_Private_Message group_private_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_private_message_get_message_type = _libraries['FIXME_STUB'].tox_event_group_private_message_get_message_type
+    tox_event_group_private_message_get_message_type.restype = Tox_Message_Type
+# tox_event_group_private_message_get_message_type(group_private_message)
+    tox_event_group_private_message_get_message_type.argtypes = [POINTER_T(struct_Tox_Event_Group_Private_Message)]
+except AttributeError:
+    pass
+tox_event_group_private_message_get_message_type.__doc__ = """Tox_Message_Type tox_event_group_private_message_get_message_type(LP_struct_Tox_Event_Group_Private_Message group_private_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_private_message_get_message = _libraries['FIXME_STUB'].tox_event_group_private_message_get_message
+    tox_event_group_private_message_get_message.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_private_message_get_message(group_private_message)
+    tox_event_group_private_message_get_message.argtypes = [POINTER_T(struct_Tox_Event_Group_Private_Message)]
+except AttributeError:
+    pass
+tox_event_group_private_message_get_message.__doc__ = """LP_c_ubyte tox_event_group_private_message_get_message(LP_struct_Tox_Event_Group_Private_Message group_private_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_private_message_get_message_length = _libraries['FIXME_STUB'].tox_event_group_private_message_get_message_length
+    tox_event_group_private_message_get_message_length.restype = ctypes.c_uint32
+# tox_event_group_private_message_get_message_length(group_private_message)
+    tox_event_group_private_message_get_message_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Private_Message)]
+except AttributeError:
+    pass
+tox_event_group_private_message_get_message_length.__doc__ = """c_uint32 tox_event_group_private_message_get_message_length(LP_struct_Tox_Event_Group_Private_Message group_private_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_private_message_get_message_id = _libraries['FIXME_STUB'].tox_event_group_private_message_get_message_id
+    tox_event_group_private_message_get_message_id.restype = ctypes.c_uint32
+# tox_event_group_private_message_get_message_id(group_private_message)
+    tox_event_group_private_message_get_message_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Private_Message)]
+except AttributeError:
+    pass
+tox_event_group_private_message_get_message_id.__doc__ = """c_uint32 tox_event_group_private_message_get_message_id(LP_struct_Tox_Event_Group_Private_Message group_private_message)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_private_message = _libraries['FIXME_STUB'].tox_event_get_group_private_message
+    tox_event_get_group_private_message.restype = POINTER_T(struct_Tox_Event_Group_Private_Message)
+# tox_event_get_group_private_message(event)
+    tox_event_get_group_private_message.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_private_message.__doc__ = """LP_struct_Tox_Event_Group_Private_Message tox_event_get_group_private_message(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Custom_Packet(Structure):
+    pass
+
+Tox_Event_Group_Custom_Packet = struct_Tox_Event_Group_Custom_Packet
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_custom_packet_get_group_number = _libraries['FIXME_STUB'].tox_event_group_custom_packet_get_group_number
+    tox_event_group_custom_packet_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_custom_packet_get_group_number(group_custom_packet)
+    tox_event_group_custom_packet_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Custom_Packet)]
+except AttributeError:
+    pass
+tox_event_group_custom_packet_get_group_number.__doc__ = """c_uint32 tox_event_group_custom_packet_get_group_number(LP_struct_Tox_Event_Group_Custom_Packet group_custom_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_custom_packet_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_custom_packet_get_peer_id
+    tox_event_group_custom_packet_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_custom_packet_get_peer_id(group_custom_packet)
+    tox_event_group_custom_packet_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Custom_Packet)]
+except AttributeError:
+    pass
+tox_event_group_custom_packet_get_peer_id.__doc__ = """c_uint32 tox_event_group_custom_packet_get_peer_id(LP_struct_Tox_Event_Group_Custom_Packet group_custom_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_custom_packet_get_data = _libraries['FIXME_STUB'].tox_event_group_custom_packet_get_data
+    tox_event_group_custom_packet_get_data.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_custom_packet_get_data(group_custom_packet)
+    tox_event_group_custom_packet_get_data.argtypes = [POINTER_T(struct_Tox_Event_Group_Custom_Packet)]
+except AttributeError:
+    pass
+tox_event_group_custom_packet_get_data.__doc__ = """LP_c_ubyte tox_event_group_custom_packet_get_data(LP_struct_Tox_Event_Group_Custom_Packet group_custom_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_custom_packet_get_data_length = _libraries['FIXME_STUB'].tox_event_group_custom_packet_get_data_length
+    tox_event_group_custom_packet_get_data_length.restype = ctypes.c_uint32
+# tox_event_group_custom_packet_get_data_length(group_custom_packet)
+    tox_event_group_custom_packet_get_data_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Custom_Packet)]
+except AttributeError:
+    pass
+tox_event_group_custom_packet_get_data_length.__doc__ = """c_uint32 tox_event_group_custom_packet_get_data_length(LP_struct_Tox_Event_Group_Custom_Packet group_custom_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_custom_packet = _libraries['FIXME_STUB'].tox_event_get_group_custom_packet
+    tox_event_get_group_custom_packet.restype = POINTER_T(struct_Tox_Event_Group_Custom_Packet)
+# tox_event_get_group_custom_packet(event)
+    tox_event_get_group_custom_packet.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_custom_packet.__doc__ = """LP_struct_Tox_Event_Group_Custom_Packet tox_event_get_group_custom_packet(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Custom_Private_Packet(Structure):
+    pass
+
+Tox_Event_Group_Custom_Private_Packet = struct_Tox_Event_Group_Custom_Private_Packet
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_custom_private_packet_get_group_number = _libraries['FIXME_STUB'].tox_event_group_custom_private_packet_get_group_number
+    tox_event_group_custom_private_packet_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_custom_private_packet_get_group_number(group_custom_private_packet)
+    tox_event_group_custom_private_packet_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Custom_Private_Packet)]
+except AttributeError:
+    pass
+tox_event_group_custom_private_packet_get_group_number.__doc__ = """c_uint32 tox_event_group_custom_private_packet_get_group_number(LP_struct_Tox_Event_Group_Custom_Private_Packet group_custom_private_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_custom_private_packet_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_custom_private_packet_get_peer_id
+    tox_event_group_custom_private_packet_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_custom_private_packet_get_peer_id(group_custom_private_packet)
+    tox_event_group_custom_private_packet_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Custom_Private_Packet)]
+except AttributeError:
+    pass
+tox_event_group_custom_private_packet_get_peer_id.__doc__ = """c_uint32 tox_event_group_custom_private_packet_get_peer_id(LP_struct_Tox_Event_Group_Custom_Private_Packet group_custom_private_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_custom_private_packet_get_data = _libraries['FIXME_STUB'].tox_event_group_custom_private_packet_get_data
+    tox_event_group_custom_private_packet_get_data.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_custom_private_packet_get_data(group_custom_private_packet)
+    tox_event_group_custom_private_packet_get_data.argtypes = [POINTER_T(struct_Tox_Event_Group_Custom_Private_Packet)]
+except AttributeError:
+    pass
+tox_event_group_custom_private_packet_get_data.__doc__ = """LP_c_ubyte tox_event_group_custom_private_packet_get_data(LP_struct_Tox_Event_Group_Custom_Private_Packet group_custom_private_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_custom_private_packet_get_data_length = _libraries['FIXME_STUB'].tox_event_group_custom_private_packet_get_data_length
+    tox_event_group_custom_private_packet_get_data_length.restype = ctypes.c_uint32
+# tox_event_group_custom_private_packet_get_data_length(group_custom_private_packet)
+    tox_event_group_custom_private_packet_get_data_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Custom_Private_Packet)]
+except AttributeError:
+    pass
+tox_event_group_custom_private_packet_get_data_length.__doc__ = """c_uint32 tox_event_group_custom_private_packet_get_data_length(LP_struct_Tox_Event_Group_Custom_Private_Packet group_custom_private_packet)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_custom_private_packet = _libraries['FIXME_STUB'].tox_event_get_group_custom_private_packet
+    tox_event_get_group_custom_private_packet.restype = POINTER_T(struct_Tox_Event_Group_Custom_Private_Packet)
+# tox_event_get_group_custom_private_packet(event)
+    tox_event_get_group_custom_private_packet.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_custom_private_packet.__doc__ = """LP_struct_Tox_Event_Group_Custom_Private_Packet tox_event_get_group_custom_private_packet(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Invite(Structure):
+    pass
+
+Tox_Event_Group_Invite = struct_Tox_Event_Group_Invite
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_invite_get_friend_number = _libraries['FIXME_STUB'].tox_event_group_invite_get_friend_number
+    tox_event_group_invite_get_friend_number.restype = ctypes.c_uint32
+# tox_event_group_invite_get_friend_number(group_invite)
+    tox_event_group_invite_get_friend_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Invite)]
+except AttributeError:
+    pass
+tox_event_group_invite_get_friend_number.__doc__ = """c_uint32 tox_event_group_invite_get_friend_number(LP_struct_Tox_Event_Group_Invite group_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_invite_get_invite_data = _libraries['FIXME_STUB'].tox_event_group_invite_get_invite_data
+    tox_event_group_invite_get_invite_data.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_invite_get_invite_data(group_invite)
+    tox_event_group_invite_get_invite_data.argtypes = [POINTER_T(struct_Tox_Event_Group_Invite)]
+except AttributeError:
+    pass
+tox_event_group_invite_get_invite_data.__doc__ = """LP_c_ubyte tox_event_group_invite_get_invite_data(LP_struct_Tox_Event_Group_Invite group_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_invite_get_invite_data_length = _libraries['FIXME_STUB'].tox_event_group_invite_get_invite_data_length
+    tox_event_group_invite_get_invite_data_length.restype = ctypes.c_uint32
+# tox_event_group_invite_get_invite_data_length(group_invite)
+    tox_event_group_invite_get_invite_data_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Invite)]
+except AttributeError:
+    pass
+tox_event_group_invite_get_invite_data_length.__doc__ = """c_uint32 tox_event_group_invite_get_invite_data_length(LP_struct_Tox_Event_Group_Invite group_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_invite_get_group_name = _libraries['FIXME_STUB'].tox_event_group_invite_get_group_name
+    tox_event_group_invite_get_group_name.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_invite_get_group_name(group_invite)
+    tox_event_group_invite_get_group_name.argtypes = [POINTER_T(struct_Tox_Event_Group_Invite)]
+except AttributeError:
+    pass
+tox_event_group_invite_get_group_name.__doc__ = """LP_c_ubyte tox_event_group_invite_get_group_name(LP_struct_Tox_Event_Group_Invite group_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_invite_get_group_name_length = _libraries['FIXME_STUB'].tox_event_group_invite_get_group_name_length
+    tox_event_group_invite_get_group_name_length.restype = ctypes.c_uint32
+# tox_event_group_invite_get_group_name_length(group_invite)
+    tox_event_group_invite_get_group_name_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Invite)]
+except AttributeError:
+    pass
+tox_event_group_invite_get_group_name_length.__doc__ = """c_uint32 tox_event_group_invite_get_group_name_length(LP_struct_Tox_Event_Group_Invite group_invite)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_invite = _libraries['FIXME_STUB'].tox_event_get_group_invite
+    tox_event_get_group_invite.restype = POINTER_T(struct_Tox_Event_Group_Invite)
+# tox_event_get_group_invite(event)
+    tox_event_get_group_invite.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_invite.__doc__ = """LP_struct_Tox_Event_Group_Invite tox_event_get_group_invite(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Peer_Join(Structure):
+    pass
+
+Tox_Event_Group_Peer_Join = struct_Tox_Event_Group_Peer_Join
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_join_get_group_number = _libraries['FIXME_STUB'].tox_event_group_peer_join_get_group_number
+    tox_event_group_peer_join_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_peer_join_get_group_number(group_peer_join)
+    tox_event_group_peer_join_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Join)]
+except AttributeError:
+    pass
+tox_event_group_peer_join_get_group_number.__doc__ = """c_uint32 tox_event_group_peer_join_get_group_number(LP_struct_Tox_Event_Group_Peer_Join group_peer_join)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_join_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_peer_join_get_peer_id
+    tox_event_group_peer_join_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_peer_join_get_peer_id(group_peer_join)
+    tox_event_group_peer_join_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Join)]
+except AttributeError:
+    pass
+tox_event_group_peer_join_get_peer_id.__doc__ = """c_uint32 tox_event_group_peer_join_get_peer_id(LP_struct_Tox_Event_Group_Peer_Join group_peer_join)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_peer_join = _libraries['FIXME_STUB'].tox_event_get_group_peer_join
+    tox_event_get_group_peer_join.restype = POINTER_T(struct_Tox_Event_Group_Peer_Join)
+# tox_event_get_group_peer_join(event)
+    tox_event_get_group_peer_join.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_peer_join.__doc__ = """LP_struct_Tox_Event_Group_Peer_Join tox_event_get_group_peer_join(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Peer_Exit(Structure):
+    pass
+
+Tox_Event_Group_Peer_Exit = struct_Tox_Event_Group_Peer_Exit
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_exit_get_group_number = _libraries['FIXME_STUB'].tox_event_group_peer_exit_get_group_number
+    tox_event_group_peer_exit_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_peer_exit_get_group_number(group_peer_exit)
+    tox_event_group_peer_exit_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Exit)]
+except AttributeError:
+    pass
+tox_event_group_peer_exit_get_group_number.__doc__ = """c_uint32 tox_event_group_peer_exit_get_group_number(LP_struct_Tox_Event_Group_Peer_Exit group_peer_exit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_exit_get_peer_id = _libraries['FIXME_STUB'].tox_event_group_peer_exit_get_peer_id
+    tox_event_group_peer_exit_get_peer_id.restype = ctypes.c_uint32
+# tox_event_group_peer_exit_get_peer_id(group_peer_exit)
+    tox_event_group_peer_exit_get_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Exit)]
+except AttributeError:
+    pass
+tox_event_group_peer_exit_get_peer_id.__doc__ = """c_uint32 tox_event_group_peer_exit_get_peer_id(LP_struct_Tox_Event_Group_Peer_Exit group_peer_exit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_exit_get_exit_type = _libraries['FIXME_STUB'].tox_event_group_peer_exit_get_exit_type
+    tox_event_group_peer_exit_get_exit_type.restype = Tox_Group_Exit_Type
+# tox_event_group_peer_exit_get_exit_type(group_peer_exit)
+    tox_event_group_peer_exit_get_exit_type.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Exit)]
+except AttributeError:
+    pass
+tox_event_group_peer_exit_get_exit_type.__doc__ = """Tox_Group_Exit_Type tox_event_group_peer_exit_get_exit_type(LP_struct_Tox_Event_Group_Peer_Exit group_peer_exit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_exit_get_name = _libraries['FIXME_STUB'].tox_event_group_peer_exit_get_name
+    tox_event_group_peer_exit_get_name.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_peer_exit_get_name(group_peer_exit)
+    tox_event_group_peer_exit_get_name.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Exit)]
+except AttributeError:
+    pass
+tox_event_group_peer_exit_get_name.__doc__ = """LP_c_ubyte tox_event_group_peer_exit_get_name(LP_struct_Tox_Event_Group_Peer_Exit group_peer_exit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_exit_get_name_length = _libraries['FIXME_STUB'].tox_event_group_peer_exit_get_name_length
+    tox_event_group_peer_exit_get_name_length.restype = ctypes.c_uint32
+# tox_event_group_peer_exit_get_name_length(group_peer_exit)
+    tox_event_group_peer_exit_get_name_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Exit)]
+except AttributeError:
+    pass
+tox_event_group_peer_exit_get_name_length.__doc__ = """c_uint32 tox_event_group_peer_exit_get_name_length(LP_struct_Tox_Event_Group_Peer_Exit group_peer_exit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_exit_get_part_message = _libraries['FIXME_STUB'].tox_event_group_peer_exit_get_part_message
+    tox_event_group_peer_exit_get_part_message.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_group_peer_exit_get_part_message(group_peer_exit)
+    tox_event_group_peer_exit_get_part_message.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Exit)]
+except AttributeError:
+    pass
+tox_event_group_peer_exit_get_part_message.__doc__ = """LP_c_ubyte tox_event_group_peer_exit_get_part_message(LP_struct_Tox_Event_Group_Peer_Exit group_peer_exit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_peer_exit_get_part_message_length = _libraries['FIXME_STUB'].tox_event_group_peer_exit_get_part_message_length
+    tox_event_group_peer_exit_get_part_message_length.restype = ctypes.c_uint32
+# tox_event_group_peer_exit_get_part_message_length(group_peer_exit)
+    tox_event_group_peer_exit_get_part_message_length.argtypes = [POINTER_T(struct_Tox_Event_Group_Peer_Exit)]
+except AttributeError:
+    pass
+tox_event_group_peer_exit_get_part_message_length.__doc__ = """c_uint32 tox_event_group_peer_exit_get_part_message_length(LP_struct_Tox_Event_Group_Peer_Exit group_peer_exit)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_peer_exit = _libraries['FIXME_STUB'].tox_event_get_group_peer_exit
+    tox_event_get_group_peer_exit.restype = POINTER_T(struct_Tox_Event_Group_Peer_Exit)
+# tox_event_get_group_peer_exit(event)
+    tox_event_get_group_peer_exit.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_peer_exit.__doc__ = """LP_struct_Tox_Event_Group_Peer_Exit tox_event_get_group_peer_exit(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Self_Join(Structure):
+    pass
+
+Tox_Event_Group_Self_Join = struct_Tox_Event_Group_Self_Join
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_self_join_get_group_number = _libraries['FIXME_STUB'].tox_event_group_self_join_get_group_number
+    tox_event_group_self_join_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_self_join_get_group_number(group_self_join)
+    tox_event_group_self_join_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Self_Join)]
+except AttributeError:
+    pass
+tox_event_group_self_join_get_group_number.__doc__ = """c_uint32 tox_event_group_self_join_get_group_number(LP_struct_Tox_Event_Group_Self_Join group_self_join)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_self_join = _libraries['FIXME_STUB'].tox_event_get_group_self_join
+    tox_event_get_group_self_join.restype = POINTER_T(struct_Tox_Event_Group_Self_Join)
+# tox_event_get_group_self_join(event)
+    tox_event_get_group_self_join.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_self_join.__doc__ = """LP_struct_Tox_Event_Group_Self_Join tox_event_get_group_self_join(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Join_Fail(Structure):
+    pass
+
+Tox_Event_Group_Join_Fail = struct_Tox_Event_Group_Join_Fail
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_join_fail_get_group_number = _libraries['FIXME_STUB'].tox_event_group_join_fail_get_group_number
+    tox_event_group_join_fail_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_join_fail_get_group_number(group_join_fail)
+    tox_event_group_join_fail_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Join_Fail)]
+except AttributeError:
+    pass
+tox_event_group_join_fail_get_group_number.__doc__ = """c_uint32 tox_event_group_join_fail_get_group_number(LP_struct_Tox_Event_Group_Join_Fail group_join_fail)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_join_fail_get_fail_type = _libraries['FIXME_STUB'].tox_event_group_join_fail_get_fail_type
+    tox_event_group_join_fail_get_fail_type.restype = Tox_Group_Join_Fail
+# tox_event_group_join_fail_get_fail_type(group_join_fail)
+    tox_event_group_join_fail_get_fail_type.argtypes = [POINTER_T(struct_Tox_Event_Group_Join_Fail)]
+except AttributeError:
+    pass
+tox_event_group_join_fail_get_fail_type.__doc__ = """Tox_Group_Join_Fail tox_event_group_join_fail_get_fail_type(LP_struct_Tox_Event_Group_Join_Fail group_join_fail)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_join_fail = _libraries['FIXME_STUB'].tox_event_get_group_join_fail
+    tox_event_get_group_join_fail.restype = POINTER_T(struct_Tox_Event_Group_Join_Fail)
+# tox_event_get_group_join_fail(event)
+    tox_event_get_group_join_fail.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_join_fail.__doc__ = """LP_struct_Tox_Event_Group_Join_Fail tox_event_get_group_join_fail(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Group_Moderation(Structure):
+    pass
+
+Tox_Event_Group_Moderation = struct_Tox_Event_Group_Moderation
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_moderation_get_group_number = _libraries['FIXME_STUB'].tox_event_group_moderation_get_group_number
+    tox_event_group_moderation_get_group_number.restype = ctypes.c_uint32
+# tox_event_group_moderation_get_group_number(group_moderation)
+    tox_event_group_moderation_get_group_number.argtypes = [POINTER_T(struct_Tox_Event_Group_Moderation)]
+except AttributeError:
+    pass
+tox_event_group_moderation_get_group_number.__doc__ = """c_uint32 tox_event_group_moderation_get_group_number(LP_struct_Tox_Event_Group_Moderation group_moderation)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_moderation_get_source_peer_id = _libraries['FIXME_STUB'].tox_event_group_moderation_get_source_peer_id
+    tox_event_group_moderation_get_source_peer_id.restype = ctypes.c_uint32
+# tox_event_group_moderation_get_source_peer_id(group_moderation)
+    tox_event_group_moderation_get_source_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Moderation)]
+except AttributeError:
+    pass
+tox_event_group_moderation_get_source_peer_id.__doc__ = """c_uint32 tox_event_group_moderation_get_source_peer_id(LP_struct_Tox_Event_Group_Moderation group_moderation)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_moderation_get_target_peer_id = _libraries['FIXME_STUB'].tox_event_group_moderation_get_target_peer_id
+    tox_event_group_moderation_get_target_peer_id.restype = ctypes.c_uint32
+# tox_event_group_moderation_get_target_peer_id(group_moderation)
+    tox_event_group_moderation_get_target_peer_id.argtypes = [POINTER_T(struct_Tox_Event_Group_Moderation)]
+except AttributeError:
+    pass
+tox_event_group_moderation_get_target_peer_id.__doc__ = """c_uint32 tox_event_group_moderation_get_target_peer_id(LP_struct_Tox_Event_Group_Moderation group_moderation)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_group_moderation_get_mod_type = _libraries['FIXME_STUB'].tox_event_group_moderation_get_mod_type
+    tox_event_group_moderation_get_mod_type.restype = Tox_Group_Mod_Event
+# tox_event_group_moderation_get_mod_type(group_moderation)
+    tox_event_group_moderation_get_mod_type.argtypes = [POINTER_T(struct_Tox_Event_Group_Moderation)]
+except AttributeError:
+    pass
+tox_event_group_moderation_get_mod_type.__doc__ = """Tox_Group_Mod_Event tox_event_group_moderation_get_mod_type(LP_struct_Tox_Event_Group_Moderation group_moderation)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_group_moderation = _libraries['FIXME_STUB'].tox_event_get_group_moderation
+    tox_event_get_group_moderation.restype = POINTER_T(struct_Tox_Event_Group_Moderation)
+# tox_event_get_group_moderation(event)
+    tox_event_get_group_moderation.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_group_moderation.__doc__ = """LP_struct_Tox_Event_Group_Moderation tox_event_get_group_moderation(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+class struct_Tox_Event_Dht_Nodes_Response(Structure):
+    pass
+
+Tox_Event_Dht_Nodes_Response = struct_Tox_Event_Dht_Nodes_Response
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_dht_nodes_response_get_public_key = _libraries['FIXME_STUB'].tox_event_dht_nodes_response_get_public_key
+    tox_event_dht_nodes_response_get_public_key.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_dht_nodes_response_get_public_key(dht_nodes_response)
+    tox_event_dht_nodes_response_get_public_key.argtypes = [POINTER_T(struct_Tox_Event_Dht_Nodes_Response)]
+except AttributeError:
+    pass
+tox_event_dht_nodes_response_get_public_key.__doc__ = """LP_c_ubyte tox_event_dht_nodes_response_get_public_key(LP_struct_Tox_Event_Dht_Nodes_Response dht_nodes_response)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_dht_nodes_response_get_ip = _libraries['FIXME_STUB'].tox_event_dht_nodes_response_get_ip
+    tox_event_dht_nodes_response_get_ip.restype = POINTER_T(ctypes.c_ubyte)
+# tox_event_dht_nodes_response_get_ip(dht_nodes_response)
+    tox_event_dht_nodes_response_get_ip.argtypes = [POINTER_T(struct_Tox_Event_Dht_Nodes_Response)]
+except AttributeError:
+    pass
+tox_event_dht_nodes_response_get_ip.__doc__ = """LP_c_ubyte tox_event_dht_nodes_response_get_ip(LP_struct_Tox_Event_Dht_Nodes_Response dht_nodes_response)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_dht_nodes_response_get_ip_length = _libraries['FIXME_STUB'].tox_event_dht_nodes_response_get_ip_length
+    tox_event_dht_nodes_response_get_ip_length.restype = ctypes.c_uint32
+# tox_event_dht_nodes_response_get_ip_length(dht_nodes_response)
+    tox_event_dht_nodes_response_get_ip_length.argtypes = [POINTER_T(struct_Tox_Event_Dht_Nodes_Response)]
+except AttributeError:
+    pass
+tox_event_dht_nodes_response_get_ip_length.__doc__ = """c_uint32 tox_event_dht_nodes_response_get_ip_length(LP_struct_Tox_Event_Dht_Nodes_Response dht_nodes_response)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_dht_nodes_response_get_port = _libraries['FIXME_STUB'].tox_event_dht_nodes_response_get_port
+    tox_event_dht_nodes_response_get_port.restype = ctypes.c_uint16
+# tox_event_dht_nodes_response_get_port(dht_nodes_response)
+    tox_event_dht_nodes_response_get_port.argtypes = [POINTER_T(struct_Tox_Event_Dht_Nodes_Response)]
+except AttributeError:
+    pass
+tox_event_dht_nodes_response_get_port.__doc__ = """c_uint16 tox_event_dht_nodes_response_get_port(LP_struct_Tox_Event_Dht_Nodes_Response dht_nodes_response)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_event_get_dht_nodes_response = _libraries['FIXME_STUB'].tox_event_get_dht_nodes_response
+    tox_event_get_dht_nodes_response.restype = POINTER_T(struct_Tox_Event_Dht_Nodes_Response)
+# tox_event_get_dht_nodes_response(event)
+    tox_event_get_dht_nodes_response.argtypes = [POINTER_T(struct_Tox_Event)]
+except AttributeError:
+    pass
+tox_event_get_dht_nodes_response.__doc__ = """LP_struct_Tox_Event_Dht_Nodes_Response tox_event_get_dht_nodes_response(LP_struct_Tox_Event event)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+
+# values for enumeration 'Tox_Err_Events_Iterate'
+Tox_Err_Events_Iterate__enumvalues = {
+    0: 'TOX_ERR_EVENTS_ITERATE_OK',
+    1: 'TOX_ERR_EVENTS_ITERATE_MALLOC',
+    2: 'TOX_ERR_EVENTS_ITERATE_SEND_FAILED',
+}
+TOX_ERR_EVENTS_ITERATE_OK = 0
+TOX_ERR_EVENTS_ITERATE_MALLOC = 1
+TOX_ERR_EVENTS_ITERATE_SEND_FAILED = 2
+Tox_Err_Events_Iterate = ctypes.c_uint32 # enum
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_events_init = _libraries['FIXME_STUB'].tox_events_init
+    tox_events_init.restype = None
+# tox_events_init(tox)
+    tox_events_init.argtypes = [POINTER_T(struct_Tox)]
+except AttributeError:
+    pass
+tox_events_init.__doc__ = """None tox_events_init(LP_struct_Tox tox)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_events_iterate = _libraries['FIXME_STUB'].tox_events_iterate
+    tox_events_iterate.restype = POINTER_T(struct_Tox_Events)
+# tox_events_iterate(tox, fail_hard, error)
+    tox_events_iterate.argtypes = [POINTER_T(struct_Tox), ctypes.c_bool, POINTER_T(Tox_Err_Events_Iterate)]
+except AttributeError:
+    pass
+tox_events_iterate.__doc__ = """LP_struct_Tox_Events tox_events_iterate(LP_struct_Tox tox, c_bool fail_hard, LP_Tox_Err_Events_Iterate error)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_events_free = _libraries['FIXME_STUB'].tox_events_free
+    tox_events_free.restype = None
+# tox_events_free(events)
+    tox_events_free.argtypes = [POINTER_T(struct_Tox_Events)]
+except AttributeError:
+    pass
+tox_events_free.__doc__ = """None tox_events_free(LP_struct_Tox_Events events)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_events_bytes_size = _libraries['FIXME_STUB'].tox_events_bytes_size
+    tox_events_bytes_size.restype = ctypes.c_uint32
+# tox_events_bytes_size(events)
+    tox_events_bytes_size.argtypes = [POINTER_T(struct_Tox_Events)]
+except AttributeError:
+    pass
+tox_events_bytes_size.__doc__ = """c_uint32 tox_events_bytes_size(LP_struct_Tox_Events events)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_events_get_bytes = _libraries['FIXME_STUB'].tox_events_get_bytes
+    tox_events_get_bytes.restype = ctypes.c_bool
+# tox_events_get_bytes(events, bytes)
+    tox_events_get_bytes.argtypes = [POINTER_T(struct_Tox_Events), POINTER_T(ctypes.c_ubyte)]
+except AttributeError:
+    pass
+tox_events_get_bytes.__doc__ = """c_bool tox_events_get_bytes(LP_struct_Tox_Events events, LP_c_ubyte bytes)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_events.h
+try:
+    tox_events_equal = _libraries['FIXME_STUB'].tox_events_equal
+    tox_events_equal.restype = ctypes.c_bool
+# tox_events_equal(sys, a, b)
+    tox_events_equal.argtypes = [POINTER_T(None), POINTER_T(struct_Tox_Events), POINTER_T(struct_Tox_Events)]
+except AttributeError:
+    pass
+tox_events_equal.__doc__ = """c_bool tox_events_equal(LP_None sys, LP_struct_Tox_Events a, LP_struct_Tox_Events b)
+    c-toxcore/toxcore/tox_events.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+class struct_Tox_Dispatch(Structure):
+    pass
+
+Tox_Dispatch = struct_Tox_Dispatch
+# c-toxcore/toxcore/tox_dispatch.h
+
+# values for enumeration 'Tox_Err_Dispatch_New'
+Tox_Err_Dispatch_New__enumvalues = {
+    0: 'TOX_ERR_DISPATCH_NEW_OK',
+    1: 'TOX_ERR_DISPATCH_NEW_MALLOC',
+}
+TOX_ERR_DISPATCH_NEW_OK = 0
+TOX_ERR_DISPATCH_NEW_MALLOC = 1
+Tox_Err_Dispatch_New = ctypes.c_uint32 # enum
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_dispatch_new = _libraries['FIXME_STUB'].tox_dispatch_new
+    tox_dispatch_new.restype = POINTER_T(struct_Tox_Dispatch)
+# tox_dispatch_new(error)
+    tox_dispatch_new.argtypes = [POINTER_T(Tox_Err_Dispatch_New)]
+except AttributeError:
+    pass
+tox_dispatch_new.__doc__ = """LP_struct_Tox_Dispatch tox_dispatch_new(LP_Tox_Err_Dispatch_New error)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_dispatch_free = _libraries['FIXME_STUB'].tox_dispatch_free
+    tox_dispatch_free.restype = None
+# tox_dispatch_free(dispatch)
+    tox_dispatch_free.argtypes = [POINTER_T(struct_Tox_Dispatch)]
+except AttributeError:
+    pass
+tox_dispatch_free.__doc__ = """None tox_dispatch_free(LP_struct_Tox_Dispatch dispatch)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_dispatch_invoke = _libraries['FIXME_STUB'].tox_dispatch_invoke
+    tox_dispatch_invoke.restype = None
+# tox_dispatch_invoke(dispatch, events, user_data)
+    tox_dispatch_invoke.argtypes = [POINTER_T(struct_Tox_Dispatch), POINTER_T(struct_Tox_Events), POINTER_T(None)]
+except AttributeError:
+    pass
+tox_dispatch_invoke.__doc__ = """None tox_dispatch_invoke(LP_struct_Tox_Dispatch dispatch, LP_struct_Tox_Events events, LP_None user_data)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_self_connection_status_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Self_Connection_Status), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_self_connection_status = _libraries['FIXME_STUB'].tox_events_callback_self_connection_status
+    tox_events_callback_self_connection_status.restype = None
+# tox_events_callback_self_connection_status(dispatch, callback)
+    tox_events_callback_self_connection_status.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Self_Connection_Status), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_self_connection_status.__doc__ = """None tox_events_callback_self_connection_status(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Self_Connection_Status), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_request_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Request), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_request = _libraries['FIXME_STUB'].tox_events_callback_friend_request
+    tox_events_callback_friend_request.restype = None
+# tox_events_callback_friend_request(dispatch, callback)
+    tox_events_callback_friend_request.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Request), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_request.__doc__ = """None tox_events_callback_friend_request(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Request), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_connection_status_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Connection_Status), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_connection_status = _libraries['FIXME_STUB'].tox_events_callback_friend_connection_status
+    tox_events_callback_friend_connection_status.restype = None
+# tox_events_callback_friend_connection_status(dispatch, callback)
+    tox_events_callback_friend_connection_status.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Connection_Status), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_connection_status.__doc__ = """None tox_events_callback_friend_connection_status(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Connection_Status), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_lossy_packet_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Lossy_Packet), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_lossy_packet = _libraries['FIXME_STUB'].tox_events_callback_friend_lossy_packet
+    tox_events_callback_friend_lossy_packet.restype = None
+# tox_events_callback_friend_lossy_packet(dispatch, callback)
+    tox_events_callback_friend_lossy_packet.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Lossy_Packet), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_lossy_packet.__doc__ = """None tox_events_callback_friend_lossy_packet(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Lossy_Packet), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_lossless_packet_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Lossless_Packet), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_lossless_packet = _libraries['FIXME_STUB'].tox_events_callback_friend_lossless_packet
+    tox_events_callback_friend_lossless_packet.restype = None
+# tox_events_callback_friend_lossless_packet(dispatch, callback)
+    tox_events_callback_friend_lossless_packet.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Lossless_Packet), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_lossless_packet.__doc__ = """None tox_events_callback_friend_lossless_packet(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Lossless_Packet), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_name_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Name), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_name = _libraries['FIXME_STUB'].tox_events_callback_friend_name
+    tox_events_callback_friend_name.restype = None
+# tox_events_callback_friend_name(dispatch, callback)
+    tox_events_callback_friend_name.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Name), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_name.__doc__ = """None tox_events_callback_friend_name(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Name), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_status_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Status), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_status = _libraries['FIXME_STUB'].tox_events_callback_friend_status
+    tox_events_callback_friend_status.restype = None
+# tox_events_callback_friend_status(dispatch, callback)
+    tox_events_callback_friend_status.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Status), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_status.__doc__ = """None tox_events_callback_friend_status(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Status), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_status_message_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Status_Message), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_status_message = _libraries['FIXME_STUB'].tox_events_callback_friend_status_message
+    tox_events_callback_friend_status_message.restype = None
+# tox_events_callback_friend_status_message(dispatch, callback)
+    tox_events_callback_friend_status_message.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Status_Message), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_status_message.__doc__ = """None tox_events_callback_friend_status_message(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Status_Message), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_message_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Message), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_message = _libraries['FIXME_STUB'].tox_events_callback_friend_message
+    tox_events_callback_friend_message.restype = None
+# tox_events_callback_friend_message(dispatch, callback)
+    tox_events_callback_friend_message.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Message), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_message.__doc__ = """None tox_events_callback_friend_message(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Message), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_read_receipt_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Read_Receipt), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_read_receipt = _libraries['FIXME_STUB'].tox_events_callback_friend_read_receipt
+    tox_events_callback_friend_read_receipt.restype = None
+# tox_events_callback_friend_read_receipt(dispatch, callback)
+    tox_events_callback_friend_read_receipt.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Read_Receipt), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_read_receipt.__doc__ = """None tox_events_callback_friend_read_receipt(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Read_Receipt), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_friend_typing_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Typing), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_friend_typing = _libraries['FIXME_STUB'].tox_events_callback_friend_typing
+    tox_events_callback_friend_typing.restype = None
+# tox_events_callback_friend_typing(dispatch, callback)
+    tox_events_callback_friend_typing.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Typing), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_friend_typing.__doc__ = """None tox_events_callback_friend_typing(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Friend_Typing), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_file_chunk_request_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Chunk_Request), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_file_chunk_request = _libraries['FIXME_STUB'].tox_events_callback_file_chunk_request
+    tox_events_callback_file_chunk_request.restype = None
+# tox_events_callback_file_chunk_request(dispatch, callback)
+    tox_events_callback_file_chunk_request.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Chunk_Request), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_file_chunk_request.__doc__ = """None tox_events_callback_file_chunk_request(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Chunk_Request), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_file_recv_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_file_recv = _libraries['FIXME_STUB'].tox_events_callback_file_recv
+    tox_events_callback_file_recv.restype = None
+# tox_events_callback_file_recv(dispatch, callback)
+    tox_events_callback_file_recv.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_file_recv.__doc__ = """None tox_events_callback_file_recv(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_file_recv_chunk_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv_Chunk), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_file_recv_chunk = _libraries['FIXME_STUB'].tox_events_callback_file_recv_chunk
+    tox_events_callback_file_recv_chunk.restype = None
+# tox_events_callback_file_recv_chunk(dispatch, callback)
+    tox_events_callback_file_recv_chunk.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv_Chunk), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_file_recv_chunk.__doc__ = """None tox_events_callback_file_recv_chunk(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv_Chunk), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_file_recv_control_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv_Control), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_file_recv_control = _libraries['FIXME_STUB'].tox_events_callback_file_recv_control
+    tox_events_callback_file_recv_control.restype = None
+# tox_events_callback_file_recv_control(dispatch, callback)
+    tox_events_callback_file_recv_control.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv_Control), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_file_recv_control.__doc__ = """None tox_events_callback_file_recv_control(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_File_Recv_Control), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_conference_invite_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Invite), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_conference_invite = _libraries['FIXME_STUB'].tox_events_callback_conference_invite
+    tox_events_callback_conference_invite.restype = None
+# tox_events_callback_conference_invite(dispatch, callback)
+    tox_events_callback_conference_invite.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Invite), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_conference_invite.__doc__ = """None tox_events_callback_conference_invite(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Invite), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_conference_connected_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Connected), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_conference_connected = _libraries['FIXME_STUB'].tox_events_callback_conference_connected
+    tox_events_callback_conference_connected.restype = None
+# tox_events_callback_conference_connected(dispatch, callback)
+    tox_events_callback_conference_connected.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Connected), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_conference_connected.__doc__ = """None tox_events_callback_conference_connected(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Connected), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_conference_peer_list_changed_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Peer_List_Changed), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_conference_peer_list_changed = _libraries['FIXME_STUB'].tox_events_callback_conference_peer_list_changed
+    tox_events_callback_conference_peer_list_changed.restype = None
+# tox_events_callback_conference_peer_list_changed(dispatch, callback)
+    tox_events_callback_conference_peer_list_changed.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Peer_List_Changed), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_conference_peer_list_changed.__doc__ = """None tox_events_callback_conference_peer_list_changed(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Peer_List_Changed), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_conference_peer_name_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Peer_Name), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_conference_peer_name = _libraries['FIXME_STUB'].tox_events_callback_conference_peer_name
+    tox_events_callback_conference_peer_name.restype = None
+# tox_events_callback_conference_peer_name(dispatch, callback)
+    tox_events_callback_conference_peer_name.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Peer_Name), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_conference_peer_name.__doc__ = """None tox_events_callback_conference_peer_name(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Peer_Name), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_conference_title_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Title), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_conference_title = _libraries['FIXME_STUB'].tox_events_callback_conference_title
+    tox_events_callback_conference_title.restype = None
+# tox_events_callback_conference_title(dispatch, callback)
+    tox_events_callback_conference_title.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Title), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_conference_title.__doc__ = """None tox_events_callback_conference_title(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Title), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_conference_message_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Message), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_conference_message = _libraries['FIXME_STUB'].tox_events_callback_conference_message
+    tox_events_callback_conference_message.restype = None
+# tox_events_callback_conference_message(dispatch, callback)
+    tox_events_callback_conference_message.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Message), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_conference_message.__doc__ = """None tox_events_callback_conference_message(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Conference_Message), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_peer_name_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Name), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_peer_name = _libraries['FIXME_STUB'].tox_events_callback_group_peer_name
+    tox_events_callback_group_peer_name.restype = None
+# tox_events_callback_group_peer_name(dispatch, callback)
+    tox_events_callback_group_peer_name.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Name), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_peer_name.__doc__ = """None tox_events_callback_group_peer_name(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Name), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_peer_status_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Status), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_peer_status = _libraries['FIXME_STUB'].tox_events_callback_group_peer_status
+    tox_events_callback_group_peer_status.restype = None
+# tox_events_callback_group_peer_status(dispatch, callback)
+    tox_events_callback_group_peer_status.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Status), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_peer_status.__doc__ = """None tox_events_callback_group_peer_status(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Status), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_topic_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Topic), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_topic = _libraries['FIXME_STUB'].tox_events_callback_group_topic
+    tox_events_callback_group_topic.restype = None
+# tox_events_callback_group_topic(dispatch, callback)
+    tox_events_callback_group_topic.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Topic), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_topic.__doc__ = """None tox_events_callback_group_topic(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Topic), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_privacy_state_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Privacy_State), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_privacy_state = _libraries['FIXME_STUB'].tox_events_callback_group_privacy_state
+    tox_events_callback_group_privacy_state.restype = None
+# tox_events_callback_group_privacy_state(dispatch, callback)
+    tox_events_callback_group_privacy_state.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Privacy_State), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_privacy_state.__doc__ = """None tox_events_callback_group_privacy_state(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Privacy_State), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_voice_state_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Voice_State), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_voice_state = _libraries['FIXME_STUB'].tox_events_callback_group_voice_state
+    tox_events_callback_group_voice_state.restype = None
+# tox_events_callback_group_voice_state(dispatch, callback)
+    tox_events_callback_group_voice_state.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Voice_State), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_voice_state.__doc__ = """None tox_events_callback_group_voice_state(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Voice_State), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_topic_lock_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Topic_Lock), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_topic_lock = _libraries['FIXME_STUB'].tox_events_callback_group_topic_lock
+    tox_events_callback_group_topic_lock.restype = None
+# tox_events_callback_group_topic_lock(dispatch, callback)
+    tox_events_callback_group_topic_lock.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Topic_Lock), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_topic_lock.__doc__ = """None tox_events_callback_group_topic_lock(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Topic_Lock), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_peer_limit_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Limit), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_peer_limit = _libraries['FIXME_STUB'].tox_events_callback_group_peer_limit
+    tox_events_callback_group_peer_limit.restype = None
+# tox_events_callback_group_peer_limit(dispatch, callback)
+    tox_events_callback_group_peer_limit.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Limit), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_peer_limit.__doc__ = """None tox_events_callback_group_peer_limit(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Limit), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_password_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Password), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_password = _libraries['FIXME_STUB'].tox_events_callback_group_password
+    tox_events_callback_group_password.restype = None
+# tox_events_callback_group_password(dispatch, callback)
+    tox_events_callback_group_password.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Password), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_password.__doc__ = """None tox_events_callback_group_password(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Password), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_message_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Message), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_message = _libraries['FIXME_STUB'].tox_events_callback_group_message
+    tox_events_callback_group_message.restype = None
+# tox_events_callback_group_message(dispatch, callback)
+    tox_events_callback_group_message.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Message), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_message.__doc__ = """None tox_events_callback_group_message(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Message), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_private_message_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Private_Message), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_private_message = _libraries['FIXME_STUB'].tox_events_callback_group_private_message
+    tox_events_callback_group_private_message.restype = None
+# tox_events_callback_group_private_message(dispatch, callback)
+    tox_events_callback_group_private_message.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Private_Message), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_private_message.__doc__ = """None tox_events_callback_group_private_message(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Private_Message), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_custom_packet_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Custom_Packet), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_custom_packet = _libraries['FIXME_STUB'].tox_events_callback_group_custom_packet
+    tox_events_callback_group_custom_packet.restype = None
+# tox_events_callback_group_custom_packet(dispatch, callback)
+    tox_events_callback_group_custom_packet.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Custom_Packet), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_custom_packet.__doc__ = """None tox_events_callback_group_custom_packet(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Custom_Packet), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_custom_private_packet_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Custom_Private_Packet), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_custom_private_packet = _libraries['FIXME_STUB'].tox_events_callback_group_custom_private_packet
+    tox_events_callback_group_custom_private_packet.restype = None
+# tox_events_callback_group_custom_private_packet(dispatch, callback)
+    tox_events_callback_group_custom_private_packet.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Custom_Private_Packet), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_custom_private_packet.__doc__ = """None tox_events_callback_group_custom_private_packet(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Custom_Private_Packet), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_invite_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Invite), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_invite = _libraries['FIXME_STUB'].tox_events_callback_group_invite
+    tox_events_callback_group_invite.restype = None
+# tox_events_callback_group_invite(dispatch, callback)
+    tox_events_callback_group_invite.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Invite), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_invite.__doc__ = """None tox_events_callback_group_invite(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Invite), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_peer_join_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Join), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_peer_join = _libraries['FIXME_STUB'].tox_events_callback_group_peer_join
+    tox_events_callback_group_peer_join.restype = None
+# tox_events_callback_group_peer_join(dispatch, callback)
+    tox_events_callback_group_peer_join.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Join), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_peer_join.__doc__ = """None tox_events_callback_group_peer_join(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Join), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_peer_exit_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Exit), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_peer_exit = _libraries['FIXME_STUB'].tox_events_callback_group_peer_exit
+    tox_events_callback_group_peer_exit.restype = None
+# tox_events_callback_group_peer_exit(dispatch, callback)
+    tox_events_callback_group_peer_exit.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Exit), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_peer_exit.__doc__ = """None tox_events_callback_group_peer_exit(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Peer_Exit), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_self_join_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Self_Join), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_self_join = _libraries['FIXME_STUB'].tox_events_callback_group_self_join
+    tox_events_callback_group_self_join.restype = None
+# tox_events_callback_group_self_join(dispatch, callback)
+    tox_events_callback_group_self_join.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Self_Join), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_self_join.__doc__ = """None tox_events_callback_group_self_join(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Self_Join), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_join_fail_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Join_Fail), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_join_fail = _libraries['FIXME_STUB'].tox_events_callback_group_join_fail
+    tox_events_callback_group_join_fail.restype = None
+# tox_events_callback_group_join_fail(dispatch, callback)
+    tox_events_callback_group_join_fail.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Join_Fail), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_join_fail.__doc__ = """None tox_events_callback_group_join_fail(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Join_Fail), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_group_moderation_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Moderation), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_group_moderation = _libraries['FIXME_STUB'].tox_events_callback_group_moderation
+    tox_events_callback_group_moderation.restype = None
+# tox_events_callback_group_moderation(dispatch, callback)
+    tox_events_callback_group_moderation.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Moderation), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_group_moderation.__doc__ = """None tox_events_callback_group_moderation(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Group_Moderation), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+# c-toxcore/toxcore/tox_dispatch.h
+tox_events_dht_nodes_response_cb = ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Dht_Nodes_Response), POINTER_T(None))
+# c-toxcore/toxcore/tox_dispatch.h
+try:
+    tox_events_callback_dht_nodes_response = _libraries['FIXME_STUB'].tox_events_callback_dht_nodes_response
+    tox_events_callback_dht_nodes_response.restype = None
+# tox_events_callback_dht_nodes_response(dispatch, callback)
+    tox_events_callback_dht_nodes_response.argtypes = [POINTER_T(struct_Tox_Dispatch), ctypes.CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Dht_Nodes_Response), POINTER_T(None))]
+except AttributeError:
+    pass
+tox_events_callback_dht_nodes_response.__doc__ = """None tox_events_callback_dht_nodes_response(LP_struct_Tox_Dispatch dispatch, CFUNCTYPE(None, POINTER_T(struct_Tox_Event_Dht_Nodes_Response), POINTER_T(None)) callback)
+    c-toxcore/toxcore/tox_dispatch.h"""
+
+# Поля событий в порядке аргументов колбэков tox_<name>_cb (без Tox * и user_data): геттеры tox_event_<name>_get_<field>
+tox_event_fields = {
+    TOX_EVENT_SELF_CONNECTION_STATUS: ('connection_status',),
+    TOX_EVENT_FRIEND_REQUEST: ('public_key', 'message', 'message_length'),
+    TOX_EVENT_FRIEND_CONNECTION_STATUS: ('friend_number', 'connection_status'),
+    TOX_EVENT_FRIEND_LOSSY_PACKET: ('friend_number', 'data', 'data_length'),
+    TOX_EVENT_FRIEND_LOSSLESS_PACKET: ('friend_number', 'data', 'data_length'),
+    TOX_EVENT_FRIEND_NAME: ('friend_number', 'name', 'name_length'),
+    TOX_EVENT_FRIEND_STATUS: ('friend_number', 'status'),
+    TOX_EVENT_FRIEND_STATUS_MESSAGE: ('friend_number', 'message', 'message_length'),
+    TOX_EVENT_FRIEND_MESSAGE: ('friend_number', 'type', 'message', 'message_length'),
+    TOX_EVENT_FRIEND_READ_RECEIPT: ('friend_number', 'message_id'),
+    TOX_EVENT_FRIEND_TYPING: ('friend_number', 'typing'),
+    TOX_EVENT_FILE_CHUNK_REQUEST: ('friend_number', 'file_number', 'position', 'length'),
+    TOX_EVENT_FILE_RECV: ('friend_number', 'file_number', 'kind', 'file_size', 'filename', 'filename_length'),
+    TOX_EVENT_FILE_RECV_CHUNK: ('friend_number', 'file_number', 'position', 'data', 'data_length'),
+    TOX_EVENT_FILE_RECV_CONTROL: ('friend_number', 'file_number', 'control'),
+    TOX_EVENT_CONFERENCE_INVITE: ('friend_number', 'type', 'cookie', 'cookie_length'),
+    TOX_EVENT_CONFERENCE_CONNECTED: ('conference_number',),
+    TOX_EVENT_CONFERENCE_PEER_LIST_CHANGED: ('conference_number',),
+    TOX_EVENT_CONFERENCE_PEER_NAME: ('conference_number', 'peer_number', 'name', 'name_length'),
+    TOX_EVENT_CONFERENCE_TITLE: ('conference_number', 'peer_number', 'title', 'title_length'),
+    TOX_EVENT_CONFERENCE_MESSAGE: ('conference_number', 'peer_number', 'type', 'message', 'message_length'),
+    TOX_EVENT_GROUP_PEER_NAME: ('group_number', 'peer_id', 'name', 'name_length'),
+    TOX_EVENT_GROUP_PEER_STATUS: ('group_number', 'peer_id', 'status'),
+    TOX_EVENT_GROUP_TOPIC: ('group_number', 'peer_id', 'topic', 'topic_length'),
+    TOX_EVENT_GROUP_PRIVACY_STATE: ('group_number', 'privacy_state'),
+    TOX_EVENT_GROUP_VOICE_STATE: ('group_number', 'voice_state'),
+    TOX_EVENT_GROUP_TOPIC_LOCK: ('group_number', 'topic_lock'),
+    TOX_EVENT_GROUP_PEER_LIMIT: ('group_number', 'peer_limit'),
+    TOX_EVENT_GROUP_PASSWORD: ('group_number', 'password', 'password_length'),
+    TOX_EVENT_GROUP_MESSAGE: ('group_number', 'peer_id', 'message_type', 'message', 'message_length', 'message_id'),
+    TOX_EVENT_GROUP_PRIVATE_MESSAGE: ('group_number', 'peer_id', 'message_type', 'message', 'message_length', 'message_id'),
+    TOX_EVENT_GROUP_CUSTOM_PACKET: ('group_number', 'peer_id', 'data', 'data_length'),
+    TOX_EVENT_GROUP_CUSTOM_PRIVATE_PACKET: ('group_number', 'peer_id', 'data', 'data_length'),
+    TOX_EVENT_GROUP_INVITE: ('friend_number', 'invite_data', 'invite_data_length', 'group_name', 'group_name_length'),
+    TOX_EVENT_GROUP_PEER_JOIN: ('group_number', 'peer_id'),
+    TOX_EVENT_GROUP_PEER_EXIT: ('group_number', 'peer_id', 'exit_type', 'name', 'name_length', 'part_message', 'part_message_length'),
+    TOX_EVENT_GROUP_SELF_JOIN: ('group_number',),
+    TOX_EVENT_GROUP_JOIN_FAIL: ('group_number', 'fail_type'),
+    TOX_EVENT_GROUP_MODERATION: ('group_number', 'source_peer_id', 'target_peer_id', 'mod_type'),
+    TOX_EVENT_DHT_NODES_RESPONSE: ('public_key', 'ip', 'ip_length', 'port'),
+}
+
+__all__ = \
+    ['TOX_ERR_DISPATCH_NEW_MALLOC', 'TOX_ERR_DISPATCH_NEW_OK',
+    'TOX_ERR_EVENTS_ITERATE_MALLOC', 'TOX_ERR_EVENTS_ITERATE_OK',
+    'TOX_ERR_EVENTS_ITERATE_SEND_FAILED',
+    'TOX_EVENT_CONFERENCE_CONNECTED', 'TOX_EVENT_CONFERENCE_INVITE',
+    'TOX_EVENT_CONFERENCE_MESSAGE',
+    'TOX_EVENT_CONFERENCE_PEER_LIST_CHANGED',
+    'TOX_EVENT_CONFERENCE_PEER_NAME', 'TOX_EVENT_CONFERENCE_TITLE',
+    'TOX_EVENT_DHT_NODES_RESPONSE', 'TOX_EVENT_FILE_CHUNK_REQUEST',
+    'TOX_EVENT_FILE_RECV', 'TOX_EVENT_FILE_RECV_CHUNK',
+    'TOX_EVENT_FILE_RECV_CONTROL',
+    'TOX_EVENT_FRIEND_CONNECTION_STATUS',
+    'TOX_EVENT_FRIEND_LOSSLESS_PACKET',
+    'TOX_EVENT_FRIEND_LOSSY_PACKET', 'TOX_EVENT_FRIEND_MESSAGE',
+    'TOX_EVENT_FRIEND_NAME', 'TOX_EVENT_FRIEND_READ_RECEIPT',
+    'TOX_EVENT_FRIEND_REQUEST', 'TOX_EVENT_FRIEND_STATUS',
+    'TOX_EVENT_FRIEND_STATUS_MESSAGE', 'TOX_EVENT_FRIEND_TYPING',
+    'TOX_EVENT_GROUP_CUSTOM_PACKET',
+    'TOX_EVENT_GROUP_CUSTOM_PRIVATE_PACKET', 'TOX_EVENT_GROUP_INVITE',
+    'TOX_EVENT_GROUP_JOIN_FAIL', 'TOX_EVENT_GROUP_MESSAGE',
+    'TOX_EVENT_GROUP_MODERATION', 'TOX_EVENT_GROUP_PASSWORD',
+    'TOX_EVENT_GROUP_PEER_EXIT', 'TOX_EVENT_GROUP_PEER_JOIN',
+    'TOX_EVENT_GROUP_PEER_LIMIT', 'TOX_EVENT_GROUP_PEER_NAME',
+    'TOX_EVENT_GROUP_PEER_STATUS', 'TOX_EVENT_GROUP_PRIVACY_STATE',
+    'TOX_EVENT_GROUP_PRIVATE_MESSAGE', 'TOX_EVENT_GROUP_SELF_JOIN',
+    'TOX_EVENT_GROUP_TOPIC', 'TOX_EVENT_GROUP_TOPIC_LOCK',
+    'TOX_EVENT_GROUP_VOICE_STATE', 'TOX_EVENT_INVALID',
+    'TOX_EVENT_SELF_CONNECTION_STATUS', 'Tox_Dispatch',
+    'Tox_Err_Dispatch_New', 'Tox_Err_Dispatch_New__enumvalues',
+    'Tox_Err_Events_Iterate', 'Tox_Err_Events_Iterate__enumvalues',
+    'Tox_Event', 'Tox_Event_Conference_Connected',
+    'Tox_Event_Conference_Invite', 'Tox_Event_Conference_Message',
+    'Tox_Event_Conference_Peer_List_Changed',
+    'Tox_Event_Conference_Peer_Name', 'Tox_Event_Conference_Title',
+    'Tox_Event_Dht_Nodes_Response', 'Tox_Event_File_Chunk_Request',
+    'Tox_Event_File_Recv', 'Tox_Event_File_Recv_Chunk',
+    'Tox_Event_File_Recv_Control',
+    'Tox_Event_Friend_Connection_Status',
+    'Tox_Event_Friend_Lossless_Packet',
+    'Tox_Event_Friend_Lossy_Packet', 'Tox_Event_Friend_Message',
+    'Tox_Event_Friend_Name', 'Tox_Event_Friend_Read_Receipt',
+    'Tox_Event_Friend_Request', 'Tox_Event_Friend_Status',
+    'Tox_Event_Friend_Status_Message', 'Tox_Event_Friend_Typing',
+    'Tox_Event_Group_Custom_Packet',
+    'Tox_Event_Group_Custom_Private_Packet', 'Tox_Event_Group_Invite',
+    'Tox_Event_Group_Join_Fail', 'Tox_Event_Group_Message',
+    'Tox_Event_Group_Moderation', 'Tox_Event_Group_Password',
+    'Tox_Event_Group_Peer_Exit', 'Tox_Event_Group_Peer_Join',
+    'Tox_Event_Group_Peer_Limit', 'Tox_Event_Group_Peer_Name',
+    'Tox_Event_Group_Peer_Status', 'Tox_Event_Group_Privacy_State',
+    'Tox_Event_Group_Private_Message', 'Tox_Event_Group_Self_Join',
+    'Tox_Event_Group_Topic', 'Tox_Event_Group_Topic_Lock',
+    'Tox_Event_Group_Voice_State', 'Tox_Event_Self_Connection_Status',
+    'Tox_Event_Type', 'Tox_Event_Type__enumvalues', 'Tox_Events',
+    'struct_Tox_Dispatch', 'struct_Tox_Event',
+    'struct_Tox_Event_Conference_Connected',
+    'struct_Tox_Event_Conference_Invite',
+    'struct_Tox_Event_Conference_Message',
+    'struct_Tox_Event_Conference_Peer_List_Changed',
+    'struct_Tox_Event_Conference_Peer_Name',
+    'struct_Tox_Event_Conference_Title',
+    'struct_Tox_Event_Dht_Nodes_Response',
+    'struct_Tox_Event_File_Chunk_Request',
+    'struct_Tox_Event_File_Recv', 'struct_Tox_Event_File_Recv_Chunk',
+    'struct_Tox_Event_File_Recv_Control',
+    'struct_Tox_Event_Friend_Connection_Status',
+    'struct_Tox_Event_Friend_Lossless_Packet',
+    'struct_Tox_Event_Friend_Lossy_Packet',
+    'struct_Tox_Event_Friend_Message', 'struct_Tox_Event_Friend_Name',
+    'struct_Tox_Event_Friend_Read_Receipt',
+    'struct_Tox_Event_Friend_Request',
+    'struct_Tox_Event_Friend_Status',
+    'struct_Tox_Event_Friend_Status_Message',
+    'struct_Tox_Event_Friend_Typing',
+    'struct_Tox_Event_Group_Custom_Packet',
+    'struct_Tox_Event_Group_Custom_Private_Packet',
+    'struct_Tox_Event_Group_Invite',
+    'struct_Tox_Event_Group_Join_Fail',
+    'struct_Tox_Event_Group_Message',
+    'struct_Tox_Event_Group_Moderation',
+    'struct_Tox_Event_Group_Password',
+    'struct_Tox_Event_Group_Peer_Exit',
+    'struct_Tox_Event_Group_Peer_Join',
+    'struct_Tox_Event_Group_Peer_Limit',
+    'struct_Tox_Event_Group_Peer_Name',
+    'struct_Tox_Event_Group_Peer_Status',
+    'struct_Tox_Event_Group_Privacy_State',
+    'struct_Tox_Event_Group_Private_Message',
+    'struct_Tox_Event_Group_Self_Join',
+    'struct_Tox_Event_Group_Topic',
+    'struct_Tox_Event_Group_Topic_Lock',
+    'struct_Tox_Event_Group_Voice_State',
+    'struct_Tox_Event_Self_Connection_Status', 'struct_Tox_Events',
+    'tox_dispatch_free', 'tox_dispatch_invoke', 'tox_dispatch_new',
+    'tox_event_conference_connected_get_conference_number',
+    'tox_event_conference_invite_get_cookie',
+    'tox_event_conference_invite_get_cookie_length',
+    'tox_event_conference_invite_get_friend_number',
+    'tox_event_conference_invite_get_type',
+    'tox_event_conference_message_get_conference_number',
+    'tox_event_conference_message_get_message',
+    'tox_event_conference_message_get_message_length',
+    'tox_event_conference_message_get_peer_number',
+    'tox_event_conference_message_get_type',
+    'tox_event_conference_peer_list_changed_get_conference_number',
+    'tox_event_conference_peer_name_get_conference_number',
+    'tox_event_conference_peer_name_get_name',
+    'tox_event_conference_peer_name_get_name_length',
+    'tox_event_conference_peer_name_get_peer_number',
+    'tox_event_conference_title_get_conference_number',
+    'tox_event_conference_title_get_peer_number',
+    'tox_event_conference_title_get_title',
+    'tox_event_conference_title_get_title_length',
+    'tox_event_dht_nodes_response_get_ip',
+    'tox_event_dht_nodes_response_get_ip_length',
+    'tox_event_dht_nodes_response_get_port',
+    'tox_event_dht_nodes_response_get_public_key', 'tox_event_fields',
+    'tox_event_file_chunk_request_get_file_number',
+    'tox_event_file_chunk_request_get_friend_number',
+    'tox_event_file_chunk_request_get_length',
+    'tox_event_file_chunk_request_get_position',
+    'tox_event_file_recv_chunk_get_data',
+    'tox_event_file_recv_chunk_get_data_length',
+    'tox_event_file_recv_chunk_get_file_number',
+    'tox_event_file_recv_chunk_get_friend_number',
+    'tox_event_file_recv_chunk_get_position',
+    'tox_event_file_recv_control_get_control',
+    'tox_event_file_recv_control_get_file_number',
+    'tox_event_file_recv_control_get_friend_number',
+    'tox_event_file_recv_get_file_number',
+    'tox_event_file_recv_get_file_size',
+    'tox_event_file_recv_get_filename',
+    'tox_event_file_recv_get_filename_length',
+    'tox_event_file_recv_get_friend_number',
+    'tox_event_file_recv_get_kind',
+    'tox_event_friend_connection_status_get_connection_status',
+    'tox_event_friend_connection_status_get_friend_number',
+    'tox_event_friend_lossless_packet_get_data',
+    'tox_event_friend_lossless_packet_get_data_length',
+    'tox_event_friend_lossless_packet_get_friend_number',
+    'tox_event_friend_lossy_packet_get_data',
+    'tox_event_friend_lossy_packet_get_data_length',
+    'tox_event_friend_lossy_packet_get_friend_number',
+    'tox_event_friend_message_get_friend_number',
+    'tox_event_friend_message_get_message',
+    'tox_event_friend_message_get_message_length',
+    'tox_event_friend_message_get_type',
+    'tox_event_friend_name_get_friend_number',
+    'tox_event_friend_name_get_name',
+    'tox_event_friend_name_get_name_length',
+    'tox_event_friend_read_receipt_get_friend_number',
+    'tox_event_friend_read_receipt_get_message_id',
+    'tox_event_friend_request_get_message',
+    'tox_event_friend_request_get_message_length',
+    'tox_event_friend_request_get_public_key',
+    'tox_event_friend_status_get_friend_number',
+    'tox_event_friend_status_get_status',
+    'tox_event_friend_status_message_get_friend_number',
+    'tox_event_friend_status_message_get_message',
+    'tox_event_friend_status_message_get_message_length',
+    'tox_event_friend_typing_get_friend_number',
+    'tox_event_friend_typing_get_typing',
+    'tox_event_get_conference_connected',
+    'tox_event_get_conference_invite',
+    'tox_event_get_conference_message',
+    'tox_event_get_conference_peer_list_changed',
+    'tox_event_get_conference_peer_name',
+    'tox_event_get_conference_title',
+    'tox_event_get_dht_nodes_response',
+    'tox_event_get_file_chunk_request', 'tox_event_get_file_recv',
+    'tox_event_get_file_recv_chunk',
+    'tox_event_get_file_recv_control',
+    'tox_event_get_friend_connection_status',
+    'tox_event_get_friend_lossless_packet',
+    'tox_event_get_friend_lossy_packet',
+    'tox_event_get_friend_message', 'tox_event_get_friend_name',
+    'tox_event_get_friend_read_receipt',
+    'tox_event_get_friend_request', 'tox_event_get_friend_status',
+    'tox_event_get_friend_status_message',
+    'tox_event_get_friend_typing',
+    'tox_event_get_group_custom_packet',
+    'tox_event_get_group_custom_private_packet',
+    'tox_event_get_group_invite', 'tox_event_get_group_join_fail',
+    'tox_event_get_group_message', 'tox_event_get_group_moderation',
+    'tox_event_get_group_password', 'tox_event_get_group_peer_exit',
+    'tox_event_get_group_peer_join', 'tox_event_get_group_peer_limit',
+    'tox_event_get_group_peer_name',
+    'tox_event_get_group_peer_status',
+    'tox_event_get_group_privacy_state',
+    'tox_event_get_group_private_message',
+    'tox_event_get_group_self_join', 'tox_event_get_group_topic',
+    'tox_event_get_group_topic_lock',
+    'tox_event_get_group_voice_state',
+    'tox_event_get_self_connection_status', 'tox_event_get_type',
+    'tox_event_group_custom_packet_get_data',
+    'tox_event_group_custom_packet_get_data_length',
+    'tox_event_group_custom_packet_get_group_number',
+    'tox_event_group_custom_packet_get_peer_id',
+    'tox_event_group_custom_private_packet_get_data',
+    'tox_event_group_custom_private_packet_get_data_length',
+    'tox_event_group_custom_private_packet_get_group_number',
+    'tox_event_group_custom_private_packet_get_peer_id',
+    'tox_event_group_invite_get_friend_number',
+    'tox_event_group_invite_get_group_name',
+    'tox_event_group_invite_get_group_name_length',
+    'tox_event_group_invite_get_invite_data',
+    'tox_event_group_invite_get_invite_data_length',
+    'tox_event_group_join_fail_get_fail_type',
+    'tox_event_group_join_fail_get_group_number',
+    'tox_event_group_message_get_group_number',
+    'tox_event_group_message_get_message',
+    'tox_event_group_message_get_message_id',
+    'tox_event_group_message_get_message_length',
+    'tox_event_group_message_get_message_type',
+    'tox_event_group_message_get_peer_id',
+    'tox_event_group_moderation_get_group_number',
+    'tox_event_group_moderation_get_mod_type',
+    'tox_event_group_moderation_get_source_peer_id',
+    'tox_event_group_moderation_get_target_peer_id',
+    'tox_event_group_password_get_group_number',
+    'tox_event_group_password_get_password',
+    'tox_event_group_password_get_password_length',
+    'tox_event_group_peer_exit_get_exit_type',
+    'tox_event_group_peer_exit_get_group_number',
+    'tox_event_group_peer_exit_get_name',
+    'tox_event_group_peer_exit_get_name_length',
+    'tox_event_group_peer_exit_get_part_message',
+    'tox_event_group_peer_exit_get_part_message_length',
+    'tox_event_group_peer_exit_get_peer_id',
+    'tox_event_group_peer_join_get_group_number',
+    'tox_event_group_peer_join_get_peer_id',
+    'tox_event_group_peer_limit_get_group_number',
+    'tox_event_group_peer_limit_get_peer_limit',
+    'tox_event_group_peer_name_get_group_number',
+    'tox_event_group_peer_name_get_name',
+    'tox_event_group_peer_name_get_name_length',
+    'tox_event_group_peer_name_get_peer_id',
+    'tox_event_group_peer_status_get_group_number',
+    'tox_event_group_peer_status_get_peer_id',
+    'tox_event_group_peer_status_get_status',
+    'tox_event_group_privacy_state_get_group_number',
+    'tox_event_group_privacy_state_get_privacy_state',
+    'tox_event_group_private_message_get_group_number',
+    'tox_event_group_private_message_get_message',
+    'tox_event_group_private_message_get_message_id',
+    'tox_event_group_private_message_get_message_length',
+    'tox_event_group_private_message_get_message_type',
+    'tox_event_group_private_message_get_peer_id',
+    'tox_event_group_self_join_get_group_number',
+    'tox_event_group_topic_get_group_number',
+    'tox_event_group_topic_get_peer_id',
+    'tox_event_group_topic_get_topic',
+    'tox_event_group_topic_get_topic_length',
+    'tox_event_group_topic_lock_get_group_number',
+    'tox_event_group_topic_lock_get_topic_lock',
+    'tox_event_group_voice_state_get_group_number',
+    'tox_event_group_voice_state_get_voice_state',
+    'tox_event_self_connection_status_get_connection_status',
+    'tox_event_type_to_string', 'tox_events_bytes_size',
+    'tox_events_callback_conference_connected',
+    'tox_events_callback_conference_invite',
+    'tox_events_callback_conference_message',
+    'tox_events_callback_conference_peer_list_changed',
+    'tox_events_callback_conference_peer_name',
+    'tox_events_callback_conference_title',
+    'tox_events_callback_dht_nodes_response',
+    'tox_events_callback_file_chunk_request',
+    'tox_events_callback_file_recv',
+    'tox_events_callback_file_recv_chunk',
+    'tox_events_callback_file_recv_control',
+    'tox_events_callback_friend_connection_status',
+    'tox_events_callback_friend_lossless_packet',
+    'tox_events_callback_friend_lossy_packet',
+    'tox_events_callback_friend_message',
+    'tox_events_callback_friend_name',
+    'tox_events_callback_friend_read_receipt',
+    'tox_events_callback_friend_request',
+    'tox_events_callback_friend_status',
+    'tox_events_callback_friend_status_message',
+    'tox_events_callback_friend_typing',
+    'tox_events_callback_group_custom_packet',
+    'tox_events_callback_group_custom_private_packet',
+    'tox_events_callback_group_invite',
+    'tox_events_callback_group_join_fail',
+    'tox_events_callback_group_message',
+    'tox_events_callback_group_moderation',
+    'tox_events_callback_group_password',
+    'tox_events_callback_group_peer_exit',
+    'tox_events_callback_group_peer_join',
+    'tox_events_callback_group_peer_limit',
+    'tox_events_callback_group_peer_name',
+    'tox_events_callback_group_peer_status',
+    'tox_events_callback_group_privacy_state',
+    'tox_events_callback_group_private_message',
+    'tox_events_callback_group_self_join',
+    'tox_events_callback_group_topic',
+    'tox_events_callback_group_topic_lock',
+    'tox_events_callback_group_voice_state',
+    'tox_events_callback_self_connection_status',
+    'tox_events_conference_connected_cb',
+    'tox_events_conference_invite_cb',
+    'tox_events_conference_message_cb',
+    'tox_events_conference_peer_list_changed_cb',
+    'tox_events_conference_peer_name_cb',
+    'tox_events_conference_title_cb',
+    'tox_events_dht_nodes_response_cb', 'tox_events_equal',
+    'tox_events_file_chunk_request_cb', 'tox_events_file_recv_cb',
+    'tox_events_file_recv_chunk_cb',
+    'tox_events_file_recv_control_cb', 'tox_events_free',
+    'tox_events_friend_connection_status_cb',
+    'tox_events_friend_lossless_packet_cb',
+    'tox_events_friend_lossy_packet_cb',
+    'tox_events_friend_message_cb', 'tox_events_friend_name_cb',
+    'tox_events_friend_read_receipt_cb',
+    'tox_events_friend_request_cb', 'tox_events_friend_status_cb',
+    'tox_events_friend_status_message_cb',
+    'tox_events_friend_typing_cb', 'tox_events_get',
+    'tox_events_get_bytes', 'tox_events_get_size',
+    'tox_events_group_custom_packet_cb',
+    'tox_events_group_custom_private_packet_cb',
+    'tox_events_group_invite_cb', 'tox_events_group_join_fail_cb',
+    'tox_events_group_message_cb', 'tox_events_group_moderation_cb',
+    'tox_events_group_password_cb', 'tox_events_group_peer_exit_cb',
+    'tox_events_group_peer_join_cb', 'tox_events_group_peer_limit_cb',
+    'tox_events_group_peer_name_cb',
+    'tox_events_group_peer_status_cb',
+    'tox_events_group_privacy_state_cb',
+    'tox_events_group_private_message_cb',
+    'tox_events_group_self_join_cb', 'tox_events_group_topic_cb',
+    'tox_events_group_topic_lock_cb',
+    'tox_events_group_voice_state_cb', 'tox_events_init',
+    'tox_events_iterate', 'tox_events_self_connection_status_cb']